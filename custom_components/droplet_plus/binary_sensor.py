@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Hashable
+
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DropletConfigEntry
-from .const import DOMAIN, KEY_WATER_LEAK
+from .const import KEY_WATER_LEAK
 from .coordinator import DropletCoordinator
+from .entity import DropletEntity
 
 PARALLEL_UPDATES = 0
 
@@ -25,10 +26,9 @@ async def async_setup_entry(
     async_add_entities([DropletLeakSensor(coordinator)])
 
 
-class DropletLeakSensor(CoordinatorEntity[DropletCoordinator], BinarySensorEntity):
+class DropletLeakSensor(DropletEntity, BinarySensorEntity):
     """Representation of the Droplet water leak binary sensor."""
 
-    _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.MOISTURE
     _attr_translation_key = KEY_WATER_LEAK
 
@@ -36,16 +36,13 @@ class DropletLeakSensor(CoordinatorEntity[DropletCoordinator], BinarySensorEntit
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.unique_id}_{KEY_WATER_LEAK}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.unique_id)},
-        )
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.available
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool:
         """Return True if a water leak is detected."""
-        return self.coordinator.water_leak_detected
+        return self.coordinator.data.water_leak_detected
+
+    def _state_fingerprint(self) -> tuple[Hashable, ...]:
+        """Return the visible state of the binary sensor."""
+        return (self.available, self.is_on)
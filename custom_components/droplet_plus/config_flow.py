@@ -20,6 +20,9 @@ from homeassistant.helpers.selector import (
     NumberSelector,
     NumberSelectorConfig,
     NumberSelectorMode,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
     TextSelector,
     TextSelectorConfig,
     TextSelectorType,
@@ -28,11 +31,22 @@ from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
 from .const import (
     CONF_DEVICE_ID,
+    CONF_GAP_FILL,
+    CONF_HIGH_FLOW_DURATION,
+    CONF_HIGH_FLOW_THRESHOLD,
+    CONF_STATISTICS_INTERVAL,
+    CONF_WATER_LEAK_DURATION,
     CONF_WATER_LEAK_THRESHOLD,
     CONF_WATER_TARIFF,
+    DEFAULT_GAP_FILL,
+    DEFAULT_HIGH_FLOW_DURATION,
+    DEFAULT_HIGH_FLOW_THRESHOLD,
+    DEFAULT_STATISTICS_INTERVAL,
+    DEFAULT_WATER_LEAK_DURATION,
     DEFAULT_WATER_LEAK_THRESHOLD,
     DEFAULT_WATER_TARIFF,
     DOMAIN,
+    GAP_FILL_MODES,
 )
 from .helpers import normalize_pairing_code
 
@@ -168,6 +182,11 @@ class DropletConfigFlow(ConfigFlow, domain=DOMAIN):
                 options={
                     CONF_WATER_TARIFF: user_input[CONF_WATER_TARIFF],
                     CONF_WATER_LEAK_THRESHOLD: user_input[CONF_WATER_LEAK_THRESHOLD],
+                    CONF_WATER_LEAK_DURATION: user_input[CONF_WATER_LEAK_DURATION],
+                    CONF_HIGH_FLOW_THRESHOLD: user_input[CONF_HIGH_FLOW_THRESHOLD],
+                    CONF_HIGH_FLOW_DURATION: user_input[CONF_HIGH_FLOW_DURATION],
+                    CONF_STATISTICS_INTERVAL: user_input[CONF_STATISTICS_INTERVAL],
+                    CONF_GAP_FILL: user_input[CONF_GAP_FILL],
                 },
             )
 
@@ -197,6 +216,64 @@ class DropletConfigFlow(ConfigFlow, domain=DOMAIN):
                             mode=NumberSelectorMode.BOX,
                         )
                     ),
+                    vol.Required(
+                        CONF_WATER_LEAK_DURATION,
+                        default=DEFAULT_WATER_LEAK_DURATION,
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=1,
+                            max=1440,
+                            step=1,
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="min",
+                        )
+                    ),
+                    vol.Required(
+                        CONF_HIGH_FLOW_THRESHOLD,
+                        default=DEFAULT_HIGH_FLOW_THRESHOLD,
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0,
+                            max=200,
+                            step=0.1,
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="L/min",
+                        )
+                    ),
+                    vol.Required(
+                        CONF_HIGH_FLOW_DURATION,
+                        default=DEFAULT_HIGH_FLOW_DURATION,
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0,
+                            max=600,
+                            step=1,
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="s",
+                        )
+                    ),
+                    vol.Required(
+                        CONF_STATISTICS_INTERVAL,
+                        default=DEFAULT_STATISTICS_INTERVAL,
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=10,
+                            max=3600,
+                            step=1,
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="s",
+                        )
+                    ),
+                    vol.Required(
+                        CONF_GAP_FILL,
+                        default=DEFAULT_GAP_FILL,
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=GAP_FILL_MODES,
+                            mode=SelectSelectorMode.DROPDOWN,
+                            translation_key=CONF_GAP_FILL,
+                        )
+                    ),
                 }
             ),
         )
@@ -309,6 +386,76 @@ class DropletOptionsFlow(OptionsFlowWithConfigEntry):
                             mode=NumberSelectorMode.BOX,
                         )
                     ),
+                    vol.Required(
+                        CONF_WATER_LEAK_DURATION,
+                        default=current.get(
+                            CONF_WATER_LEAK_DURATION,
+                            DEFAULT_WATER_LEAK_DURATION,
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=1,
+                            max=1440,
+                            step=1,
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="min",
+                        )
+                    ),
+                    vol.Required(
+                        CONF_HIGH_FLOW_THRESHOLD,
+                        default=current.get(
+                            CONF_HIGH_FLOW_THRESHOLD,
+                            DEFAULT_HIGH_FLOW_THRESHOLD,
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0,
+                            max=200,
+                            step=0.1,
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="L/min",
+                        )
+                    ),
+                    vol.Required(
+                        CONF_HIGH_FLOW_DURATION,
+                        default=current.get(
+                            CONF_HIGH_FLOW_DURATION,
+                            DEFAULT_HIGH_FLOW_DURATION,
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0,
+                            max=600,
+                            step=1,
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="s",
+                        )
+                    ),
+                    vol.Required(
+                        CONF_STATISTICS_INTERVAL,
+                        default=current.get(
+                            CONF_STATISTICS_INTERVAL,
+                            DEFAULT_STATISTICS_INTERVAL,
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=10,
+                            max=3600,
+                            step=1,
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="s",
+                        )
+                    ),
+                    vol.Required(
+                        CONF_GAP_FILL,
+                        default=current.get(CONF_GAP_FILL, DEFAULT_GAP_FILL),
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=GAP_FILL_MODES,
+                            mode=SelectSelectorMode.DROPDOWN,
+                            translation_key=CONF_GAP_FILL,
+                        )
+                    ),
                 }
             ),
         )
@@ -14,25 +14,45 @@ CONF_DEVICE_ID: Final = "device_id"
 # Options keys
 CONF_WATER_TARIFF: Final = "water_tariff"
 CONF_WATER_LEAK_THRESHOLD: Final = "water_leak_threshold"
+CONF_WATER_LEAK_DURATION: Final = "water_leak_duration"
+CONF_HIGH_FLOW_THRESHOLD: Final = "high_flow_threshold"
+CONF_HIGH_FLOW_DURATION: Final = "high_flow_duration"
+CONF_STATISTICS_INTERVAL: Final = "statistics_interval"
+CONF_GAP_FILL: Final = "gap_fill"
+
+# Gap fill modes for periods missed while Home Assistant was down
+GAP_FILL_ZEROS: Final = "zeros"
+GAP_FILL_GAPS: Final = "gaps"
+GAP_FILL_MODES: Final = [GAP_FILL_ZEROS, GAP_FILL_GAPS]
 
 # Defaults
 DEFAULT_WATER_TARIFF: Final = 0.0
 DEFAULT_WATER_LEAK_THRESHOLD: Final = 0.0
+DEFAULT_WATER_LEAK_DURATION: Final = 60  # Minutes
+DEFAULT_HIGH_FLOW_THRESHOLD: Final = 0.0  # L/min, 0 = disabled
+DEFAULT_HIGH_FLOW_DURATION: Final = 10  # Seconds
+DEFAULT_STATISTICS_INTERVAL: Final = 60
+DEFAULT_GAP_FILL: Final = GAP_FILL_ZEROS
 
 # Connection
 CONNECT_DELAY: Final = 5
-FW_VERSION_TIMEOUT: Final = 5
+STALE_TIMEOUT: Final = 60  # Seconds restored values stay available without a device frame
 
 # Storage
-STORAGE_VERSION: Final = 1
+STORAGE_VERSION: Final = 2
 STORAGE_KEY: Final = f"{DOMAIN}_data"
 SAVE_INTERVAL: Final = 300
+JOURNAL_INTERVAL: Final = 5
+JOURNAL_MAX_DELAY: Final = 60  # Longest flow samples wait for a flush while volume is unchanged
 
 # Unit conversion
 ML_TO_L: Final = 1000.0
 L_TO_M3: Final = 1000.0
 L_TO_GAL: Final = 3.78541
 
+# State attributes
+ATTR_STALE: Final = "stale"
+
 # Core sensor keys
 KEY_WATER_FLOW_RATE: Final = "water_flow_rate"
 KEY_WATER_VOLUME_DELTA: Final = "water_volume_delta"
@@ -56,6 +76,8 @@ KEY_WATER_COST_LIFETIME: Final = "water_cost_lifetime"
 
 # Statistics sensor keys
 KEY_WATER_AVG_FLOW_1H: Final = "water_avg_flow_1h"
+KEY_WATER_AVG_FLOW_24H: Final = "water_avg_flow_24h"
+KEY_WATER_AVG_FLOW_30D: Final = "water_avg_flow_30d"
 KEY_WATER_PEAK_FLOW_24H: Final = "water_peak_flow_24h"
 KEY_WATER_PEAK_FLOW_7D: Final = "water_peak_flow_7d"
 KEY_WATER_MIN_FLOW_24H: Final = "water_min_flow_24h"
@@ -66,11 +88,39 @@ KEY_WATER_AVG_DAILY_7D: Final = "water_avg_daily_7d"
 KEY_WATER_AVG_DAILY_30D: Final = "water_avg_daily_30d"
 KEY_WATER_PEAK_DAILY_30D: Final = "water_peak_daily_30d"
 
+# Health sensor keys
+KEY_MESSAGE_RATE: Final = "message_rate"
+KEY_PROCESSING_TIME_P95: Final = "processing_time_p95"
+KEY_LAST_MESSAGE_AGE: Final = "last_message_age"
+KEY_RECONNECT_COUNT: Final = "reconnect_count"
+
 # Leak detection
 KEY_WATER_LEAK: Final = "water_leak"
 EVENT_WATER_LEAK_DETECTED: Final = "water_leak_detected"
 EVENT_WATER_LEAK_CLEARED: Final = "water_leak_cleared"
 
+# High flow (burst) detection
+KEY_HIGH_FLOW: Final = "high_flow"
+EVENT_HIGH_FLOW_DETECTED: Final = "high_flow_detected"
+EVENT_HIGH_FLOW_CLEARED: Final = "high_flow_cleared"
+
+# Usage event segmentation
+KEY_WATER_LAST_USAGE_VOLUME: Final = "water_last_usage_volume"
+KEY_WATER_LAST_USAGE_DURATION: Final = "water_last_usage_duration"
+KEY_WATER_LAST_USAGE_PEAK_FLOW: Final = "water_last_usage_peak_flow"
+KEY_WATER_LAST_USAGE_END: Final = "water_last_usage_end"
+EVENT_WATER_USAGE: Final = "water_usage"
+USAGE_IDLE_GAP: Final = 30  # Seconds without flow that end a usage event
+USAGE_EVENTS_MAX: Final = 50  # Recent usage events kept in memory and storage
+
+# Device triggers, fired on the bus as EVENT_DEVICE_TRIGGER with the device ID and type
+EVENT_DEVICE_TRIGGER: Final = f"{DOMAIN}_event"
+TRIGGER_DEVICE_OFFLINE: Final = "device_offline"
+TRIGGER_DEVICE_ONLINE: Final = "device_online"
+
 # Number entity keys
 KEY_WATER_TARIFF: Final = "water_tariff"
 KEY_WATER_LEAK_THRESHOLD: Final = "water_leak_threshold"
+KEY_WATER_LEAK_DURATION: Final = "water_leak_duration"
+KEY_HIGH_FLOW_THRESHOLD: Final = "high_flow_threshold"
+KEY_HIGH_FLOW_DURATION: Final = "high_flow_duration"
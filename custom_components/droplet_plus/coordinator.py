@@ -3,61 +3,101 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from collections.abc import Callable
 import contextlib
-from datetime import datetime, timedelta
+from dataclasses import replace
+from datetime import datetime
 import logging
-import time
+from pathlib import Path
+from time import perf_counter_ns
 from typing import Any
 
 from pydroplet.droplet import Droplet
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT, CONF_TOKEN
+from homeassistant.const import ATTR_DEVICE_ID, CONF_HOST, CONF_PORT, CONF_TOKEN, CONF_TYPE
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_later, async_track_point_in_time
 from homeassistant.helpers.issue_registry import (
     IssueSeverity,
     async_create_issue,
     async_delete_issue,
 )
-from homeassistant.helpers.storage import Store
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.util import dt as dt_util
+from homeassistant.util import dt as dt_util, slugify
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
 from .const import (
     CONF_DEVICE_ID,
+    CONF_GAP_FILL,
+    CONF_HIGH_FLOW_DURATION,
+    CONF_HIGH_FLOW_THRESHOLD,
+    CONF_STATISTICS_INTERVAL,
+    CONF_WATER_LEAK_DURATION,
     CONF_WATER_LEAK_THRESHOLD,
     CONF_WATER_TARIFF,
     CONNECT_DELAY,
+    DEFAULT_GAP_FILL,
+    DEFAULT_HIGH_FLOW_DURATION,
+    DEFAULT_HIGH_FLOW_THRESHOLD,
+    DEFAULT_STATISTICS_INTERVAL,
+    DEFAULT_WATER_LEAK_DURATION,
     DEFAULT_WATER_LEAK_THRESHOLD,
     DEFAULT_WATER_TARIFF,
     DOMAIN,
+    EVENT_DEVICE_TRIGGER,
+    EVENT_HIGH_FLOW_CLEARED,
+    EVENT_HIGH_FLOW_DETECTED,
     EVENT_WATER_LEAK_CLEARED,
     EVENT_WATER_LEAK_DETECTED,
-    FW_VERSION_TIMEOUT,
+    EVENT_WATER_USAGE,
+    GAP_FILL_ZEROS,
+    JOURNAL_INTERVAL,
+    JOURNAL_MAX_DELAY,
     L_TO_GAL,
     L_TO_M3,
     ML_TO_L,
     SAVE_INTERVAL,
+    STALE_TIMEOUT,
     STORAGE_KEY,
     STORAGE_VERSION,
+    TRIGGER_DEVICE_OFFLINE,
+    TRIGGER_DEVICE_ONLINE,
+    USAGE_EVENTS_MAX,
+    USAGE_IDLE_GAP,
 )
+from .external_statistics import DropletStatisticsImporter
 from .helpers import (
-    compute_average,
-    compute_max,
     is_new_day,
     is_new_hour,
     is_new_month,
     is_new_week,
     is_new_year,
+    missed_period_starts,
     next_day,
     next_hour,
     next_month,
     next_week,
     next_year,
 )
+from .journal import (
+    RECORD_CHECKPOINT,
+    RECORD_DAY,
+    RECORD_FLOW_SAMPLE,
+    RECORD_HOUR,
+    RECORD_USAGE,
+    DropletJournal,
+)
+from .profiling import STAGE_TOTAL, HotPathProfiler
+from .scheduler import async_get_scheduler
+from .snapshot import DropletHealth, DropletSnapshot, UsageEvent
+from .statistics import AggregateTier, FlowRun, RollingWindow, SampleBuffer, SlidingExtremum
+from .storage import BUFFER_COLUMNS, DropletStore, pack_columns, rows_to_columns, unpack_columns
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,7 +106,7 @@ DAY_SECONDS = 86400
 WEEK_SECONDS = 604800
 
 
-class DropletCoordinator(DataUpdateCoordinator[None]):
+class DropletCoordinator(DataUpdateCoordinator[DropletSnapshot]):
     """Coordinator for Droplet integration."""
 
     config_entry: ConfigEntry
@@ -87,12 +127,39 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
             port=config_entry.data[CONF_PORT],
             logger=_LOGGER,
         )
-
-        self._store: Store[dict[str, Any]] = Store(
+        # pydroplet 2.3.4 declares Droplet._accumulators as a class attribute
+        # and add_accumulator appends to it, so every Droplet in the process
+        # shares one list: a second config entry's accumulators are rejected
+        # as duplicates, every device's volume is added to the first entry's
+        # accumulators, and a reloaded entry finds its old ones still there
+        self._droplet._accumulators = []  # noqa: SLF001
+
+        self._store = DropletStore(
             hass,
             STORAGE_VERSION,
             f"{STORAGE_KEY}_{config_entry.entry_id}",
         )
+        self._journal = DropletJournal(
+            hass,
+            Path(hass.config.path(STORAGE_DIR, f"{STORAGE_KEY}_{config_entry.entry_id}.journal")),
+        )
+        # Time and lifetime volume of the last journal flush
+        self._journal_flushed_ts: float = 0.0
+        self._journal_volume: float = 0.0
+
+        # Finalized hours are imported as external long-term statistics
+        self._statistics_importer = DropletStatisticsImporter(
+            hass,
+            f"{DOMAIN}:{slugify(self.unique_id)}_water_consumption",
+            f"{config_entry.title} water consumption",
+        )
+
+        # Dirty tracking: bumped on every persisted change; per-buffer
+        # generations let snapshots reuse the packed form of unchanged buffers
+        self._generation: int = 0
+        self._saved_generation: int = 0
+        self._section_generation: dict[str, int] = dict.fromkeys(BUFFER_COLUMNS, 0)
+        self._packed_sections: dict[str, tuple[int, dict[str, Any]]] = {}
 
         # Current values (updated each WebSocket callback)
         self._flow_rate: float = 0.0
@@ -121,18 +188,80 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
         self._hourly_min_flow: float | None = None
 
         # Statistics buffers
-        self._flow_samples: list[tuple[float, float]] = []  # (ts, L/min)
-        self._hourly_consumption: list[tuple[float, float]] = []  # (ts, L)
-        self._daily_consumption: list[tuple[float, float]] = []  # (ts, L)
-        self._hourly_flow_stats: list[tuple[float, float, float]] = []  # (ts, max, min)
-
-        # Leak detection
+        self._flow_samples = SampleBuffer(HOUR_SECONDS)  # (ts, L/min)
+        # Flow samples roll up into 1-minute buckets for 24h, then into
+        # 15-minute buckets for 30d, as they age out of the finer tier
+        self._flow_minutes = AggregateTier(60, DAY_SECONDS)
+        self._flow_quarters = AggregateTier(900, DAY_SECONDS * 30)
+        self._hourly_consumption = RollingWindow(WEEK_SECONDS)  # (ts, L)
+        self._daily_consumption = RollingWindow(DAY_SECONDS * 30)  # (ts, L)
+        self._hourly_flow_stats: deque[tuple[float, float, float]] = deque()  # (ts, max, min)
+
+        # Shorter rolling windows derived from the buffers above
+        self._hourly_consumption_24h = RollingWindow(DAY_SECONDS)
+        self._daily_consumption_7d = RollingWindow(WEEK_SECONDS)
+
+        # Sliding extrema over the hourly/daily buffers
+        self._peak_flow_24h = SlidingExtremum(DAY_SECONDS)
+        self._peak_flow_7d = SlidingExtremum(WEEK_SECONDS)
+        self._min_flow_24h = SlidingExtremum(DAY_SECONDS, maximum=False)
+        self._peak_hourly_24h = SlidingExtremum(DAY_SECONDS)
+        self._peak_hourly_7d = SlidingExtremum(WEEK_SECONDS)
+        self._peak_daily_30d = SlidingExtremum(DAY_SECONDS * 30)
+
+        # Leak detection: flow above the threshold without a break
+        self._flow_run = FlowRun()
         self._water_leak_detected: bool = False
         self._pending_leak_event: tuple[str, dict[str, float]] | None = None
 
+        # High flow (burst) detection: flow above the high flow threshold
+        self._high_flow_run = FlowRun()
+        self._high_flow_detected: bool = False
+        self._pending_high_flow_event: tuple[str, dict[str, float]] | None = None
+
+        # Usage event segmentation: an event runs from the first sample with
+        # flow to the first one without, unless flow resumes within the idle gap
+        self._usage_run = FlowRun()
+        self._usage_idle_since: float | None = None  # First sample without flow
+        self._usage_events: deque[tuple[float, float, float, float]] = deque(
+            maxlen=USAGE_EVENTS_MAX
+        )  # (start, end, L, peak L/min)
+        self._last_usage: UsageEvent | None = None
+
+        # Per-stage timing of the WebSocket callback
+        self._profiler = HotPathProfiler()
+
+        # Device metadata last written to the device registry; None until
+        # the device has sent it on this run
+        self._device_metadata: tuple[str, str, str, str] | None = None
+        # Device registry ID that device trigger events are addressed to
+        self._device_entry_id: str | None = None
+
+        # Metadata saved by the previous run. Restored volumes and statistics
+        # are flagged as stale until the first frame or STALE_TIMEOUT
+        self._cached_metadata: dict[str, str] = {}
+        self._stale: bool = False
+
+        # Push stream health (refreshed on the slow update channel)
+        self._health = DropletHealth()
+        # None until the first frame, so the connection made at setup does
+        # not fire device_online on every start or reload
+        self._connected: bool | None = None
+        self._connections: int = 0
+        self._health_frames: int = 0
+        self._health_ns: int = perf_counter_ns()
+
         # Background task handles
         self._listen_task: asyncio.Task[None] | None = None
         self._save_unsub: CALLBACK_TYPE | None = None
+        self._journal_unsub: CALLBACK_TYPE | None = None
+        self._slow_unsub: CALLBACK_TYPE | None = None
+        self._slow_interval: int = 0
+        self._rollover_unsub: CALLBACK_TYPE | None = None
+        self._stale_unsub: CALLBACK_TYPE | None = None
+
+        # Slow update channel (statistics and cost entities)
+        self._slow_listeners: dict[CALLBACK_TYPE, CALLBACK_TYPE] = {}
 
     # -- Identity --
 
@@ -150,23 +279,69 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
 
     @property
     def device_model(self) -> str:
-        """Return the device model."""
-        return self._droplet.get_model()
+        """Return the device model, or the cached one until the device sends it."""
+        return self._droplet.get_model() or self._cached_metadata.get("model", "")
 
     @property
     def device_manufacturer(self) -> str:
-        """Return the device manufacturer."""
-        return self._droplet.get_manufacturer()
+        """Return the device manufacturer, or the cached one until the device sends it."""
+        return self._droplet.get_manufacturer() or self._cached_metadata.get("manufacturer", "")
 
     @property
     def device_firmware(self) -> str:
-        """Return the firmware version."""
-        return self._droplet.get_fw_version()
+        """Return the firmware version, or the cached one until the device sends it."""
+        return self._droplet.get_fw_version() or self._cached_metadata.get("firmware", "")
 
     @property
     def device_serial(self) -> str:
-        """Return the serial number."""
-        return self._droplet.get_sn()
+        """Return the serial number, or the cached one until the device sends it."""
+        return self._droplet.get_sn() or self._cached_metadata.get("serial", "")
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info for entities.
+
+        Until the device sends its metadata, the copy cached by the previous
+        run is used; without either, the metadata is left out so the device
+        registry keeps its values.
+        """
+        info = DeviceInfo(
+            identifiers={(DOMAIN, self.unique_id)},
+            name=self.config_entry.title,
+        )
+        if self._droplet.version_info_available() or self._cached_metadata:
+            info.update(
+                manufacturer=self.device_manufacturer,
+                model=self.device_model,
+                sw_version=self.device_firmware,
+                serial_number=self.device_serial,
+            )
+        return info
+
+    @callback
+    def _async_update_device_registry(self) -> None:
+        """Write the device metadata to the device registry if it changed."""
+        metadata = (
+            self.device_manufacturer,
+            self.device_model,
+            self.device_firmware,
+            self.device_serial,
+        )
+        if metadata == self._device_metadata:
+            return
+        registry = dr.async_get(self.hass)
+        device = registry.async_get_device(identifiers={(DOMAIN, self.unique_id)})
+        if device is None:
+            # Not registered yet: keep _device_metadata unset so the next frame retries
+            return
+        registry.async_update_device(
+            device.id,
+            manufacturer=metadata[0],
+            model=metadata[1],
+            sw_version=metadata[2],
+            serial_number=metadata[3],
+        )
+        self._device_metadata = metadata
 
     # -- Availability --
 
@@ -175,6 +350,11 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
         """Return True if the device is available."""
         return self._droplet.get_availability()
 
+    @property
+    def stale(self) -> bool:
+        """Return True while values restored from the previous run are shown."""
+        return self._stale
+
     # -- Current values --
 
     @property
@@ -276,129 +456,118 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
         )
 
     @property
-    def is_metric(self) -> bool:
-        """Return True if the HA instance uses metric units."""
-        return self.hass.config.units is METRIC_SYSTEM
+    def water_leak_duration(self) -> int:
+        """Return the configured leak detection duration in seconds."""
+        return 60 * int(
+            self.config_entry.options.get(CONF_WATER_LEAK_DURATION, DEFAULT_WATER_LEAK_DURATION)
+        )
 
-    def _cost_for_volume(self, volume_l: float) -> float:
-        """Calculate cost for a volume in liters using the configured tariff."""
-        tariff = self.water_tariff
-        if tariff == 0.0:
-            return 0.0
-        if self.is_metric:
-            return volume_l / L_TO_M3 * tariff
-        return volume_l / L_TO_GAL * tariff
+    @property
+    def high_flow_threshold(self) -> float:
+        """Return the configured high flow threshold (0 disables the detector)."""
+        return self.config_entry.options.get(CONF_HIGH_FLOW_THRESHOLD, DEFAULT_HIGH_FLOW_THRESHOLD)
 
     @property
-    def daily_cost(self) -> float:
-        """Return current day cost."""
-        return self._cost_for_volume(self.daily_volume)
+    def high_flow_duration(self) -> float:
+        """Return how long flow must exceed the high flow threshold, in seconds."""
+        return self.config_entry.options.get(CONF_HIGH_FLOW_DURATION, DEFAULT_HIGH_FLOW_DURATION)
 
     @property
-    def weekly_cost(self) -> float:
-        """Return current week cost."""
-        return self._cost_for_volume(self.weekly_volume)
+    def statistics_interval(self) -> int:
+        """Return the slow update channel interval in seconds."""
+        return int(
+            self.config_entry.options.get(CONF_STATISTICS_INTERVAL, DEFAULT_STATISTICS_INTERVAL)
+        )
 
     @property
-    def monthly_cost(self) -> float:
-        """Return current month cost."""
-        return self._cost_for_volume(self.monthly_volume)
+    def gap_fill(self) -> str:
+        """Return how periods missed during downtime are filled."""
+        return self.config_entry.options.get(CONF_GAP_FILL, DEFAULT_GAP_FILL)
 
     @property
-    def yearly_cost(self) -> float:
-        """Return current year cost."""
-        return self._cost_for_volume(self.yearly_volume)
+    def is_metric(self) -> bool:
+        """Return True if the HA instance uses metric units."""
+        return self.hass.config.units is METRIC_SYSTEM
 
     @property
-    def lifetime_cost(self) -> float:
-        """Return lifetime cost."""
-        return self._cost_for_volume(self.lifetime_volume)
+    def cost_per_liter(self) -> float:
+        """Return the configured tariff converted to a price per liter."""
+        tariff = self.water_tariff
+        if tariff == 0.0:
+            return 0.0
+        if self.is_metric:
+            return tariff / L_TO_M3
+        return tariff / L_TO_GAL
 
     # -- Statistics --
 
-    @property
-    def avg_flow_1h(self) -> float | None:
-        """Return average flow rate over the last hour."""
-        return compute_average(self._flow_samples, HOUR_SECONDS, time.time())
+    def _tiered_flow_average(self, *tiers: AggregateTier) -> float | None:
+        """Return the sample-weighted mean of the raw samples and the given tiers.
 
-    @property
-    def peak_flow_24h(self) -> float | None:
-        """Return peak flow rate over the last 24 hours."""
-        if not self._hourly_flow_stats:
+        Each tier only holds samples that aged out of the finer one, so the
+        tiers cover adjacent time ranges and can simply be summed.
+        """
+        count = len(self._flow_samples) + sum(tier.count for tier in tiers)
+        if not count:
             return None
-        cutoff = time.time() - DAY_SECONDS
-        valid = [mx for ts, mx, _mn in self._hourly_flow_stats if ts >= cutoff]
-        return max(valid) if valid else None
+        return (self._flow_samples.total + sum(tier.total for tier in tiers)) / count
 
-    @property
-    def peak_flow_7d(self) -> float | None:
-        """Return peak flow rate over the last 7 days."""
-        if not self._hourly_flow_stats:
-            return None
-        cutoff = time.time() - WEEK_SECONDS
-        valid = [mx for ts, mx, _mn in self._hourly_flow_stats if ts >= cutoff]
-        return max(valid) if valid else None
+    # -- Buffer counts (for diagnostics) --
 
     @property
-    def min_flow_24h(self) -> float | None:
-        """Return minimum flow rate over the last 24 hours."""
-        if not self._hourly_flow_stats:
-            return None
-        cutoff = time.time() - DAY_SECONDS
-        valid = [mn for ts, _mx, mn in self._hourly_flow_stats if ts >= cutoff]
-        return min(valid) if valid else None
+    def flow_samples_count(self) -> int:
+        """Return the number of flow samples in the buffer."""
+        return len(self._flow_samples)
 
     @property
-    def avg_hourly_24h(self) -> float | None:
-        """Return average hourly consumption over the last 24 hours."""
-        return compute_average(self._hourly_consumption, DAY_SECONDS, time.time())
+    def flow_samples_nbytes(self) -> int:
+        """Return the memory held by the flow sample buffer in bytes."""
+        return self._flow_samples.nbytes
 
     @property
-    def peak_hourly_24h(self) -> float | None:
-        """Return peak hourly consumption over the last 24 hours."""
-        return compute_max(self._hourly_consumption, DAY_SECONDS, time.time())
+    def hourly_consumption_count(self) -> int:
+        """Return the number of hourly consumption entries."""
+        return len(self._hourly_consumption)
 
     @property
-    def peak_hourly_7d(self) -> float | None:
-        """Return peak hourly consumption over the last 7 days."""
-        return compute_max(self._hourly_consumption, WEEK_SECONDS, time.time())
+    def daily_consumption_count(self) -> int:
+        """Return the number of daily consumption entries."""
+        return len(self._daily_consumption)
 
     @property
-    def avg_daily_7d(self) -> float | None:
-        """Return average daily consumption over the last 7 days."""
-        return compute_average(self._daily_consumption, WEEK_SECONDS, time.time())
+    def hourly_flow_stats_count(self) -> int:
+        """Return the number of hourly flow stats entries."""
+        return len(self._hourly_flow_stats)
 
     @property
-    def avg_daily_30d(self) -> float | None:
-        """Return average daily consumption over the last 30 days."""
-        return compute_average(self._daily_consumption, DAY_SECONDS * 30, time.time())
+    def flow_minutes_count(self) -> int:
+        """Return the number of 1-minute flow buckets."""
+        return len(self._flow_minutes)
 
     @property
-    def peak_daily_30d(self) -> float | None:
-        """Return peak daily consumption over the last 30 days."""
-        return compute_max(self._daily_consumption, DAY_SECONDS * 30, time.time())
-
-    # -- Buffer counts (for diagnostics) --
+    def flow_quarters_count(self) -> int:
+        """Return the number of 15-minute flow buckets."""
+        return len(self._flow_quarters)
 
     @property
-    def flow_samples_count(self) -> int:
-        """Return the number of flow samples in the buffer."""
-        return len(self._flow_samples)
+    def flow_tiers_nbytes(self) -> int:
+        """Return the memory held by the downsampled flow tiers in bytes."""
+        return self._flow_minutes.nbytes + self._flow_quarters.nbytes
 
     @property
-    def hourly_consumption_count(self) -> int:
-        """Return the number of hourly consumption entries."""
-        return len(self._hourly_consumption)
+    def statistics_importer(self) -> DropletStatisticsImporter:
+        """Return the long-term statistics importer."""
+        return self._statistics_importer
 
     @property
-    def daily_consumption_count(self) -> int:
-        """Return the number of daily consumption entries."""
-        return len(self._daily_consumption)
+    def profiler(self) -> HotPathProfiler:
+        """Return the hot path timings."""
+        return self._profiler
 
     @property
-    def hourly_flow_stats_count(self) -> int:
-        """Return the number of hourly flow stats entries."""
-        return len(self._hourly_flow_stats)
+    def health(self) -> DropletHealth:
+        """Return the push stream health as of the last slow refresh."""
+        return self._health
 
     # -- Leak detection --
 
@@ -407,6 +576,11 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
         """Return True if a water leak is detected."""
         return self._water_leak_detected
 
+    @property
+    def flow_run(self) -> FlowRun:
+        """Return the current uninterrupted flow run."""
+        return self._flow_run
+
     @property
     def pending_leak_event(self) -> tuple[str, dict[str, float]] | None:
         """Return pending leak event data, if any."""
@@ -417,13 +591,177 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
         """Consume the pending leak event (called by event entity)."""
         self._pending_leak_event = None
 
+    @property
+    def high_flow_detected(self) -> bool:
+        """Return True while flow exceeds the high flow threshold."""
+        return self._high_flow_detected
+
+    @property
+    def pending_high_flow_event(self) -> tuple[str, dict[str, float]] | None:
+        """Return pending high flow event data, if any."""
+        return self._pending_high_flow_event
+
+    @callback
+    def consume_high_flow_event(self) -> None:
+        """Consume the pending high flow event (called by event entity)."""
+        self._pending_high_flow_event = None
+
+    @property
+    def usage_run(self) -> FlowRun:
+        """Return the usage event in progress."""
+        return self._usage_run
+
+    @property
+    def usage_events(self) -> list[UsageEvent]:
+        """Return the recent completed usage events, oldest first."""
+        return [self._usage_event(*row) for row in self._usage_events]
+
+    # -- Slow update channel --
+
+    @callback
+    def async_add_slow_listener(self, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        """Listen for slow updates (statistics interval and period boundaries)."""
+
+        @callback
+        def remove_listener() -> None:
+            """Remove slow update listener."""
+            self._slow_listeners.pop(remove_listener)
+
+        self._slow_listeners[remove_listener] = update_callback
+        return remove_listener
+
+    @callback
+    def async_update_slow_listeners(self) -> None:
+        """Notify all slow update listeners."""
+        for update_callback in list(self._slow_listeners.values()):
+            update_callback()
+
+    @callback
+    def _handle_slow_refresh(self, _now: datetime) -> None:
+        """Timer callback for the slow update channel."""
+        self._update_health()
+        now_ts = dt_util.now().timestamp()
+        # A run of flow can outlast the leak duration between sparse frames,
+        # and the device may send nothing once flow has stopped
+        leak_detected = self._check_leak_run(now_ts)
+        if self._check_usage_idle(now_ts) or leak_detected:
+            self.async_publish_snapshot()
+        else:
+            self.data = replace(self.data, health=self._health)
+        # Picks up a firmware update reported after a reconnect
+        if self._droplet.version_info_available():
+            self._async_update_device_registry()
+        self.async_update_slow_listeners()
+
+    def _update_health(self) -> None:
+        """Recompute the push stream health from the hot path counters."""
+        now_ns = perf_counter_ns()
+        profiler = self._profiler
+        frames = profiler.frame_count
+        elapsed = (now_ns - self._health_ns) / 1e9
+        p95 = profiler.percentile(STAGE_TOTAL, 0.95)
+        last_frame_ns = profiler.last_frame_ns
+        self._health = DropletHealth(
+            message_rate=(frames - self._health_frames) / elapsed if elapsed > 0 else None,
+            processing_time_p95=p95 / 1000 if p95 is not None else None,
+            last_message_age=(now_ns - last_frame_ns) / 1e9 if last_frame_ns is not None else None,
+            reconnect_count=max(self._connections - 1, 0),
+        )
+        self._health_frames = frames
+        self._health_ns = now_ns
+
+    @callback
+    def _schedule_slow_refresh(self) -> None:
+        """(Re)start the slow update timer if the interval changed."""
+        interval = self.statistics_interval
+        if self._slow_unsub and interval == self._slow_interval:
+            return
+        if self._slow_unsub:
+            self._slow_unsub()
+        self._slow_interval = interval
+        self._slow_unsub = async_get_scheduler(self.hass).async_schedule(
+            "statistics refresh", interval, self._handle_slow_refresh
+        )
+
+    async def _async_options_updated(self, _hass: HomeAssistant, _entry: ConfigEntry) -> None:
+        """Apply changed options (statistics interval, tariff, leak detection)."""
+        self._schedule_slow_refresh()
+        self._check_leak_run(dt_util.now().timestamp())
+        self.async_publish_snapshot()
+        self.async_update_slow_listeners()
+
+    # -- Snapshot --
+
+    def _build_snapshot(self) -> DropletSnapshot:
+        """Compute every entity-visible value once for the current update."""
+        hourly = self.hourly_volume
+        daily = self.daily_volume
+        weekly = self.weekly_volume
+        monthly = self.monthly_volume
+        yearly = self.yearly_volume
+        lifetime = self.lifetime_volume
+        cost_per_liter = self.cost_per_liter
+        return DropletSnapshot(
+            available=self.available,
+            stale=self._stale,
+            flow_rate=self._flow_rate,
+            volume_delta=self._volume_delta,
+            volume_last_reset=self._volume_last_reset,
+            server_status=self.server_status,
+            signal_quality=self.signal_quality,
+            hourly_volume=hourly,
+            daily_volume=daily,
+            weekly_volume=weekly,
+            monthly_volume=monthly,
+            yearly_volume=yearly,
+            lifetime_volume=lifetime,
+            hourly_reset=self._hourly_reset,
+            daily_reset=self._daily_reset,
+            weekly_reset=self._weekly_reset,
+            monthly_reset=self._monthly_reset,
+            yearly_reset=self._yearly_reset,
+            daily_cost=daily * cost_per_liter,
+            weekly_cost=weekly * cost_per_liter,
+            monthly_cost=monthly * cost_per_liter,
+            yearly_cost=yearly * cost_per_liter,
+            lifetime_cost=lifetime * cost_per_liter,
+            avg_flow_1h=self._flow_samples.average,
+            avg_flow_24h=self._tiered_flow_average(self._flow_minutes),
+            avg_flow_30d=self._tiered_flow_average(self._flow_minutes, self._flow_quarters),
+            peak_flow_24h=self._peak_flow_24h.value,
+            peak_flow_7d=self._peak_flow_7d.value,
+            min_flow_24h=self._min_flow_24h.value,
+            avg_hourly_24h=self._hourly_consumption_24h.average,
+            peak_hourly_24h=self._peak_hourly_24h.value,
+            peak_hourly_7d=self._peak_hourly_7d.value,
+            avg_daily_7d=self._daily_consumption_7d.average,
+            avg_daily_30d=self._daily_consumption.average,
+            peak_daily_30d=self._peak_daily_30d.value,
+            water_leak_detected=self._water_leak_detected,
+            last_usage=self._last_usage,
+            health=self._health,
+        )
+
+    @callback
+    def async_publish_snapshot(self) -> None:
+        """Build a fresh snapshot and notify per-frame listeners."""
+        self.async_set_updated_data(self._build_snapshot())
+
     # -- Setup / Teardown --
 
     async def async_setup(self) -> None:
         """Set up the coordinator: load data, start WebSocket, start save timer."""
         await self._async_load_data()
+        await self._statistics_importer.async_setup()
         self._handle_stale_boundaries()
+        self._statistics_importer.async_flush()
+        self._schedule_period_rollover()
         self._register_accumulators()
+        self.data = self._build_snapshot()
+        if self._stale:
+            self._stale_unsub = async_call_later(
+                self.hass, STALE_TIMEOUT, self._handle_stale_timeout
+            )
 
         self._listen_task = self.config_entry.async_create_background_task(
             self.hass,
@@ -431,23 +769,20 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
             f"{DOMAIN}_listen_{self.config_entry.entry_id}",
         )
 
-        # Wait for device metadata
-        for _ in range(FW_VERSION_TIMEOUT * 10):
-            if self._droplet.version_info_available():
-                break
-            await asyncio.sleep(0.1)
-
-        if not self._droplet.version_info_available():
-            _LOGGER.warning(
-                "Timeout waiting for device metadata from %s",
-                self.config_entry.data[CONF_HOST],
-            )
+        # Journal flush (changes only) and periodic compaction (full snapshot),
+        # staggered against the other entries by the shared scheduler
+        scheduler = async_get_scheduler(self.hass)
+        self._journal_unsub = scheduler.async_schedule(
+            "journal flush", JOURNAL_INTERVAL, self._async_flush_journal
+        )
+        self._save_unsub = scheduler.async_schedule(
+            "save", SAVE_INTERVAL, self._async_save_periodic
+        )
 
-        # Periodic save
-        self._save_unsub = async_track_time_interval(
-            self.hass,
-            self._async_save_periodic,
-            timedelta(seconds=SAVE_INTERVAL),
+        # Slow update channel
+        self._schedule_slow_refresh()
+        self.config_entry.async_on_unload(
+            self.config_entry.add_update_listener(self._async_options_updated)
         )
 
     async def async_shutdown(self) -> None:
@@ -456,6 +791,22 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
             self._save_unsub()
             self._save_unsub = None
 
+        if self._journal_unsub:
+            self._journal_unsub()
+            self._journal_unsub = None
+
+        if self._slow_unsub:
+            self._slow_unsub()
+            self._slow_unsub = None
+
+        if self._rollover_unsub:
+            self._rollover_unsub()
+            self._rollover_unsub = None
+
+        if self._stale_unsub:
+            self._stale_unsub()
+            self._stale_unsub = None
+
         if self._listen_task and not self._listen_task.done():
             await self._droplet.stop_listening()
             self._listen_task.cancel()
@@ -474,10 +825,35 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
     @callback
     def _on_update(self, _data: Any) -> None:
         """Handle WebSocket update (called from event loop by pydroplet)."""
-        if not self._droplet.get_availability():
-            self.async_set_updated_data(None)
+        began = perf_counter_ns()
+        available = self._droplet.get_availability()
+        if self._stale:
+            # Any frame, even a failed connection attempt, ends the stale state
+            self._end_stale()
+        if available != self._connected:
+            if self._connected is not None:
+                self._async_fire_device_trigger(
+                    TRIGGER_DEVICE_ONLINE if available else TRIGGER_DEVICE_OFFLINE
+                )
+            self._connected = available
+            if available:
+                self._connections += 1
+
+        if not available:
+            # Flow while offline is unknown, so a run cannot span the outage
+            self._flow_run.reset()
+            self._high_flow_run.reset()
+            if self._usage_run.active:
+                self._end_usage()
+            self.async_publish_snapshot()
             return
 
+        self._profiler.frame(began)
+
+        # Metadata arrives with the first messages after setup returned
+        if self._device_metadata is None and self._droplet.version_info_available():
+            self._async_update_device_registry()
+
         now = dt_util.now()
         now_ts = now.timestamp()
 
@@ -488,6 +864,7 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
         # Store current values
         self._flow_rate = self._droplet.get_flow_rate()
         self._volume_last_reset = now
+        read = perf_counter_ns()
 
         # Track hourly flow stats
         if self._hourly_min_flow is None:
@@ -496,45 +873,103 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
             self._hourly_min_flow = min(self._hourly_min_flow, self._flow_rate)
         self._hourly_max_flow = max(self._hourly_max_flow, self._flow_rate)
 
-        # Check period boundaries
-        self._check_period_boundaries(now)
-
         # Record flow sample
-        self._flow_samples.append((now_ts, self._flow_rate))
+        self._flow_samples.append(now_ts, self._flow_rate)
+        self._journal.append([RECORD_FLOW_SAMPLE, now_ts, self._flow_rate])
+        self._mark_dirty("flow_samples")
+        record = perf_counter_ns()
 
-        # Trim expired buffer entries
+        # Expire flow samples older than 1h (hourly/daily buffers are
+        # trimmed at period boundaries only)
         self._trim_buffers(now_ts)
+        trim = perf_counter_ns()
 
-        # Evaluate leak detection
-        self._evaluate_leak()
+        # Evaluate leak and high flow detection, segment usage events
+        self._evaluate_leak(now_ts)
+        self._evaluate_high_flow(now_ts)
+        self._segment_usage(now_ts)
+        analysis = perf_counter_ns()
 
         # Notify entities
-        self.async_set_updated_data(None)
+        snapshot = self._build_snapshot()
+        built = perf_counter_ns()
+        self.async_set_updated_data(snapshot)
+        self._profiler.record(began, read, record, trim, analysis, built, perf_counter_ns())
+
+    # -- Stale state --
+
+    @callback
+    def _end_stale(self) -> None:
+        """Stop flagging restored values as stale.
+
+        Slow entities still show the restored values; they are refreshed
+        once the current frame has published live ones.
+        """
+        if self._stale_unsub:
+            self._stale_unsub()
+            self._stale_unsub = None
+        self._stale = False
+        self.hass.loop.call_soon(self.async_update_slow_listeners)
+
+    @callback
+    def _handle_stale_timeout(self, _now: datetime) -> None:
+        """End the stale state when no frame arrived within STALE_TIMEOUT of setup."""
+        self._stale_unsub = None
+        self._end_stale()
+        self.async_publish_snapshot()
+
+    # -- Period rollover --
+
+    @callback
+    def _schedule_period_rollover(self) -> None:
+        """Schedule the rollover timer at the next period boundary.
+
+        Every period starts on an hour boundary, so the next hour after the
+        hourly reset is always the earliest boundary.
+        """
+        if self._rollover_unsub:
+            self._rollover_unsub()
+        self._rollover_unsub = async_track_point_in_time(
+            self.hass,
+            self._handle_period_rollover,
+            next_hour(self._hourly_reset),
+        )
+
+    @callback
+    def _handle_period_rollover(self, now: datetime) -> None:
+        """Finalize crossed periods at the boundary, even without WebSocket frames."""
+        self._rollover_unsub = None
+        began = perf_counter_ns()
+        self._check_period_boundaries(dt_util.as_local(now))
+        self._statistics_importer.async_flush()
+        self._profiler.rollover.add(perf_counter_ns() - began)
+        self._schedule_period_rollover()
+        self.async_publish_snapshot()
+        self.async_update_slow_listeners()
 
     def _check_period_boundaries(self, now: datetime) -> None:
         """Check and handle period boundary crossings."""
         if is_new_hour(self._hourly_reset, now):
             # Finalize: baseline + pydroplet accumulated volume
-            finalized = self.hourly_volume
-            self._hourly_consumption.append((self._hourly_reset.timestamp(), finalized))
-            if self._hourly_min_flow is not None:
-                self._hourly_flow_stats.append(
-                    (
-                        self._hourly_reset.timestamp(),
-                        self._hourly_max_flow,
-                        self._hourly_min_flow,
-                    )
-                )
+            self._finalize_hour(
+                self._hourly_reset.timestamp(),
+                self.hourly_volume,
+                self._hourly_max_flow,
+                self._hourly_min_flow,
+            )
             # Reset accumulator and baseline
             self._droplet.reset_accumulator("hourly", next_hour(now))
             self._baseline_hourly = 0.0
             self._hourly_reset = now
             self._hourly_max_flow = 0.0
             self._hourly_min_flow = None
+            # Entries are hour-aligned, so they can only expire on a boundary
+            self._trim_period_buffers(now.timestamp())
+            # Every period starts on an hour, so this covers all resets
+            self._mark_dirty(*BUFFER_COLUMNS)
 
         if is_new_day(self._daily_reset, now):
-            finalized = self.daily_volume
-            self._daily_consumption.append((self._daily_reset.timestamp(), finalized))
+            self._finalize_day(self._daily_reset.timestamp(), self.daily_volume)
             self._droplet.reset_accumulator("daily", next_day(now))
             self._baseline_daily = 0.0
             self._daily_reset = now
@@ -559,14 +994,21 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
         now = dt_util.now()
 
         if is_new_hour(self._hourly_reset, now):
-            self._hourly_consumption.append((self._hourly_reset.timestamp(), self._baseline_hourly))
+            self._finalize_hour(self._hourly_reset.timestamp(), self._baseline_hourly, None, None)
+            self._backfill_hours(
+                missed_period_starts(self._hourly_reset, now, next_hour, WEEK_SECONDS)
+            )
             self._baseline_hourly = 0.0
             self._hourly_reset = now
             self._hourly_max_flow = 0.0
             self._hourly_min_flow = None
+            self._mark_dirty(*BUFFER_COLUMNS)
 
         if is_new_day(self._daily_reset, now):
-            self._daily_consumption.append((self._daily_reset.timestamp(), self._baseline_daily))
+            self._finalize_day(self._daily_reset.timestamp(), self._baseline_daily)
+            self._backfill_days(
+                missed_period_starts(self._daily_reset, now, next_day, DAY_SECONDS * 30)
+            )
             self._baseline_daily = 0.0
             self._daily_reset = now
 
@@ -582,6 +1024,30 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
             self._baseline_yearly = 0.0
             self._yearly_reset = now
 
+        # Backfilled slots may reach back further than the shorter windows
+        self._trim_period_buffers(now.timestamp())
+
+    def _backfill_hours(self, starts: list[datetime]) -> None:
+        """Fill hours missed during downtime according to the gap fill option.
+
+        With zeros, each missed hour is recorded as 0 L (including long-term
+        statistics) and counts towards averages. With gaps, nothing is
+        recorded and averages only cover hours that were observed.
+        """
+        if not starts or self.gap_fill != GAP_FILL_ZEROS:
+            return
+        for start in starts:
+            self._finalize_hour(start.timestamp(), 0.0, None, None)
+        _LOGGER.debug("Backfilled %d missed hours with zero consumption", len(starts))
+
+    def _backfill_days(self, starts: list[datetime]) -> None:
+        """Fill days missed during downtime according to the gap fill option."""
+        if not starts or self.gap_fill != GAP_FILL_ZEROS:
+            return
+        for start in starts:
+            self._finalize_day(start.timestamp(), 0.0)
+        _LOGGER.debug("Backfilled %d missed days with zero consumption", len(starts))
+
     def _register_accumulators(self) -> None:
         """Register pydroplet accumulators for all period volumes."""
         now = dt_util.now()
@@ -592,73 +1058,390 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
         self._droplet.add_accumulator("yearly", next_year(now))
         self._droplet.add_accumulator("lifetime", datetime(9999, 12, 31, tzinfo=now.tzinfo))
 
-    def _trim_buffers(self, now_ts: float) -> None:
-        """Trim expired entries from statistics buffers."""
-        # Flow samples: keep 1h
-        cutoff_1h = now_ts - HOUR_SECONDS
-        self._flow_samples = [(ts, v) for ts, v in self._flow_samples if ts >= cutoff_1h]
+    def _finalize_hour(
+        self, ts: float, volume: float, max_flow: float | None, min_flow: float | None
+    ) -> None:
+        """Record a finished hour in the statistics windows, journal and long-term statistics."""
+        self._record_hourly_consumption(ts, volume)
+        hour_start = dt_util.as_local(dt_util.utc_from_timestamp(ts)).replace(
+            minute=0, second=0, microsecond=0
+        )
+        self._statistics_importer.add_hour(hour_start, volume)
+        if max_flow is not None and min_flow is not None:
+            self._record_hourly_flow_stats(ts, max_flow, min_flow)
+        self._journal.append([RECORD_HOUR, ts, volume, max_flow, min_flow])
+
+    def _finalize_day(self, ts: float, volume: float) -> None:
+        """Record a finished day in the statistics windows and the journal."""
+        self._record_daily_consumption(ts, volume)
+        self._journal.append([RECORD_DAY, ts, volume])
+
+    def _record_hourly_consumption(self, ts: float, volume: float) -> None:
+        """Record a finalized hourly volume in the hourly windows."""
+        self._hourly_consumption.append(ts, volume)
+        self._hourly_consumption_24h.append(ts, volume)
+        self._peak_hourly_24h.append(ts, volume)
+        self._peak_hourly_7d.append(ts, volume)
+
+    def _record_daily_consumption(self, ts: float, volume: float) -> None:
+        """Record a finalized daily volume in the daily windows."""
+        self._daily_consumption.append(ts, volume)
+        self._daily_consumption_7d.append(ts, volume)
+        self._peak_daily_30d.append(ts, volume)
+
+    def _record_hourly_flow_stats(self, ts: float, max_flow: float, min_flow: float) -> None:
+        """Record finalized hourly flow extremes in the flow windows."""
+        self._hourly_flow_stats.append((ts, max_flow, min_flow))
+        self._peak_flow_24h.append(ts, max_flow)
+        self._peak_flow_7d.append(ts, max_flow)
+        self._min_flow_24h.append(ts, min_flow)
+
+    def _clear_period_statistics(self) -> None:
+        """Clear the hourly/daily buffers and every window derived from them."""
+        self._hourly_consumption.clear()
+        self._hourly_consumption_24h.clear()
+        self._peak_hourly_24h.clear()
+        self._peak_hourly_7d.clear()
+        self._hourly_flow_stats.clear()
+        self._peak_flow_24h.clear()
+        self._peak_flow_7d.clear()
+        self._min_flow_24h.clear()
+        self._daily_consumption.clear()
+        self._daily_consumption_7d.clear()
+        self._peak_daily_30d.clear()
 
-        # Hourly consumption + flow stats: keep 7d
+    def _trim_buffers(self, now_ts: float) -> None:
+        """Expire raw flow samples (keep 1h), rolling them into the coarser tiers."""
+        if self._flow_samples.expire(now_ts, self._flow_minutes.add_sample):
+            self._mark_dirty("flow_minutes")
+        if self._flow_minutes.expire(now_ts, self._flow_quarters):
+            self._flow_quarters.expire(now_ts)
+            self._mark_dirty("flow_minutes", "flow_quarters")
+
+    def _trim_period_buffers(self, now_ts: float) -> None:
+        """Trim expired entries from the hourly/daily buffers."""
+        # Hourly consumption + flow stats: keep 7d (24h windows for statistics)
+        self._hourly_consumption.expire(now_ts)
+        self._hourly_consumption_24h.expire(now_ts)
+        self._peak_hourly_24h.expire(now_ts)
+        self._peak_hourly_7d.expire(now_ts)
         cutoff_7d = now_ts - WEEK_SECONDS
-        self._hourly_consumption = [
-            (ts, v) for ts, v in self._hourly_consumption if ts >= cutoff_7d
-        ]
-        self._hourly_flow_stats = [
-            (ts, mx, mn) for ts, mx, mn in self._hourly_flow_stats if ts >= cutoff_7d
-        ]
-
-        # Daily consumption: keep 30d
-        cutoff_30d = now_ts - DAY_SECONDS * 30
-        self._daily_consumption = [(ts, v) for ts, v in self._daily_consumption if ts >= cutoff_30d]
-
-    def _evaluate_leak(self) -> None:
-        """Evaluate leak detection based on min_flow_24h vs threshold."""
-        min_flow = self.min_flow_24h
-        threshold = self.water_leak_threshold
-
-        if min_flow is None:
+        flow_stats = self._hourly_flow_stats
+        while flow_stats and flow_stats[0][0] < cutoff_7d:
+            flow_stats.popleft()
+        self._peak_flow_24h.expire(now_ts)
+        self._peak_flow_7d.expire(now_ts)
+        self._min_flow_24h.expire(now_ts)
+
+        # Daily consumption: keep 30d (7d window for averages)
+        self._daily_consumption.expire(now_ts)
+        self._daily_consumption_7d.expire(now_ts)
+        self._peak_daily_30d.expire(now_ts)
+
+    def _evaluate_leak(self, now_ts: float) -> None:
+        """Extend or end the flow run with the current sample and update the leak state.
+
+        A sample above the threshold extends the run; one at or below it ends
+        the run and clears a detected leak.
+        """
+        run = self._flow_run
+        if self._flow_rate > self.water_leak_threshold:
+            run.add(now_ts, self._flow_rate, self._volume_delta / ML_TO_L)
+            self._check_leak_run(now_ts)
             return
+        if self._water_leak_detected:
+            self._clear_leak(now_ts)
+        run.reset()
+
+    def _check_leak_run(self, now_ts: float) -> bool:
+        """Raise a leak once the flow run lasts the configured duration.
+
+        Returns True if a leak was detected.
+        """
+        run = self._flow_run
+        if self._water_leak_detected or not run.active:
+            return False
+        duration = run.duration(now_ts)
+        if duration < self.water_leak_duration:
+            return False
 
-        was_leaking = self._water_leak_detected
-
-        if min_flow > threshold and not was_leaking:
-            self._water_leak_detected = True
-            self._pending_leak_event = (
-                EVENT_WATER_LEAK_DETECTED,
-                {"min_flow": min_flow, "threshold": threshold},
-            )
+        threshold = self.water_leak_threshold
+        self._water_leak_detected = True
+        self._pending_leak_event = (
+            EVENT_WATER_LEAK_DETECTED,
+            {
+                "min_flow": run.min_flow or 0.0,
+                "mean_flow": run.mean_flow or 0.0,
+                "duration": duration,
+                "volume": run.volume,
+                "threshold": threshold,
+            },
+        )
+        _LOGGER.warning(
+            "Water leak detected: flow above %.3f L/min for %d min (%.1f L, min %.3f L/min)",
+            threshold,
+            duration // 60,
+            run.volume,
+            run.min_flow or 0.0,
+        )
+        async_create_issue(
+            self.hass,
+            DOMAIN,
+            EVENT_WATER_LEAK_DETECTED,
+            is_fixable=False,
+            severity=IssueSeverity.WARNING,
+            translation_key=EVENT_WATER_LEAK_DETECTED,
+        )
+        return True
+
+    def _clear_leak(self, now_ts: float) -> None:
+        """Clear a detected leak when the flow run ends."""
+        run = self._flow_run
+        self._water_leak_detected = False
+        self._pending_leak_event = (
+            EVENT_WATER_LEAK_CLEARED,
+            {
+                "flow": self._flow_rate,
+                "duration": run.duration(now_ts),
+                "volume": run.volume,
+                "threshold": self.water_leak_threshold,
+            },
+        )
+        _LOGGER.info("Water leak cleared: flow %.3f L/min", self._flow_rate)
+        async_delete_issue(self.hass, DOMAIN, EVENT_WATER_LEAK_DETECTED)
+
+    def _evaluate_high_flow(self, now_ts: float) -> None:
+        """Raise or clear high flow on the current sample.
+
+        Runs inside the WebSocket callback, so the event entity and the
+        device trigger fire on the same frame that crossed the duration.
+        """
+        threshold = self.high_flow_threshold
+        run = self._high_flow_run
+        if threshold and self._flow_rate > threshold:
+            run.add(now_ts, self._flow_rate, self._volume_delta / ML_TO_L)
+            if self._high_flow_detected or run.duration(now_ts) < self.high_flow_duration:
+                return
+            self._high_flow_detected = True
+            event_data = {
+                "flow": self._flow_rate,
+                "mean_flow": run.mean_flow or 0.0,
+                "duration": run.duration(now_ts),
+                "volume": run.volume,
+                "threshold": threshold,
+            }
             _LOGGER.warning(
-                "Water leak detected: min flow %.3f L/min exceeds threshold %.3f L/min",
-                min_flow,
+                "High flow detected: %.2f L/min above %.2f L/min for %.0f s",
+                self._flow_rate,
                 threshold,
+                event_data["duration"],
             )
-            async_create_issue(
-                self.hass,
-                DOMAIN,
-                EVENT_WATER_LEAK_DETECTED,
-                is_fixable=False,
-                severity=IssueSeverity.WARNING,
-                translation_key=EVENT_WATER_LEAK_DETECTED,
-            )
+            self._pending_high_flow_event = (EVENT_HIGH_FLOW_DETECTED, event_data)
+            self._async_fire_device_trigger(EVENT_HIGH_FLOW_DETECTED, event_data)
+            return
 
-        elif min_flow <= threshold and was_leaking:
-            self._water_leak_detected = False
-            self._pending_leak_event = (
-                EVENT_WATER_LEAK_CLEARED,
-                {"min_flow": min_flow, "threshold": threshold},
-            )
-            _LOGGER.info("Water leak cleared: min flow %.3f L/min", min_flow)
-            async_delete_issue(self.hass, DOMAIN, EVENT_WATER_LEAK_DETECTED)
+        if self._high_flow_detected:
+            self._high_flow_detected = False
+            event_data = {
+                "flow": self._flow_rate,
+                "duration": run.duration(now_ts),
+                "volume": run.volume,
+                "threshold": threshold,
+            }
+            _LOGGER.info("High flow cleared: flow %.2f L/min", self._flow_rate)
+            self._pending_high_flow_event = (EVENT_HIGH_FLOW_CLEARED, event_data)
+            self._async_fire_device_trigger(EVENT_HIGH_FLOW_CLEARED, event_data)
+        if run.active:
+            run.reset()
+
+    def _segment_usage(self, now_ts: float) -> None:
+        """Advance the usage event state machine with the current sample.
+
+        Flow starts or extends the event. The first sample without flow marks
+        the end and adds the volume that flowed up to it; the event completes
+        once USAGE_IDLE_GAP seconds pass without flow resuming.
+        """
+        run = self._usage_run
+        if self._flow_rate > 0:
+            run.add(now_ts, self._flow_rate, self._volume_delta / ML_TO_L)
+            self._usage_idle_since = None
+            return
+        if not run.active:
+            return
+        if self._usage_idle_since is None:
+            run.add(now_ts, 0.0, self._volume_delta / ML_TO_L)
+            self._usage_idle_since = now_ts
+        self._check_usage_idle(now_ts)
+
+    def _check_usage_idle(self, now_ts: float) -> bool:
+        """Complete the usage event once flow stayed off for the idle gap.
+
+        Returns True if an event completed.
+        """
+        idle_since = self._usage_idle_since
+        if idle_since is None or now_ts - idle_since < USAGE_IDLE_GAP:
+            return False
+        self._end_usage()
+        return True
+
+    def _end_usage(self) -> None:
+        """Record the usage event in progress and announce it on the bus."""
+        run = self._usage_run
+        row = (run.start or 0.0, run.end or 0.0, run.volume, run.max_flow or 0.0)
+        run.reset()
+        self._usage_idle_since = None
+        event = self._record_usage_event(*row)
+        self._journal.append([RECORD_USAGE, *row])
+        self._mark_dirty("usage_events")
+
+        _LOGGER.debug(
+            "Water usage: %.2f L over %.0f s, peak %.2f L/min",
+            event.volume,
+            event.duration,
+            event.peak_flow,
+        )
+        self._async_fire_device_trigger(
+            EVENT_WATER_USAGE,
+            {
+                "start": event.start.isoformat(),
+                "end": event.end.isoformat(),
+                "duration": event.duration,
+                "volume": event.volume,
+                "peak_flow": event.peak_flow,
+            },
+        )
+
+    def _record_usage_event(
+        self, start: float, end: float, volume: float, peak: float
+    ) -> UsageEvent:
+        """Append a completed usage event to the ring of recent events."""
+        self._usage_events.append((start, end, volume, peak))
+        self._last_usage = self._usage_event(start, end, volume, peak)
+        return self._last_usage
+
+    @staticmethod
+    def _usage_event(start: float, end: float, volume: float, peak: float) -> UsageEvent:
+        """Build the entity-facing form of a stored usage event."""
+        return UsageEvent(
+            start=dt_util.utc_from_timestamp(start),
+            end=dt_util.utc_from_timestamp(end),
+            volume=volume,
+            peak_flow=peak,
+        )
+
+    @callback
+    def _async_fire_device_trigger(
+        self, trigger_type: str, event_data: dict[str, Any] | None = None
+    ) -> None:
+        """Fire a device trigger event for this Droplet on the event bus."""
+        if self._device_entry_id is None:
+            registry = dr.async_get(self.hass)
+            device = registry.async_get_device(identifiers={(DOMAIN, self.unique_id)})
+            if device is None:
+                return
+            self._device_entry_id = device.id
+        self.hass.bus.async_fire(
+            EVENT_DEVICE_TRIGGER,
+            {ATTR_DEVICE_ID: self._device_entry_id, CONF_TYPE: trigger_type, **(event_data or {})},
+        )
 
     # -- Persistence --
 
+    async def _async_flush_journal(self, now: datetime) -> None:
+        """Append the changes since the last flush to the journal.
+
+        Finalized periods, usage events and volume changes are flushed on the
+        next tick with a checkpoint, so a crash loses at most one interval of
+        lifetime volume. Flow samples alone do not cause a flush: they go out
+        with the next checkpoint, or after JOURNAL_MAX_DELAY seconds.
+        """
+        journal = self._journal
+        if not journal.pending_count:
+            return
+        now_ts = now.timestamp()
+        lifetime = self.lifetime_volume
+        if not (
+            journal.has_pending_events
+            or lifetime != self._journal_volume
+            or now_ts - self._journal_flushed_ts >= JOURNAL_MAX_DELAY
+        ):
+            return
+        self._journal_flushed_ts = now_ts
+        self._journal_volume = lifetime
+        journal.append([RECORD_CHECKPOINT, self._state_payload()])
+        await journal.async_flush()
+
+    def _mark_dirty(self, *sections: str) -> None:
+        """Record a change to persisted state and the buffer sections it touched."""
+        self._generation += 1
+        for section in sections:
+            self._section_generation[section] = self._generation
+
+    @property
+    def has_unsaved_changes(self) -> bool:
+        """Return True if state changed since the last full snapshot."""
+        return self._generation != self._saved_generation
+
     async def _async_save_periodic(self, _now: datetime) -> None:
-        """Periodic save callback."""
+        """Periodic save callback; skipped when nothing changed."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Hot path timing for %s, p50/p95 µs: %s",
+                self.config_entry.title,
+                self._profiler.log_line(),
+            )
+        if not self.has_unsaved_changes:
+            return
         await self._async_save_data()
 
     async def _async_save_data(self) -> None:
-        """Save persistent data to store."""
+        """Compact: write a full snapshot to the store and truncate the journal."""
+        await self._journal.async_compact(self._async_write_snapshot)
+
+    async def _async_write_snapshot(self) -> None:
+        """Save the full persistent state to the store."""
+        generation = self._generation
         data = {
+            **self._state_payload(),
+            "buffers": {section: self._packed_section(section) for section in BUFFER_COLUMNS},
+            "journal_epoch": self._journal.epoch,
+            "device": {
+                "manufacturer": self.device_manufacturer,
+                "model": self.device_model,
+                "firmware": self.device_firmware,
+                "serial": self.device_serial,
+            },
+        }
+        await self._store.async_save(data)
+        self._saved_generation = generation
+
+    def _packed_section(self, section: str) -> dict[str, Any]:
+        """Return the packed columns of a buffer, re-packing only if it changed."""
+        generation = self._section_generation[section]
+        cached = self._packed_sections.get(section)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+        if section == "flow_samples":
+            columns = list(self._flow_samples.columns())
+        elif section == "hourly_consumption":
+            columns = rows_to_columns(self._hourly_consumption, 2)
+        elif section == "daily_consumption":
+            columns = rows_to_columns(self._daily_consumption, 2)
+        elif section == "hourly_flow_stats":
+            columns = rows_to_columns(self._hourly_flow_stats, 3)
+        elif section == "flow_minutes":
+            columns = rows_to_columns(self._flow_minutes, 5)
+        elif section == "usage_events":
+            columns = rows_to_columns(self._usage_events, 4)
+        else:
+            columns = rows_to_columns(self._flow_quarters, 5)
+        header = pack_columns(columns)
+        self._packed_sections[section] = (generation, header)
+        return header
+
+    def _state_payload(self) -> dict[str, Any]:
+        """Return the scalar state (volumes, period resets, leak state)."""
+        return {
             "lifetime_volume": self.lifetime_volume,
             "hourly_volume": self.hourly_volume,
             "hourly_reset": self._hourly_reset.isoformat(),
@@ -672,22 +1455,11 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
             "yearly_reset": self._yearly_reset.isoformat(),
             "hourly_max_flow": self._hourly_max_flow,
             "hourly_min_flow": self._hourly_min_flow,
-            "flow_samples": [[ts, v] for ts, v in self._flow_samples],
-            "hourly_consumption": [[ts, v] for ts, v in self._hourly_consumption],
-            "daily_consumption": [[ts, v] for ts, v in self._daily_consumption],
-            "hourly_flow_stats": [[ts, mx, mn] for ts, mx, mn in self._hourly_flow_stats],
             "water_leak_detected": self._water_leak_detected,
         }
-        await self._store.async_save(data)
-
-    async def _async_load_data(self) -> None:
-        """Load persistent data from store."""
-        data = await self._store.async_load()
-        if not data:
-            return
-
-        now = dt_util.now()
 
+    def _apply_state_payload(self, data: dict[str, Any], now: datetime) -> None:
+        """Restore the scalar state written by _state_payload."""
         self._baseline_lifetime = data.get("lifetime_volume", 0.0)
         self._baseline_hourly = data.get("hourly_volume", 0.0)
         self._hourly_reset = self._parse_dt(data.get("hourly_reset"), now)
@@ -703,13 +1475,85 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
         self._hourly_max_flow = data.get("hourly_max_flow", 0.0)
         self._hourly_min_flow = data.get("hourly_min_flow")
 
-        self._flow_samples = [(s[0], s[1]) for s in data.get("flow_samples", [])]
-        self._hourly_consumption = [(s[0], s[1]) for s in data.get("hourly_consumption", [])]
-        self._daily_consumption = [(s[0], s[1]) for s in data.get("daily_consumption", [])]
-        self._hourly_flow_stats = [(s[0], s[1], s[2]) for s in data.get("hourly_flow_stats", [])]
-
         self._water_leak_detected = data.get("water_leak_detected", False)
 
+    def _load_buffers(self, buffers: dict[str, Any]) -> None:
+        """Restore the statistics buffers from packed columns."""
+        try:
+            columns = {key: unpack_columns(header) for key, header in buffers.items()}
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Discarding unreadable statistics buffers: %s", err)
+            return
+
+        if "flow_samples" in columns:
+            self._flow_samples.load_columns(*columns["flow_samples"])
+        if "flow_minutes" in columns:
+            self._flow_minutes.load_columns(columns["flow_minutes"])
+        if "flow_quarters" in columns:
+            self._flow_quarters.load_columns(columns["flow_quarters"])
+        for ts, volume in zip(*columns.get("hourly_consumption", ((), ())), strict=True):
+            self._record_hourly_consumption(ts, volume)
+        for ts, volume in zip(*columns.get("daily_consumption", ((), ())), strict=True):
+            self._record_daily_consumption(ts, volume)
+        for ts, max_flow, min_flow in zip(
+            *columns.get("hourly_flow_stats", ((), (), ())), strict=True
+        ):
+            self._record_hourly_flow_stats(ts, max_flow, min_flow)
+        for row in zip(*columns.get("usage_events", ((), (), (), ())), strict=True):
+            self._record_usage_event(*row)
+
+    def _replay_journal(self, records: list[list[Any]], now: datetime) -> None:
+        """Apply journal records written after the last snapshot."""
+        for record in records:
+            kind = record[0]
+            if kind == RECORD_FLOW_SAMPLE:
+                self._flow_samples.append(record[1], record[2])
+            elif kind == RECORD_HOUR:
+                self._record_hourly_consumption(record[1], record[2])
+                if record[3] is not None and record[4] is not None:
+                    self._record_hourly_flow_stats(record[1], record[3], record[4])
+            elif kind == RECORD_DAY:
+                self._record_daily_consumption(record[1], record[2])
+            elif kind == RECORD_USAGE:
+                self._record_usage_event(*record[1:5])
+            elif kind == RECORD_CHECKPOINT:
+                self._apply_state_payload(record[1], now)
+
+    async def _async_load_data(self) -> None:
+        """Load the last snapshot from store and replay the journal on top."""
+        data = await self._store.async_load()
+        if data:
+            self._journal.epoch = data.get("journal_epoch", 0)
+            self._cached_metadata = data.get("device", {})
+        records = await self._journal.async_read()
+        if not data and not records:
+            return
+
+        # Only cumulative values are restored; instantaneous readings such
+        # as the flow rate stay unavailable until the device sends them
+        self._stale = True
+        now = dt_util.now()
+
+        self._flow_samples.clear()
+        self._flow_minutes.clear()
+        self._flow_quarters.clear()
+        self._clear_period_statistics()
+        self._usage_events.clear()
+        self._last_usage = None
+        if data:
+            self._apply_state_payload(data, now)
+            self._load_buffers(data.get("buffers", {}))
+        self._replay_journal(records, now)
+        self._trim_buffers(now.timestamp())
+        self._trim_period_buffers(now.timestamp())
+
+        # Replayed journal records are not in the snapshot yet
+        self._packed_sections.clear()
+        if records:
+            self._mark_dirty(*BUFFER_COLUMNS)
+        else:
+            self._saved_generation = self._generation
+
     @staticmethod
     def _parse_dt(value: str | None, default: datetime) -> datetime:
         """Parse ISO datetime string, returning default on failure."""
@@ -7,12 +7,29 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
-from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.components.homeassistant.triggers import event as event_trigger
+from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_PLATFORM, CONF_TYPE
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    EVENT_DEVICE_TRIGGER,
+    EVENT_HIGH_FLOW_CLEARED,
+    EVENT_HIGH_FLOW_DETECTED,
+    EVENT_WATER_USAGE,
+    TRIGGER_DEVICE_OFFLINE,
+    TRIGGER_DEVICE_ONLINE,
+)
 
-TRIGGER_TYPES = {"device_offline", "device_online"}
+TRIGGER_TYPES = {
+    TRIGGER_DEVICE_OFFLINE,
+    TRIGGER_DEVICE_ONLINE,
+    EVENT_HIGH_FLOW_DETECTED,
+    EVENT_HIGH_FLOW_CLEARED,
+    EVENT_WATER_USAGE,
+}
 
 TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
     {
@@ -28,9 +45,32 @@ async def async_get_triggers(
     """Return a list of triggers."""
     return [
         {
+            CONF_PLATFORM: "device",
             CONF_DEVICE_ID: device_id,
             CONF_DOMAIN: DOMAIN,
             CONF_TYPE: trigger_type,
         }
         for trigger_type in TRIGGER_TYPES
     ]
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Listen for the coordinator's trigger events of the configured device and type."""
+    event_config = event_trigger.TRIGGER_SCHEMA(
+        {
+            event_trigger.CONF_PLATFORM: "event",
+            event_trigger.CONF_EVENT_TYPE: EVENT_DEVICE_TRIGGER,
+            event_trigger.CONF_EVENT_DATA: {
+                CONF_DEVICE_ID: config[CONF_DEVICE_ID],
+                CONF_TYPE: config[CONF_TYPE],
+            },
+        }
+    )
+    return await event_trigger.async_attach_trigger(
+        hass, event_config, action, trigger_info, platform_type="device"
+    )
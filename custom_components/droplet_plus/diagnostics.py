@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Any
 
 from homeassistant.core import HomeAssistant
@@ -19,6 +20,7 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     coordinator = entry.runtime_data
+    snapshot = coordinator.data
 
     config_data = {
         "entry_id": entry.entry_id,
@@ -34,34 +36,79 @@ async def async_get_config_entry_diagnostics(
         "manufacturer": coordinator.device_manufacturer,
         "firmware": coordinator.device_firmware,
         "serial_number": "**REDACTED**",
-        "available": coordinator.available,
+        "available": snapshot.available,
+        "stale": snapshot.stale,
     }
 
     coordinator_data = {
-        "lifetime_volume": coordinator.lifetime_volume,
-        "hourly_volume": coordinator.hourly_volume,
-        "daily_volume": coordinator.daily_volume,
-        "weekly_volume": coordinator.weekly_volume,
-        "monthly_volume": coordinator.monthly_volume,
-        "yearly_volume": coordinator.yearly_volume,
-        "flow_rate": coordinator.flow_rate,
-        "server_status": coordinator.server_status,
-        "signal_quality": coordinator.signal_quality,
-        "water_leak_detected": coordinator.water_leak_detected,
+        "lifetime_volume": snapshot.lifetime_volume,
+        "hourly_volume": snapshot.hourly_volume,
+        "daily_volume": snapshot.daily_volume,
+        "weekly_volume": snapshot.weekly_volume,
+        "monthly_volume": snapshot.monthly_volume,
+        "yearly_volume": snapshot.yearly_volume,
+        "flow_rate": snapshot.flow_rate,
+        "server_status": snapshot.server_status,
+        "signal_quality": snapshot.signal_quality,
+        "water_leak_detected": snapshot.water_leak_detected,
         "water_tariff": coordinator.water_tariff,
         "water_leak_threshold": coordinator.water_leak_threshold,
+        "water_leak_duration": coordinator.water_leak_duration,
+        "high_flow_detected": coordinator.high_flow_detected,
+        "high_flow_threshold": coordinator.high_flow_threshold,
+        "high_flow_duration": coordinator.high_flow_duration,
+    }
+
+    flow_run = coordinator.flow_run
+    flow_run_data = {
+        "active": flow_run.active,
+        "start": flow_run.start,
+        "duration": flow_run.duration(),
+        "volume": flow_run.volume,
+        "min_flow": flow_run.min_flow,
+        "mean_flow": flow_run.mean_flow,
+    }
+
+    usage_run = coordinator.usage_run
+    usage_data = {
+        "in_progress": usage_run.active,
+        "start": usage_run.start,
+        "volume": usage_run.volume,
+        "peak_flow": usage_run.max_flow,
+        "recent": [
+            {**asdict(event), "duration": event.duration}
+            for event in coordinator.usage_events[-10:]
+        ],
     }
 
     buffer_data = {
         "flow_samples_count": coordinator.flow_samples_count,
+        "flow_samples_bytes": coordinator.flow_samples_nbytes,
         "hourly_consumption_count": coordinator.hourly_consumption_count,
         "daily_consumption_count": coordinator.daily_consumption_count,
         "hourly_flow_stats_count": coordinator.hourly_flow_stats_count,
+        "flow_minutes_count": coordinator.flow_minutes_count,
+        "flow_quarters_count": coordinator.flow_quarters_count,
+        "flow_tiers_bytes": coordinator.flow_tiers_nbytes,
+        "unsaved_changes": coordinator.has_unsaved_changes,
+    }
+
+    importer = coordinator.statistics_importer
+    long_term_data = {
+        "statistic_id": importer.statistic_id,
+        "enabled": importer.enabled,
+        "pending_count": importer.pending_count,
+        "last_start": importer.last_start,
     }
 
     return {
         "config": config_data,
         "device": device_data,
         "coordinator": coordinator_data,
+        "flow_run": flow_run_data,
+        "usage_events": usage_data,
         "buffers": buffer_data,
+        "long_term_statistics": long_term_data,
+        "hot_path": coordinator.profiler.as_dict(),
+        "health": asdict(coordinator.health),
     }
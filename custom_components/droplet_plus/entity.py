@@ -0,0 +1,84 @@
+"""Base entity for Droplet."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import ATTR_STALE
+from .coordinator import DropletCoordinator
+
+
+class DropletEntity(CoordinatorEntity[DropletCoordinator]):
+    """Base class for Droplet entities.
+
+    Coordinator updates arrive on every WebSocket frame; the entity only
+    writes its state when the visible state (as returned by
+    _state_fingerprint) differs from what was last written. Entities with
+    _slow_update set refresh their value on the coordinator's slow channel
+    and only follow per-frame updates for availability changes.
+
+    After a restart, entities show the cumulative values restored from the
+    previous run with a stale attribute until the first device frame.
+    """
+
+    _attr_has_entity_name = True
+    _last_written: tuple[Hashable, ...] | None = None
+    _slow_update: bool = False
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        data = self.coordinator.data
+        return data.available or data.stale
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag values restored from the previous run."""
+        if self.coordinator.data.stale:
+            return {ATTR_STALE: True}
+        return None
+
+    async def async_added_to_hass(self) -> None:
+        """Record the initial state and subscribe to the slow update channel when requested."""
+        await super().async_added_to_hass()
+        # The platform writes the initial state right after this returns
+        self._last_written = self._write_fingerprint()
+        if self._slow_update:
+            self.async_on_remove(
+                self.coordinator.async_add_slow_listener(self._async_write_if_changed)
+            )
+
+    def _state_fingerprint(self) -> tuple[Hashable, ...]:
+        """Return the values that make up the visible state of the entity.
+
+        The first element must be the availability of the entity.
+        """
+        return (self.available,)
+
+    def _write_fingerprint(self) -> tuple[Hashable, ...]:
+        """Return the state fingerprint followed by the stale flag."""
+        return (*self._state_fingerprint(), self.coordinator.data.stale)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle a per-frame coordinator update."""
+        if (
+            self._slow_update
+            and self._last_written is not None
+            and self._last_written[0] == self.available
+        ):
+            return
+        self._async_write_if_changed()
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        """Write state only if the visible state changed since the last write."""
+        fingerprint = self._write_fingerprint()
+        if fingerprint == self._last_written:
+            return
+        self._last_written = fingerprint
+        self.async_write_ha_state()
@@ -6,13 +6,19 @@ from typing import ClassVar
 
 from homeassistant.components.event import EventEntity
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DropletConfigEntry
-from .const import DOMAIN, EVENT_WATER_LEAK_CLEARED, EVENT_WATER_LEAK_DETECTED, KEY_WATER_LEAK
+from .const import (
+    EVENT_HIGH_FLOW_CLEARED,
+    EVENT_HIGH_FLOW_DETECTED,
+    EVENT_WATER_LEAK_CLEARED,
+    EVENT_WATER_LEAK_DETECTED,
+    KEY_HIGH_FLOW,
+    KEY_WATER_LEAK,
+)
 from .coordinator import DropletCoordinator
+from .entity import DropletEntity
 
 PARALLEL_UPDATES = 0
 
@@ -24,35 +30,65 @@ async def async_setup_entry(
 ) -> None:
     """Set up Droplet event entities."""
     coordinator = entry.runtime_data
-    async_add_entities([DropletLeakEvent(coordinator)])
+    async_add_entities([DropletLeakEvent(coordinator), DropletHighFlowEvent(coordinator)])
 
 
-class DropletLeakEvent(CoordinatorEntity[DropletCoordinator], EventEntity):
-    """Representation of the Droplet water leak event."""
-
-    _attr_has_entity_name = True
-    _attr_translation_key = KEY_WATER_LEAK
-    _attr_event_types: ClassVar[list[str]] = [EVENT_WATER_LEAK_DETECTED, EVENT_WATER_LEAK_CLEARED]
+class DropletEvent(DropletEntity, EventEntity):
+    """Base class for Droplet events fired from a pending coordinator event."""
 
     def __init__(self, coordinator: DropletCoordinator) -> None:
         """Initialize the event entity."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.unique_id}_{KEY_WATER_LEAK}_event"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.unique_id)},
-        )
+        self._attr_unique_id = f"{coordinator.unique_id}_{self._attr_translation_key}_event"
+        self._attr_device_info = coordinator.device_info
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.available
+    def _pop_pending_event(self) -> tuple[str, dict[str, float]] | None:
+        """Return and consume the coordinator's pending event for this entity."""
+        raise NotImplementedError
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle coordinator update and fire pending leak events."""
-        pending = self.coordinator.pending_leak_event
-        if pending:
-            event_type, event_data = pending
-            self._trigger_event(event_type, event_data)
-            self.coordinator.consume_leak_event()
+        """Handle coordinator update and fire the pending event, if any."""
+        if pending := self._pop_pending_event():
+            self._fire(*pending)
+            return
+        super()._handle_coordinator_update()
+
+    @callback
+    def _fire(self, event_type: str, event_data: dict[str, float]) -> None:
+        """Trigger an event and write it to the state machine."""
+        self._trigger_event(event_type, event_data)
+        self._last_written = self._write_fingerprint()
         self.async_write_ha_state()
+
+
+class DropletLeakEvent(DropletEvent):
+    """Representation of the Droplet water leak event."""
+
+    _attr_translation_key = KEY_WATER_LEAK
+    _attr_event_types: ClassVar[list[str]] = [
+        EVENT_WATER_LEAK_DETECTED,
+        EVENT_WATER_LEAK_CLEARED,
+    ]
+
+    def _pop_pending_event(self) -> tuple[str, dict[str, float]] | None:
+        """Return and consume the pending leak event."""
+        if pending := self.coordinator.pending_leak_event:
+            self.coordinator.consume_leak_event()
+        return pending
+
+
+class DropletHighFlowEvent(DropletEvent):
+    """Representation of the Droplet high flow event."""
+
+    _attr_translation_key = KEY_HIGH_FLOW
+    _attr_event_types: ClassVar[list[str]] = [
+        EVENT_HIGH_FLOW_DETECTED,
+        EVENT_HIGH_FLOW_CLEARED,
+    ]
+
+    def _pop_pending_event(self) -> tuple[str, dict[str, float]] | None:
+        """Return and consume the pending high flow event."""
+        if pending := self.coordinator.pending_high_flow_event:
+            self.coordinator.consume_high_flow_event()
+        return pending
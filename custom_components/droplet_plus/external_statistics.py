@@ -0,0 +1,112 @@
+"""Long-term statistics import for Droplet."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfVolume
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.unit_conversion import VolumeConverter
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DropletStatisticsImporter:
+    """Batched import of finalized hourly volumes as external statistics.
+
+    Finalized hours are queued with a running sum and written to the
+    recorder in a single call per flush. The recorder derives daily,
+    weekly and monthly totals from the hourly rows, so years of history
+    are kept without a state row per WebSocket frame. Hours at or before
+    the last imported one are skipped, so a restart never imports an hour
+    twice.
+    """
+
+    def __init__(self, hass: HomeAssistant, statistic_id: str, name: str) -> None:
+        """Initialize the importer."""
+        self._hass = hass
+        self._metadata = StatisticMetaData(
+            has_sum=True,
+            mean_type=StatisticMeanType.NONE,
+            name=name,
+            source=DOMAIN,
+            statistic_id=statistic_id,
+            unit_class=VolumeConverter.UNIT_CLASS,
+            unit_of_measurement=UnitOfVolume.LITERS,
+        )
+        self._pending: list[StatisticData] = []
+        self._enabled: bool = False
+        self._last_start: float | None = None
+        self._sum: float = 0.0
+
+    @property
+    def statistic_id(self) -> str:
+        """Return the external statistic ID."""
+        return self._metadata["statistic_id"]
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if the recorder is available for imports."""
+        return self._enabled
+
+    @property
+    def pending_count(self) -> int:
+        """Return the number of hours queued for the next flush."""
+        return len(self._pending)
+
+    @property
+    def last_start(self) -> float | None:
+        """Return the start timestamp of the last imported or queued hour."""
+        return self._last_start
+
+    async def async_setup(self) -> None:
+        """Continue the running sum from the last imported hour."""
+        if "recorder" not in self._hass.config.components:
+            _LOGGER.debug("Recorder not loaded, not importing %s", self.statistic_id)
+            return
+        last = await get_instance(self._hass).async_add_executor_job(
+            get_last_statistics, self._hass, 1, self.statistic_id, True, {"sum"}
+        )
+        if rows := last.get(self.statistic_id):
+            self._last_start = rows[0]["start"]
+            self._sum = rows[0].get("sum") or 0.0
+        self._enabled = True
+
+    @callback
+    def add_hour(self, start: datetime, volume: float) -> None:
+        """Queue the volume of the local hour starting at start.
+
+        The recorder requires start to be on the hour in its own time zone
+        and stores it in UTC, so local hours in half-hour offset zones keep
+        their own rows.
+        """
+        if not self._enabled:
+            return
+        start_ts = start.timestamp()
+        if self._last_start is not None and start_ts <= self._last_start:
+            return
+        self._sum += volume
+        self._last_start = start_ts
+        self._pending.append(StatisticData(start=start, state=volume, sum=self._sum))
+
+    @callback
+    def async_flush(self) -> int:
+        """Import queued hours in one batch, returning how many were imported."""
+        if not self._pending:
+            return 0
+        statistics, self._pending = self._pending, []
+        async_add_external_statistics(self._hass, self._metadata, statistics)
+        return len(statistics)
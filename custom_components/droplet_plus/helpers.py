@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime, timedelta
 
 
@@ -70,60 +71,33 @@ def next_year(now: datetime) -> datetime:
     return now.replace(year=now.year + 1, month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
 
 
-def compute_average(
-    samples: list[tuple[float, float]], max_age: float, now_ts: float
-) -> float | None:
-    """Compute average from timestamped samples within max_age window.
+def missed_period_starts(
+    last_reset: datetime,
+    now: datetime,
+    next_start: Callable[[datetime], datetime],
+    max_age: float,
+) -> list[datetime]:
+    """Return the starts of whole periods that passed between last_reset and now.
 
-    Args:
-        samples: List of (timestamp, value) tuples.
-        max_age: Maximum age in seconds for samples to include.
-        now_ts: Current timestamp for age calculation.
-
-    Returns:
-        Average value or None if no valid samples.
-
-    """
-    cutoff = now_ts - max_age
-    valid = [v for ts, v in samples if ts >= cutoff]
-    if not valid:
-        return None
-    return sum(valid) / len(valid)
-
-
-def compute_max(samples: list[tuple[float, float]], max_age: float, now_ts: float) -> float | None:
-    """Compute maximum from timestamped samples within max_age window.
-
-    Args:
-        samples: List of (timestamp, value) tuples.
-        max_age: Maximum age in seconds for samples to include.
-        now_ts: Current timestamp for age calculation.
-
-    Returns:
-        Maximum value or None if no valid samples.
-
-    """
-    cutoff = now_ts - max_age
-    valid = [v for ts, v in samples if ts >= cutoff]
-    if not valid:
-        return None
-    return max(valid)
-
-
-def compute_min(samples: list[tuple[float, float]], max_age: float, now_ts: float) -> float | None:
-    """Compute minimum from timestamped samples within max_age window.
+    The period containing last_reset and the period containing now are not
+    included. Only periods starting within max_age seconds of now are
+    returned, so a long downtime produces at most one window of slots.
 
     Args:
-        samples: List of (timestamp, value) tuples.
-        max_age: Maximum age in seconds for samples to include.
-        now_ts: Current timestamp for age calculation.
+        last_reset: Reset timestamp of the last period that was tracked.
+        now: Current local time.
+        next_start: Function returning the start of the next period (e.g. next_hour).
+        max_age: Maximum age in seconds of the returned period starts.
 
     Returns:
-        Minimum value or None if no valid samples.
+        Period starts in chronological order.
 
     """
-    cutoff = now_ts - max_age
-    valid = [v for ts, v in samples if ts >= cutoff]
-    if not valid:
-        return None
-    return min(valid)
+    cutoff = now.timestamp() - max_age
+    starts: list[datetime] = []
+    start = next_start(last_reset)
+    while (end := next_start(start)) <= now:
+        if start.timestamp() >= cutoff:
+            starts.append(start)
+        start = end
+    return starts
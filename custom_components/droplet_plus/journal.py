@@ -0,0 +1,154 @@
+"""Append-only persistence journal for Droplet."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# Record types (first element of every journal record)
+RECORD_FLOW_SAMPLE = "f"  # ["f", ts, flow L/min]
+RECORD_HOUR = "h"  # ["h", ts, volume L, max flow | None, min flow | None]
+RECORD_DAY = "d"  # ["d", ts, volume L]
+RECORD_USAGE = "u"  # ["u", start ts, end ts, volume L, peak flow L/min]
+RECORD_CHECKPOINT = "c"  # ["c", {volumes, period resets, leak state}]
+RECORD_EPOCH = "e"  # ["e", epoch], written before the first record after a compaction
+
+
+class DropletJournal:
+    """Append-only journal of changes made since the last full snapshot.
+
+    Records are buffered in memory and appended to the journal file as JSON
+    lines on flush, so each write only carries what changed. Compaction
+    writes a full snapshot through the caller's save function and truncates
+    the journal; on startup the journal is replayed on top of that snapshot.
+
+    Each compaction starts a new epoch, which the snapshot stores. Records
+    are only replayed if they belong to the snapshot's epoch, so a crash
+    between writing the snapshot and truncating the journal cannot apply
+    the same changes twice.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: Path) -> None:
+        """Initialize the journal."""
+        self._hass = hass
+        self._path = path
+        self._pending: list[list[Any]] = []
+        self._pending_events: bool = False
+        self._lock = asyncio.Lock()
+        self._epoch: int = 0
+        self._header_written: bool = False
+
+    @property
+    def epoch(self) -> int:
+        """Return the current journal epoch (stored with each snapshot)."""
+        return self._epoch
+
+    @epoch.setter
+    def epoch(self, value: int) -> None:
+        """Continue the epoch of a loaded snapshot."""
+        self._epoch = value
+
+    @property
+    def pending_count(self) -> int:
+        """Return the number of records not yet written to disk."""
+        return len(self._pending)
+
+    @property
+    def has_pending_events(self) -> bool:
+        """Return True if records other than flow samples await a flush."""
+        return self._pending_events
+
+    def append(self, record: list[Any]) -> None:
+        """Buffer a record for the next flush."""
+        self._pending.append(record)
+        if record[0] != RECORD_FLOW_SAMPLE:
+            self._pending_events = True
+
+    async def async_flush(self) -> int:
+        """Append buffered records to the journal file, returning how many were written."""
+        async with self._lock:
+            if not self._pending:
+                return 0
+            records, self._pending = self._pending, []
+            self._pending_events = False
+            if not self._header_written:
+                records.insert(0, [RECORD_EPOCH, self._epoch])
+                self._header_written = True
+            lines = "".join(f"{json.dumps(record, separators=(',', ':'))}\n" for record in records)
+            await self._hass.async_add_executor_job(_append_lines, self._path, lines)
+            return len(records)
+
+    async def async_compact(self, save: Callable[[], Awaitable[None]]) -> None:
+        """Write a full snapshot and truncate the journal.
+
+        Buffered records are dropped before save() is awaited: save() must
+        capture the full state synchronously, before its first await, so
+        those records are already part of the snapshot.
+        """
+        async with self._lock:
+            records, self._pending = self._pending, []
+            pending_events, self._pending_events = self._pending_events, False
+            header_written = self._header_written
+            self._epoch += 1
+            self._header_written = False
+            try:
+                await save()
+            except Exception:
+                # Keep journaling into the previous epoch
+                self._epoch -= 1
+                self._header_written = header_written
+                self._pending[:0] = records
+                self._pending_events = self._pending_events or pending_events
+                raise
+            await self._hass.async_add_executor_job(_truncate, self._path)
+
+    async def async_read(self) -> list[list[Any]]:
+        """Return the records of the current epoch in the journal file, oldest first."""
+        lines = await self._hass.async_add_executor_job(_read_lines, self._path)
+        records: list[list[Any]] = []
+        epoch: int | None = None
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A crash mid-append can leave a truncated last line
+                _LOGGER.debug("Skipping malformed journal record in %s", self._path)
+                continue
+            if not isinstance(record, list) or not record:
+                continue
+            if record[0] == RECORD_EPOCH:
+                epoch = record[1]
+            elif epoch == self._epoch:
+                records.append(record)
+        return records
+
+
+def _append_lines(path: Path, lines: str) -> None:
+    """Append lines to the journal file and sync them to disk."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as file:
+        file.write(lines)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def _read_lines(path: Path) -> list[str]:
+    """Read all non-empty lines of the journal file."""
+    if not path.exists():
+        return []
+    with path.open(encoding="utf-8") as file:
+        return [line for line in file if line.strip()]
+
+
+def _truncate(path: Path) -> None:
+    """Remove the journal file."""
+    path.unlink(missing_ok=True)
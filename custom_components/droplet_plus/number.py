@@ -2,28 +2,35 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription, NumberMode
-from homeassistant.const import EntityCategory, UnitOfVolumeFlowRate
+from homeassistant.const import EntityCategory, UnitOfTime, UnitOfVolumeFlowRate
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
 from . import DropletConfigEntry
 from .const import (
+    CONF_HIGH_FLOW_DURATION,
+    CONF_HIGH_FLOW_THRESHOLD,
+    CONF_WATER_LEAK_DURATION,
     CONF_WATER_LEAK_THRESHOLD,
     CONF_WATER_TARIFF,
+    DEFAULT_HIGH_FLOW_DURATION,
+    DEFAULT_HIGH_FLOW_THRESHOLD,
+    DEFAULT_WATER_LEAK_DURATION,
     DEFAULT_WATER_LEAK_THRESHOLD,
     DEFAULT_WATER_TARIFF,
-    DOMAIN,
+    KEY_HIGH_FLOW_DURATION,
+    KEY_HIGH_FLOW_THRESHOLD,
+    KEY_WATER_LEAK_DURATION,
     KEY_WATER_LEAK_THRESHOLD,
     KEY_WATER_TARIFF,
 )
 from .coordinator import DropletCoordinator
+from .entity import DropletEntity
 
 PARALLEL_UPDATES = 0
 
@@ -71,6 +78,42 @@ def _get_tariff_descriptions(
             default_value=DEFAULT_WATER_LEAK_THRESHOLD,
             value_fn=lambda c: c.water_leak_threshold,
         ),
+        DropletNumberEntityDescription(
+            key=KEY_WATER_LEAK_DURATION,
+            entity_category=EntityCategory.CONFIG,
+            native_min_value=1,
+            native_max_value=1440,
+            native_step=1,
+            mode=NumberMode.BOX,
+            native_unit_of_measurement=UnitOfTime.MINUTES,
+            option_key=CONF_WATER_LEAK_DURATION,
+            default_value=DEFAULT_WATER_LEAK_DURATION,
+            value_fn=lambda c: c.water_leak_duration // 60,
+        ),
+        DropletNumberEntityDescription(
+            key=KEY_HIGH_FLOW_THRESHOLD,
+            entity_category=EntityCategory.CONFIG,
+            native_min_value=0,
+            native_max_value=200,
+            native_step=0.1,
+            mode=NumberMode.BOX,
+            native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
+            option_key=CONF_HIGH_FLOW_THRESHOLD,
+            default_value=DEFAULT_HIGH_FLOW_THRESHOLD,
+            value_fn=lambda c: c.high_flow_threshold,
+        ),
+        DropletNumberEntityDescription(
+            key=KEY_HIGH_FLOW_DURATION,
+            entity_category=EntityCategory.CONFIG,
+            native_min_value=0,
+            native_max_value=600,
+            native_step=1,
+            mode=NumberMode.BOX,
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+            option_key=CONF_HIGH_FLOW_DURATION,
+            default_value=DEFAULT_HIGH_FLOW_DURATION,
+            value_fn=lambda c: c.high_flow_duration,
+        ),
     )
 
 
@@ -85,10 +128,9 @@ async def async_setup_entry(
     async_add_entities(DropletNumber(coordinator, description) for description in descriptions)
 
 
-class DropletNumber(CoordinatorEntity[DropletCoordinator], NumberEntity):
+class DropletNumber(DropletEntity, NumberEntity):
     """Representation of a Droplet number entity."""
 
-    _attr_has_entity_name = True
     entity_description: DropletNumberEntityDescription
 
     def __init__(
@@ -101,20 +143,17 @@ class DropletNumber(CoordinatorEntity[DropletCoordinator], NumberEntity):
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.unique_id}_{description.key}"
         self._attr_translation_key = description.key
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.unique_id)},
-        )
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.available
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float:
         """Return the current value."""
         return self.entity_description.value_fn(self.coordinator)
 
+    def _state_fingerprint(self) -> tuple[Hashable, ...]:
+        """Return the visible state of the number entity."""
+        return (self.available, self.native_value)
+
     async def async_set_native_value(self, value: float) -> None:
         """Update the value."""
         self.hass.config_entries.async_update_entry(
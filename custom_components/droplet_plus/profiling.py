@@ -0,0 +1,200 @@
+"""Hot path timing for Droplet."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Any
+
+# Durations kept per stage (a power of two); older ones are overwritten
+TIMING_WINDOW = 1024
+
+# Upper bounds (µs) of the histogram buckets; longer durations land in "inf"
+HISTOGRAM_BOUNDS_US = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+_HISTOGRAM_BOUNDS_NS = [bound * 1000 for bound in HISTOGRAM_BOUNDS_US]
+_HISTOGRAM_KEYS = [*map(str, HISTOGRAM_BOUNDS_US), "inf"]
+
+# _on_update stages, in execution order
+STAGE_READ = "read"  # pydroplet flow rate and volume reads
+STAGE_RECORD = "record"  # hourly extremes, flow sample buffer and journal
+STAGE_TRIM = "trim"  # flow sample expiry and tier roll-up
+STAGE_FLOW_ANALYSIS = "flow_analysis"  # leak, high flow and usage event evaluation
+STAGE_SNAPSHOT = "snapshot"  # snapshot build (period totals, costs, statistics)
+STAGE_FANOUT = "fanout"  # per-frame listeners and entity state writes
+STAGE_TOTAL = "total"  # whole _on_update call
+
+FRAME_STAGES = (
+    STAGE_READ,
+    STAGE_RECORD,
+    STAGE_TRIM,
+    STAGE_FLOW_ANALYSIS,
+    STAGE_SNAPSHOT,
+    STAGE_FANOUT,
+    STAGE_TOTAL,
+)
+_FRAME_WIDTH = len(FRAME_STAGES)
+
+# Period rollover timer, timed alongside the per-frame stages
+STAGE_ROLLOVER = "rollover"
+
+
+class TimingWindow:
+    """Fixed-size ring of the most recent durations, in nanoseconds.
+
+    Durations live in one preallocated int64 array (8 bytes each) and adding
+    one is a single store; statistics are computed on demand.
+    """
+
+    __slots__ = ("_count", "_mask", "_samples")
+
+    def __init__(self, size: int = TIMING_WINDOW) -> None:
+        self._samples = array("q", bytes(8 * size))
+        self._mask = size - 1
+        self._count = 0
+
+    def __len__(self) -> int:
+        return min(self._count, len(self._samples))
+
+    @property
+    def total_count(self) -> int:
+        """Return the number of durations added since creation."""
+        return self._count
+
+    def add(self, duration_ns: int) -> None:
+        """Add a duration, overwriting the oldest one when full."""
+        count = self._count
+        self._samples[count & self._mask] = duration_ns
+        self._count = count + 1
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the duration (µs) at fraction (0-1) of the window, or None if empty."""
+        if not (count := len(self)):
+            return None
+        return _rank(sorted(self._samples[:count]), fraction)
+
+    def summary(self) -> dict[str, Any]:
+        """Return count, mean, percentiles, maximum and histogram of the window (µs)."""
+        return summarize(self._samples[: len(self)], self._count)
+
+
+class HotPathProfiler:
+    """Per-stage durations of the WebSocket callback and frame inter-arrival times.
+
+    Each timed frame stores one row with the duration of every stage, so
+    the callback pays for a single call regardless of the stage count.
+    Timestamps come from time.perf_counter_ns, a monotonic clock, so wall
+    clock changes never show up as negative or huge durations.
+    """
+
+    __slots__ = ("_count", "_frames", "_last_frame_ns", "_mask", "inter_arrival", "rollover")
+
+    def __init__(self, size: int = TIMING_WINDOW) -> None:
+        self._frames = array("q", bytes(8 * size * _FRAME_WIDTH))
+        self._mask = size - 1
+        self._count = 0
+        self._last_frame_ns: int | None = None
+        self.inter_arrival = TimingWindow(size)
+        self.rollover = TimingWindow(size)
+
+    @property
+    def frame_count(self) -> int:
+        """Return the number of timed frames since creation."""
+        return self._count
+
+    @property
+    def last_frame_ns(self) -> int | None:
+        """Return the perf_counter_ns timestamp of the last frame, if any."""
+        return self._last_frame_ns
+
+    def frame(self, now_ns: int) -> None:
+        """Record the arrival of a WebSocket frame."""
+        if self._last_frame_ns is not None:
+            self.inter_arrival.add(now_ns - self._last_frame_ns)
+        self._last_frame_ns = now_ns
+
+    def record(
+        self,
+        began: int,
+        read: int,
+        record: int,
+        trim: int,
+        analysis: int,
+        snapshot: int,
+        end: int,
+    ) -> None:
+        """Store the stage durations of one frame, given the time each stage ended."""
+        count = self._count
+        row = (count & self._mask) * _FRAME_WIDTH
+        frames = self._frames
+        frames[row] = read - began
+        frames[row + 1] = record - read
+        frames[row + 2] = trim - record
+        frames[row + 3] = analysis - trim
+        frames[row + 4] = snapshot - analysis
+        frames[row + 5] = end - snapshot
+        frames[row + 6] = end - began
+        self._count = count + 1
+
+    def stage_durations(self, stage: str) -> Sequence[int]:
+        """Return the retained durations (ns) of a frame stage, in ring order."""
+        rows = min(self._count, self._mask + 1)
+        return self._frames[FRAME_STAGES.index(stage) : rows * _FRAME_WIDTH : _FRAME_WIDTH]
+
+    def percentile(self, stage: str, fraction: float) -> float | None:
+        """Return the duration (µs) of a frame stage at fraction (0-1), or None if untimed."""
+        if not (durations := self.stage_durations(stage)):
+            return None
+        return _rank(sorted(durations), fraction)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary of every stage and the inter-arrival times."""
+        stages = {
+            stage: summarize(self.stage_durations(stage), self._count) for stage in FRAME_STAGES
+        }
+        stages[STAGE_ROLLOVER] = self.rollover.summary()
+        return {"stages": stages, "inter_arrival": self.inter_arrival.summary()}
+
+    def log_line(self) -> str:
+        """Return a one-line p50/p95 (µs) summary of the stages that have run."""
+        parts = []
+        if self._count:
+            parts.extend(
+                f"{stage} {self.percentile(stage, 0.5)}/{self.percentile(stage, 0.95)}"
+                for stage in FRAME_STAGES
+            )
+        for name, window in (
+            (STAGE_ROLLOVER, self.rollover),
+            ("inter-arrival", self.inter_arrival),
+        ):
+            if len(window):
+                parts.append(f"{name} {window.percentile(0.5)}/{window.percentile(0.95)}")
+        return ", ".join(parts)
+
+
+def summarize(durations: Sequence[int], count: int) -> dict[str, Any]:
+    """Return count, mean, percentiles, maximum and histogram (µs) of durations (ns).
+
+    count is the number of durations recorded since creation, which may
+    exceed the number retained.
+    """
+    if not durations:
+        return {"count": count}
+    ordered = sorted(durations)
+    histogram = dict.fromkeys(_HISTOGRAM_KEYS, 0)
+    for duration in ordered:
+        histogram[_HISTOGRAM_KEYS[bisect_left(_HISTOGRAM_BOUNDS_NS, duration)]] += 1
+    return {
+        "count": count,
+        "mean_us": round(sum(ordered) / len(ordered) / 1000, 2),
+        "p50_us": _rank(ordered, 0.5),
+        "p95_us": _rank(ordered, 0.95),
+        "p99_us": _rank(ordered, 0.99),
+        "max_us": ordered[-1] / 1000,
+        "histogram_us": histogram,
+    }
+
+
+def _rank(ordered: list[int], fraction: float) -> float:
+    """Return the value (µs) at fraction (0-1) of non-empty sorted durations (ns)."""
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)] / 1000
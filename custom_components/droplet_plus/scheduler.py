@@ -0,0 +1,132 @@
+"""Shared timer for the periodic jobs of all Droplet config entries."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import pairwise
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+DATA_SCHEDULER: HassKey[DropletScheduler] = HassKey(DOMAIN)
+
+# Jobs due within this many seconds of a timer firing run in the same pass
+_DUE_TOLERANCE = 0.001
+
+type JobAction = Callable[[datetime], Coroutine[Any, Any, None] | None]
+
+
+@dataclass(slots=True, eq=False)
+class _ScheduledJob:
+    """A periodic job and the UTC timestamp of its next run."""
+
+    job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    interval: float
+    phase: float
+    due: float
+
+
+class DropletScheduler:
+    """Runs the periodic jobs of every config entry from one timer.
+
+    Each job runs every interval seconds at a fixed phase offset. Jobs with
+    the same interval are placed in the middle of the largest gap between
+    the phases already taken, so the journal flushes, saves and statistics
+    refreshes of many Droplets spread over their interval instead of all
+    firing on the same tick. Only the earliest due job holds a loop timer.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._jobs: list[_ScheduledJob] = []
+        self._timer_unsub: CALLBACK_TYPE | None = None
+        self._timer_due: float | None = None
+
+    @property
+    def job_count(self) -> int:
+        """Return the number of scheduled jobs."""
+        return len(self._jobs)
+
+    def phases(self, interval: float) -> list[float]:
+        """Return the sorted phase offsets (seconds) taken for an interval."""
+        return sorted(job.phase for job in self._jobs if job.interval == interval)
+
+    @callback
+    def async_schedule(self, name: str, interval: float, action: JobAction) -> CALLBACK_TYPE:
+        """Run action every interval seconds; return a callback that cancels it."""
+        phase = self._free_phase(interval)
+        now = dt_util.utcnow().timestamp()
+        scheduled = _ScheduledJob(
+            job=HassJob(action, f"{DOMAIN} {name}", cancel_on_shutdown=True),
+            interval=interval,
+            phase=phase,
+            due=now + ((phase - now) % interval or interval),
+        )
+        self._jobs.append(scheduled)
+        self._async_arm()
+
+        @callback
+        def remove() -> None:
+            """Cancel the job."""
+            if scheduled in self._jobs:
+                self._jobs.remove(scheduled)
+                self._async_arm()
+
+        return remove
+
+    def _free_phase(self, interval: float) -> float:
+        """Return the middle of the largest free gap between the phases of an interval."""
+        phases = self.phases(interval)
+        if not phases:
+            return 0.0
+        start, gap = phases[-1], phases[0] + interval - phases[-1]
+        for previous, current in pairwise(phases):
+            if current - previous > gap:
+                start, gap = previous, current - previous
+        return (start + gap / 2) % interval
+
+    @callback
+    def _async_arm(self) -> None:
+        """Point the timer at the earliest due job."""
+        due = min((job.due for job in self._jobs), default=None)
+        if due == self._timer_due:
+            return
+        if self._timer_unsub:
+            self._timer_unsub()
+            self._timer_unsub = None
+        self._timer_due = due
+        if due is not None:
+            self._timer_unsub = async_track_point_in_utc_time(
+                self._hass, self._async_run_due, dt_util.utc_from_timestamp(due)
+            )
+
+    @callback
+    def _async_run_due(self, now: datetime) -> None:
+        """Run every job that is due and re-arm the timer."""
+        self._timer_unsub = None
+        self._timer_due = None
+        timestamp = max(now, dt_util.utcnow()).timestamp() + _DUE_TOLERANCE
+        for scheduled in list(self._jobs):
+            if scheduled.due > timestamp or scheduled not in self._jobs:
+                continue
+            # Runs missed while the loop was blocked are skipped, not queued
+            missed = max(int((timestamp - scheduled.due) // scheduled.interval), 0)
+            scheduled.due += (missed + 1) * scheduled.interval
+            self._hass.async_run_hass_job(scheduled.job, now, background=True)
+        self._async_arm()
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> DropletScheduler:
+    """Return the scheduler shared by all Droplet config entries."""
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = DropletScheduler(hass)
+    return scheduler
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -12,20 +12,23 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import EntityCategory, UnitOfVolume, UnitOfVolumeFlowRate
+from homeassistant.const import EntityCategory, UnitOfTime, UnitOfVolume, UnitOfVolumeFlowRate
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DropletConfigEntry
 from .const import (
-    DOMAIN,
+    KEY_LAST_MESSAGE_AGE,
+    KEY_MESSAGE_RATE,
+    KEY_PROCESSING_TIME_P95,
+    KEY_RECONNECT_COUNT,
     KEY_SERVER_STATUS,
     KEY_SIGNAL_QUALITY,
     KEY_WATER_AVG_DAILY_7D,
     KEY_WATER_AVG_DAILY_30D,
     KEY_WATER_AVG_FLOW_1H,
+    KEY_WATER_AVG_FLOW_24H,
+    KEY_WATER_AVG_FLOW_30D,
     KEY_WATER_AVG_HOURLY_24H,
     KEY_WATER_CONSUMPTION_DAILY,
     KEY_WATER_CONSUMPTION_HOURLY,
@@ -39,6 +42,10 @@ from .const import (
     KEY_WATER_COST_WEEKLY,
     KEY_WATER_COST_YEARLY,
     KEY_WATER_FLOW_RATE,
+    KEY_WATER_LAST_USAGE_DURATION,
+    KEY_WATER_LAST_USAGE_END,
+    KEY_WATER_LAST_USAGE_PEAK_FLOW,
+    KEY_WATER_LAST_USAGE_VOLUME,
     KEY_WATER_MIN_FLOW_24H,
     KEY_WATER_PEAK_DAILY_30D,
     KEY_WATER_PEAK_FLOW_7D,
@@ -48,6 +55,8 @@ from .const import (
     KEY_WATER_VOLUME_DELTA,
 )
 from .coordinator import DropletCoordinator
+from .entity import DropletEntity
+from .snapshot import DropletSnapshot
 
 PARALLEL_UPDATES = 0
 
@@ -56,9 +65,12 @@ PARALLEL_UPDATES = 0
 class DropletSensorEntityDescription(SensorEntityDescription):
     """Describes a Droplet sensor entity."""
 
-    value_fn: Callable[[DropletCoordinator], float | str | None]
-    last_reset_fn: Callable[[DropletCoordinator], datetime | None] = lambda _: None
+    value_fn: Callable[[DropletSnapshot], float | str | datetime | None]
+    last_reset_fn: Callable[[DropletSnapshot], datetime | None] = lambda _: None
     is_cost: bool = False
+    slow_update: bool = False
+    always_available: bool = False  # Stays available while the device is offline
+    live_only: bool = False  # Instantaneous reading, unavailable while values are stale
 
 
 SENSOR_DESCRIPTIONS: tuple[DropletSensorEntityDescription, ...] = (
@@ -68,7 +80,8 @@ SENSOR_DESCRIPTIONS: tuple[DropletSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
-        value_fn=lambda c: c.flow_rate,
+        value_fn=lambda s: s.flow_rate,
+        live_only=True,
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_VOLUME_DELTA,
@@ -77,18 +90,21 @@ SENSOR_DESCRIPTIONS: tuple[DropletSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfVolume.MILLILITERS,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        value_fn=lambda c: c.volume_delta,
-        last_reset_fn=lambda c: c.volume_last_reset,
+        value_fn=lambda s: s.volume_delta,
+        last_reset_fn=lambda s: s.volume_last_reset,
+        live_only=True,
     ),
     DropletSensorEntityDescription(
         key=KEY_SERVER_STATUS,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda c: c.server_status,
+        value_fn=lambda s: s.server_status,
+        live_only=True,
     ),
     DropletSensorEntityDescription(
         key=KEY_SIGNAL_QUALITY,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda c: c.signal_quality,
+        value_fn=lambda s: s.signal_quality,
+        live_only=True,
     ),
     # -- Period consumption sensors --
     DropletSensorEntityDescription(
@@ -96,47 +112,47 @@ SENSOR_DESCRIPTIONS: tuple[DropletSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.TOTAL,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: round(c.hourly_volume, 3),
-        last_reset_fn=lambda c: c.hourly_reset,
+        value_fn=lambda s: round(s.hourly_volume, 3),
+        last_reset_fn=lambda s: s.hourly_reset,
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_CONSUMPTION_DAILY,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.TOTAL,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: round(c.daily_volume, 3),
-        last_reset_fn=lambda c: c.daily_reset,
+        value_fn=lambda s: round(s.daily_volume, 3),
+        last_reset_fn=lambda s: s.daily_reset,
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_CONSUMPTION_WEEKLY,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.TOTAL,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: round(c.weekly_volume, 3),
-        last_reset_fn=lambda c: c.weekly_reset,
+        value_fn=lambda s: round(s.weekly_volume, 3),
+        last_reset_fn=lambda s: s.weekly_reset,
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_CONSUMPTION_MONTHLY,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.TOTAL,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: round(c.monthly_volume, 3),
-        last_reset_fn=lambda c: c.monthly_reset,
+        value_fn=lambda s: round(s.monthly_volume, 3),
+        last_reset_fn=lambda s: s.monthly_reset,
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_CONSUMPTION_YEARLY,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.TOTAL,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: round(c.yearly_volume, 3),
-        last_reset_fn=lambda c: c.yearly_reset,
+        value_fn=lambda s: round(s.yearly_volume, 3),
+        last_reset_fn=lambda s: s.yearly_reset,
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_CONSUMPTION_LIFETIME,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: round(c.lifetime_volume, 3),
+        value_fn=lambda s: round(s.lifetime_volume, 3),
     ),
     # -- Cost sensors --
     DropletSensorEntityDescription(
@@ -144,39 +160,44 @@ SENSOR_DESCRIPTIONS: tuple[DropletSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.MONETARY,
         state_class=SensorStateClass.TOTAL,
         is_cost=True,
-        value_fn=lambda c: round(c.daily_cost, 2),
-        last_reset_fn=lambda c: c.daily_reset,
+        slow_update=True,
+        value_fn=lambda s: round(s.daily_cost, 2),
+        last_reset_fn=lambda s: s.daily_reset,
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_COST_WEEKLY,
         device_class=SensorDeviceClass.MONETARY,
         state_class=SensorStateClass.TOTAL,
         is_cost=True,
-        value_fn=lambda c: round(c.weekly_cost, 2),
-        last_reset_fn=lambda c: c.weekly_reset,
+        slow_update=True,
+        value_fn=lambda s: round(s.weekly_cost, 2),
+        last_reset_fn=lambda s: s.weekly_reset,
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_COST_MONTHLY,
         device_class=SensorDeviceClass.MONETARY,
         state_class=SensorStateClass.TOTAL,
         is_cost=True,
-        value_fn=lambda c: round(c.monthly_cost, 2),
-        last_reset_fn=lambda c: c.monthly_reset,
+        slow_update=True,
+        value_fn=lambda s: round(s.monthly_cost, 2),
+        last_reset_fn=lambda s: s.monthly_reset,
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_COST_YEARLY,
         device_class=SensorDeviceClass.MONETARY,
         state_class=SensorStateClass.TOTAL,
         is_cost=True,
-        value_fn=lambda c: round(c.yearly_cost, 2),
-        last_reset_fn=lambda c: c.yearly_reset,
+        slow_update=True,
+        value_fn=lambda s: round(s.yearly_cost, 2),
+        last_reset_fn=lambda s: s.yearly_reset,
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_COST_LIFETIME,
         device_class=SensorDeviceClass.MONETARY,
         state_class=SensorStateClass.TOTAL_INCREASING,
         is_cost=True,
-        value_fn=lambda c: round(c.lifetime_cost, 2),
+        slow_update=True,
+        value_fn=lambda s: round(s.lifetime_cost, 2),
     ),
     # -- Statistics: flow --
     DropletSensorEntityDescription(
@@ -184,28 +205,48 @@ SENSOR_DESCRIPTIONS: tuple[DropletSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
-        value_fn=lambda c: _round_or_none(c.avg_flow_1h, 3),
+        slow_update=True,
+        value_fn=lambda s: _round_or_none(s.avg_flow_1h, 3),
+    ),
+    DropletSensorEntityDescription(
+        key=KEY_WATER_AVG_FLOW_24H,
+        device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
+        slow_update=True,
+        value_fn=lambda s: _round_or_none(s.avg_flow_24h, 3),
+    ),
+    DropletSensorEntityDescription(
+        key=KEY_WATER_AVG_FLOW_30D,
+        device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
+        slow_update=True,
+        value_fn=lambda s: _round_or_none(s.avg_flow_30d, 3),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_PEAK_FLOW_24H,
         device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
-        value_fn=lambda c: _round_or_none(c.peak_flow_24h, 3),
+        slow_update=True,
+        value_fn=lambda s: _round_or_none(s.peak_flow_24h, 3),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_PEAK_FLOW_7D,
         device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
-        value_fn=lambda c: _round_or_none(c.peak_flow_7d, 3),
+        slow_update=True,
+        value_fn=lambda s: _round_or_none(s.peak_flow_7d, 3),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_MIN_FLOW_24H,
         device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
-        value_fn=lambda c: _round_or_none(c.min_flow_24h, 3),
+        slow_update=True,
+        value_fn=lambda s: _round_or_none(s.min_flow_24h, 3),
     ),
     # -- Statistics: hourly consumption --
     DropletSensorEntityDescription(
@@ -213,21 +254,24 @@ SENSOR_DESCRIPTIONS: tuple[DropletSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: _round_or_none(c.avg_hourly_24h, 3),
+        slow_update=True,
+        value_fn=lambda s: _round_or_none(s.avg_hourly_24h, 3),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_PEAK_HOURLY_24H,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: _round_or_none(c.peak_hourly_24h, 3),
+        slow_update=True,
+        value_fn=lambda s: _round_or_none(s.peak_hourly_24h, 3),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_PEAK_HOURLY_7D,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: _round_or_none(c.peak_hourly_7d, 3),
+        slow_update=True,
+        value_fn=lambda s: _round_or_none(s.peak_hourly_7d, 3),
     ),
     # -- Statistics: daily consumption --
     DropletSensorEntityDescription(
@@ -235,21 +279,101 @@ SENSOR_DESCRIPTIONS: tuple[DropletSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: _round_or_none(c.avg_daily_7d, 3),
+        slow_update=True,
+        value_fn=lambda s: _round_or_none(s.avg_daily_7d, 3),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_AVG_DAILY_30D,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: _round_or_none(c.avg_daily_30d, 3),
+        slow_update=True,
+        value_fn=lambda s: _round_or_none(s.avg_daily_30d, 3),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_PEAK_DAILY_30D,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: _round_or_none(c.peak_daily_30d, 3),
+        slow_update=True,
+        value_fn=lambda s: _round_or_none(s.peak_daily_30d, 3),
+    ),
+    # -- Last usage event (change only when an event completes) --
+    DropletSensorEntityDescription(
+        key=KEY_WATER_LAST_USAGE_VOLUME,
+        device_class=SensorDeviceClass.WATER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfVolume.LITERS,
+        always_available=True,
+        value_fn=lambda s: round(s.last_usage.volume, 3) if s.last_usage else None,
+    ),
+    DropletSensorEntityDescription(
+        key=KEY_WATER_LAST_USAGE_DURATION,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=0,
+        always_available=True,
+        value_fn=lambda s: round(s.last_usage.duration, 1) if s.last_usage else None,
+    ),
+    DropletSensorEntityDescription(
+        key=KEY_WATER_LAST_USAGE_PEAK_FLOW,
+        device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
+        always_available=True,
+        value_fn=lambda s: round(s.last_usage.peak_flow, 3) if s.last_usage else None,
+    ),
+    DropletSensorEntityDescription(
+        key=KEY_WATER_LAST_USAGE_END,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        always_available=True,
+        value_fn=lambda s: s.last_usage.end if s.last_usage else None,
+    ),
+    # -- Health (push stream and event loop) --
+    DropletSensorEntityDescription(
+        key=KEY_MESSAGE_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="msg/s",
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        slow_update=True,
+        always_available=True,
+        value_fn=lambda s: _round_or_none(s.health.message_rate, 3),
+    ),
+    DropletSensorEntityDescription(
+        key=KEY_PROCESSING_TIME_P95,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=3,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        slow_update=True,
+        always_available=True,
+        value_fn=lambda s: _round_or_none(s.health.processing_time_p95, 3),
+    ),
+    DropletSensorEntityDescription(
+        key=KEY_LAST_MESSAGE_AGE,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        slow_update=True,
+        always_available=True,
+        value_fn=lambda s: _round_or_none(s.health.last_message_age, 1),
+    ),
+    DropletSensorEntityDescription(
+        key=KEY_RECONNECT_COUNT,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        slow_update=True,
+        always_available=True,
+        value_fn=lambda s: s.health.reconnect_count,
     ),
 )
 
@@ -273,10 +397,9 @@ async def async_setup_entry(
     )
 
 
-class DropletSensor(CoordinatorEntity[DropletCoordinator], SensorEntity):
+class DropletSensor(DropletEntity, SensorEntity):
     """Representation of a Droplet sensor."""
 
-    _attr_has_entity_name = True
     entity_description: DropletSensorEntityDescription
 
     def __init__(
@@ -289,29 +412,28 @@ class DropletSensor(CoordinatorEntity[DropletCoordinator], SensorEntity):
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.unique_id}_{description.key}"
         self._attr_translation_key = description.key
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.unique_id)},
-            manufacturer=coordinator.device_manufacturer,
-            model=coordinator.device_model,
-            name=coordinator.config_entry.title,
-            sw_version=coordinator.device_firmware,
-            serial_number=coordinator.device_serial,
-        )
+        self._slow_update = description.slow_update
+        self._attr_device_info = coordinator.device_info
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self.coordinator.available
+        description = self.entity_description
+        if description.always_available:
+            return True
+        if description.live_only:
+            return self.coordinator.data.available
+        return super().available
 
     @property
-    def native_value(self) -> float | str | None:
+    def native_value(self) -> float | str | datetime | None:
         """Return the state of the sensor."""
-        return self.entity_description.value_fn(self.coordinator)
+        return self.entity_description.value_fn(self.coordinator.data)
 
     @property
     def last_reset(self) -> datetime | None:
         """Return the last reset time."""
-        return self.entity_description.last_reset_fn(self.coordinator)
+        return self.entity_description.last_reset_fn(self.coordinator.data)
 
     @property
     def native_unit_of_measurement(self) -> str | None:
@@ -319,3 +441,11 @@ class DropletSensor(CoordinatorEntity[DropletCoordinator], SensorEntity):
         if self.entity_description.is_cost:
             return self.hass.config.currency
         return self.entity_description.native_unit_of_measurement
+
+    def _state_fingerprint(self) -> tuple[Hashable, ...]:
+        """Return the visible state, rounded to the suggested display precision."""
+        value = self.native_value
+        precision = self.entity_description.suggested_display_precision
+        if precision is not None and isinstance(value, float):
+            value = round(value, precision)
+        return (self.available, value, self.last_reset, self.native_unit_of_measurement)
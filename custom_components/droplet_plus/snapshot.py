@@ -0,0 +1,106 @@
+"""Per-update snapshot of Droplet values."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DropletHealth:
+    """Push stream health, computed on the slow update channel.
+
+    Carried unchanged in every snapshot until the next slow refresh, so the
+    percentile sort behind it never runs per frame.
+    """
+
+    message_rate: float | None = None  # Frames per second since the previous refresh
+    processing_time_p95: float | None = None  # _on_update, in milliseconds
+    last_message_age: float | None = None  # Seconds since the last frame
+    reconnect_count: int = 0
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UsageEvent:
+    """One segmented water usage, from its first sample with flow to the first one without.
+
+    The end is that first sample without flow, whose volume still counts
+    towards the event. Built once the event completes and carried unchanged
+    in every snapshot until the next one completes.
+    """
+
+    start: datetime
+    end: datetime
+    volume: float  # Liters
+    peak_flow: float  # L/min
+
+    @property
+    def duration(self) -> float:
+        """Return the event length in seconds."""
+        return (self.end - self.start).total_seconds()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DropletSnapshot:
+    """Immutable set of values derived once per coordinator update.
+
+    Entities read from the snapshot instead of calling coordinator
+    properties, so each WebSocket frame costs a single computation pass.
+    Being frozen, a snapshot can be handed to diagnostics or executor jobs
+    without copying.
+    """
+
+    available: bool
+    stale: bool  # Cumulative values restored from the previous run, no device frame yet
+
+    # Current values
+    flow_rate: float
+    volume_delta: float
+    volume_last_reset: datetime
+    server_status: str | None
+    signal_quality: str | None
+
+    # Period consumption (liters)
+    hourly_volume: float
+    daily_volume: float
+    weekly_volume: float
+    monthly_volume: float
+    yearly_volume: float
+    lifetime_volume: float
+
+    # Period resets
+    hourly_reset: datetime
+    daily_reset: datetime
+    weekly_reset: datetime
+    monthly_reset: datetime
+    yearly_reset: datetime
+
+    # Cost
+    daily_cost: float
+    weekly_cost: float
+    monthly_cost: float
+    yearly_cost: float
+    lifetime_cost: float
+
+    # Statistics
+    avg_flow_1h: float | None
+    avg_flow_24h: float | None
+    avg_flow_30d: float | None
+    peak_flow_24h: float | None
+    peak_flow_7d: float | None
+    min_flow_24h: float | None
+    avg_hourly_24h: float | None
+    peak_hourly_24h: float | None
+    peak_hourly_7d: float | None
+    avg_daily_7d: float | None
+    avg_daily_30d: float | None
+    peak_daily_30d: float | None
+
+    # Leak detection
+    water_leak_detected: bool
+
+    # Last completed water usage event
+    last_usage: UsageEvent | None
+
+    # Push stream health
+    health: DropletHealth
@@ -0,0 +1,505 @@
+"""Rolling-window statistics for Droplet."""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+import sys
+
+# Initial slot count for SampleBuffer; grows by doubling when full
+SAMPLE_BUFFER_CAPACITY = 256
+
+
+class RollingWindow:
+    """Time-ordered sample window with a running sum.
+
+    Samples must be appended in non-decreasing timestamp order. Expired
+    samples are dropped from the front, so appends, expiry and every
+    statistic read are O(1) amortized regardless of the window size.
+    """
+
+    __slots__ = ("_max_age", "_samples", "_sum")
+
+    def __init__(self, max_age: float) -> None:
+        self._max_age = max_age
+        self._samples: deque[tuple[float, float]] = deque()
+        self._sum: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        return iter(self._samples)
+
+    @property
+    def max_age(self) -> float:
+        """Return the window length in seconds."""
+        return self._max_age
+
+    @property
+    def total(self) -> float:
+        """Return the sum of all samples in the window."""
+        return self._sum
+
+    @property
+    def average(self) -> float | None:
+        """Return the mean of the samples in the window, or None if empty."""
+        if not self._samples:
+            return None
+        return self._sum / len(self._samples)
+
+    def append(self, ts: float, value: float) -> None:
+        """Add a sample to the end of the window."""
+        self._samples.append((ts, value))
+        self._sum += value
+
+    def expire(self, now_ts: float) -> None:
+        """Drop samples older than max_age relative to now_ts."""
+        cutoff = now_ts - self._max_age
+        samples = self._samples
+        while samples and samples[0][0] < cutoff:
+            self._sum -= samples.popleft()[1]
+        if not samples:
+            # Reset to avoid carrying floating-point drift into the next run
+            self._sum = 0.0
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self._samples.clear()
+        self._sum = 0.0
+
+
+class SampleBuffer:
+    """Compact time-ordered sample window with a running sum.
+
+    Same contract as RollingWindow, but timestamps and values are stored in
+    two parallel float64 arrays used as a ring buffer (16 bytes per sample
+    instead of a tuple plus two float objects). The ring doubles in size
+    when full, so appends stay amortized O(1).
+    """
+
+    __slots__ = ("_head", "_initial_capacity", "_max_age", "_size", "_sum", "_ts", "_values")
+
+    def __init__(self, max_age: float, capacity: int = SAMPLE_BUFFER_CAPACITY) -> None:
+        self._max_age = max_age
+        self._initial_capacity = capacity
+        self._ts = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._head: int = 0
+        self._size: int = 0
+        self._sum: float = 0.0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        ts, values, head, capacity = self._ts, self._values, self._head, len(self._ts)
+        for i in range(self._size):
+            idx = (head + i) % capacity
+            yield ts[idx], values[idx]
+
+    @property
+    def max_age(self) -> float:
+        """Return the window length in seconds."""
+        return self._max_age
+
+    @property
+    def capacity(self) -> int:
+        """Return the number of preallocated sample slots."""
+        return len(self._ts)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory held by the sample arrays in bytes."""
+        return sys.getsizeof(self._ts) + sys.getsizeof(self._values)
+
+    @property
+    def total(self) -> float:
+        """Return the sum of all samples in the window."""
+        return self._sum
+
+    @property
+    def average(self) -> float | None:
+        """Return the mean of the samples in the window, or None if empty."""
+        if not self._size:
+            return None
+        return self._sum / self._size
+
+    def append(self, ts: float, value: float) -> None:
+        """Add a sample to the end of the window."""
+        if self._size == len(self._ts):
+            self._grow()
+        idx = (self._head + self._size) % len(self._ts)
+        self._ts[idx] = ts
+        self._values[idx] = value
+        self._size += 1
+        self._sum += value
+
+    def expire(self, now_ts: float, sink: Callable[[float, float], None] | None = None) -> int:
+        """Drop samples older than max_age relative to now_ts.
+
+        Expired samples are passed to sink, oldest first, if given. Returns
+        the number of samples dropped.
+        """
+        cutoff = now_ts - self._max_age
+        ts, values, capacity = self._ts, self._values, len(self._ts)
+        expired = 0
+        while self._size and ts[self._head] < cutoff:
+            if sink is not None:
+                sink(ts[self._head], values[self._head])
+            self._sum -= values[self._head]
+            self._head = (self._head + 1) % capacity
+            self._size -= 1
+            expired += 1
+        if not self._size:
+            # Reset to avoid carrying floating-point drift into the next run
+            self._head = 0
+            self._sum = 0.0
+        return expired
+
+    def columns(self) -> tuple[array, array]:
+        """Return copies of the timestamp and value columns, oldest first."""
+        head, end, capacity = self._head, self._head + self._size, len(self._ts)
+        if end <= capacity:
+            return self._ts[head:end], self._values[head:end]
+        wrap = end - capacity
+        return self._ts[head:] + self._ts[:wrap], self._values[head:] + self._values[:wrap]
+
+    def load_columns(self, ts: array, values: array) -> None:
+        """Replace the contents with time-ordered timestamp and value columns."""
+        size = len(ts)
+        capacity = self._initial_capacity
+        while capacity < size:
+            capacity *= 2
+        padding = array("d", bytes(8 * (capacity - size)))
+        self._ts = array("d", ts) + padding
+        self._values = array("d", values) + padding
+        self._head = 0
+        self._size = size
+        self._sum = sum(self._values)
+
+    def clear(self) -> None:
+        """Remove all samples and release any grown capacity."""
+        self._ts = array("d", bytes(8 * self._initial_capacity))
+        self._values = array("d", bytes(8 * self._initial_capacity))
+        self._head = 0
+        self._size = 0
+        self._sum = 0.0
+
+    def _grow(self) -> None:
+        """Double the capacity, unrolling the ring so the oldest sample is first."""
+        head, capacity = self._head, len(self._ts)
+        padding = array("d", bytes(8 * max(capacity, 1)))
+        self._ts = self._ts[head:] + self._ts[:head] + padding
+        self._values = self._values[head:] + self._values[:head] + padding
+        self._head = 0
+
+
+class SlidingExtremum:
+    """Sliding-window maximum (or minimum) over time-ordered samples.
+
+    Uses a monotonic deque keyed by timestamp: a sample that can never be
+    the extremum again (an older value dominated by a newer one) is dropped
+    on append, so appends and expiry are amortized O(1) and reads are O(1).
+    """
+
+    __slots__ = ("_max_age", "_maximum", "_samples")
+
+    def __init__(self, max_age: float, *, maximum: bool = True) -> None:
+        self._max_age = max_age
+        self._maximum = maximum
+        self._samples: deque[tuple[float, float]] = deque()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    @property
+    def max_age(self) -> float:
+        """Return the window length in seconds."""
+        return self._max_age
+
+    @property
+    def value(self) -> float | None:
+        """Return the extremum of the window, or None if empty."""
+        if not self._samples:
+            return None
+        return self._samples[0][1]
+
+    def append(self, ts: float, value: float) -> None:
+        """Add a sample to the end of the window."""
+        samples = self._samples
+        if self._maximum:
+            while samples and samples[-1][1] <= value:
+                samples.pop()
+        else:
+            while samples and samples[-1][1] >= value:
+                samples.pop()
+        samples.append((ts, value))
+
+    def expire(self, now_ts: float) -> None:
+        """Drop samples older than max_age relative to now_ts."""
+        cutoff = now_ts - self._max_age
+        samples = self._samples
+        while samples and samples[0][0] < cutoff:
+            samples.popleft()
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self._samples.clear()
+
+
+class AggregateTier:
+    """Fixed-size time buckets of min/mean/max over a retention window.
+
+    Each bucket is (start, count, total, minimum, maximum), stored in five
+    parallel float64 arrays used as a ring buffer like SampleBuffer.
+    Samples or buckets from a finer tier are merged into the bucket that
+    contains their timestamp; buckets older than max_age are dropped from
+    the front and can be rolled into a coarser tier. A running count/total
+    and sliding extrema keep every statistic read O(1).
+    """
+
+    __slots__ = (
+        "_bucket_size",
+        "_columns",
+        "_count",
+        "_head",
+        "_high",
+        "_low",
+        "_max_age",
+        "_size",
+        "_total",
+    )
+
+    def __init__(
+        self, bucket_size: float, max_age: float, capacity: int = SAMPLE_BUFFER_CAPACITY
+    ) -> None:
+        self._bucket_size = bucket_size
+        self._max_age = max_age
+        # start, count, total, minimum, maximum
+        self._columns = tuple(array("d", bytes(8 * capacity)) for _ in range(5))
+        self._head: int = 0
+        self._size: int = 0
+        self._count: int = 0
+        self._total: float = 0.0
+        self._high = SlidingExtremum(max_age)
+        self._low = SlidingExtremum(max_age, maximum=False)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[tuple[float, int, float, float, float]]:
+        start, count, total, low, high = self._columns
+        head, capacity = self._head, len(start)
+        for i in range(self._size):
+            idx = (head + i) % capacity
+            yield start[idx], int(count[idx]), total[idx], low[idx], high[idx]
+
+    @property
+    def bucket_size(self) -> float:
+        """Return the bucket length in seconds."""
+        return self._bucket_size
+
+    @property
+    def max_age(self) -> float:
+        """Return the retention window in seconds."""
+        return self._max_age
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory held by the bucket arrays in bytes."""
+        return sum(sys.getsizeof(column) for column in self._columns)
+
+    @property
+    def count(self) -> int:
+        """Return the number of samples aggregated in the tier."""
+        return self._count
+
+    @property
+    def total(self) -> float:
+        """Return the sum of all samples aggregated in the tier."""
+        return self._total
+
+    @property
+    def average(self) -> float | None:
+        """Return the sample-weighted mean, or None if empty."""
+        if not self._count:
+            return None
+        return self._total / self._count
+
+    @property
+    def maximum(self) -> float | None:
+        """Return the largest sample in the tier, or None if empty."""
+        return self._high.value
+
+    @property
+    def minimum(self) -> float | None:
+        """Return the smallest sample in the tier, or None if empty."""
+        return self._low.value
+
+    def add_sample(self, ts: float, value: float) -> None:
+        """Merge a single raw sample."""
+        self.add(ts, 1, value, value, value)
+
+    def add(self, ts: float, count: int, total: float, minimum: float, maximum: float) -> None:
+        """Merge an aggregate (or a finer bucket) into the bucket containing ts."""
+        bucket_start = ts - ts % self._bucket_size
+        start, counts, totals, lows, highs = self._columns
+        last = (self._head + self._size - 1) % len(start)
+        if self._size and start[last] == bucket_start:
+            counts[last] += count
+            totals[last] += total
+            lows[last] = min(lows[last], minimum)
+            highs[last] = max(highs[last], maximum)
+        else:
+            if self._size == len(start):
+                self._grow()
+                start, counts, totals, lows, highs = self._columns
+            idx = (self._head + self._size) % len(start)
+            start[idx] = bucket_start
+            counts[idx] = count
+            totals[idx] = total
+            lows[idx] = minimum
+            highs[idx] = maximum
+            self._size += 1
+        self._count += count
+        self._total += total
+        self._high.append(bucket_start, maximum)
+        self._low.append(bucket_start, minimum)
+
+    def expire(self, now_ts: float, sink: AggregateTier | None = None) -> int:
+        """Drop buckets older than max_age, rolling them into sink if given.
+
+        Returns the number of buckets dropped.
+        """
+        cutoff = now_ts - self._max_age
+        start, counts, totals, lows, highs = self._columns
+        capacity = len(start)
+        expired = 0
+        while self._size and start[self._head] < cutoff:
+            head = self._head
+            count = int(counts[head])
+            self._count -= count
+            self._total -= totals[head]
+            if sink is not None:
+                sink.add(start[head], count, totals[head], lows[head], highs[head])
+            self._head = (head + 1) % capacity
+            self._size -= 1
+            expired += 1
+        if not self._size:
+            # Reset to avoid carrying floating-point drift into the next run
+            self._head = 0
+            self._count = 0
+            self._total = 0.0
+        self._high.expire(now_ts)
+        self._low.expire(now_ts)
+        return expired
+
+    def load_columns(self, columns: Sequence[Sequence[float]]) -> None:
+        """Replace the contents with (start, count, total, min, max) columns."""
+        self.clear()
+        for start, count, total, minimum, maximum in zip(*columns, strict=True):
+            self.add(start, int(count), total, minimum, maximum)
+
+    def clear(self) -> None:
+        """Remove all buckets."""
+        self._head = 0
+        self._size = 0
+        self._count = 0
+        self._total = 0.0
+        self._high.clear()
+        self._low.clear()
+
+    def _grow(self) -> None:
+        """Double the capacity, unrolling the ring so the oldest bucket is first."""
+        head, capacity = self._head, len(self._columns[0])
+        padding = array("d", bytes(8 * max(capacity, 1)))
+        self._columns = tuple(column[head:] + column[:head] + padding for column in self._columns)
+        self._head = 0
+
+
+class FlowRun:
+    """Running aggregate of the current uninterrupted run of flow samples.
+
+    The caller adds every sample that belongs to the run and resets it when
+    one does not, so the start time, volume and min/mean/max flow of the run
+    in progress are known at any moment with O(1) work per sample.
+    """
+
+    __slots__ = ("_count", "_last", "_max", "_min", "_start", "_sum", "_volume")
+
+    def __init__(self) -> None:
+        self._start: float | None = None
+        self._last: float = 0.0
+        self._count: int = 0
+        self._sum: float = 0.0
+        self._min: float = 0.0
+        self._max: float = 0.0
+        self._volume: float = 0.0
+
+    @property
+    def active(self) -> bool:
+        """Return True while a run is in progress."""
+        return self._start is not None
+
+    @property
+    def start(self) -> float | None:
+        """Return the timestamp of the first sample of the run, or None."""
+        return self._start
+
+    @property
+    def end(self) -> float | None:
+        """Return the timestamp of the last sample of the run, or None."""
+        return self._last if self._start is not None else None
+
+    @property
+    def volume(self) -> float:
+        """Return the volume that flowed during the run."""
+        return self._volume
+
+    @property
+    def min_flow(self) -> float | None:
+        """Return the smallest flow sample of the run, or None."""
+        return self._min if self._count else None
+
+    @property
+    def mean_flow(self) -> float | None:
+        """Return the mean flow sample of the run, or None."""
+        return self._sum / self._count if self._count else None
+
+    @property
+    def max_flow(self) -> float | None:
+        """Return the largest flow sample of the run, or None."""
+        return self._max if self._count else None
+
+    def duration(self, now_ts: float | None = None) -> float:
+        """Return the run length in seconds, up to now_ts or the last sample."""
+        if self._start is None:
+            return 0.0
+        return max(now_ts if now_ts is not None else self._last, self._last) - self._start
+
+    def add(self, ts: float, flow: float, volume: float) -> None:
+        """Extend the run (or start one) with a sample."""
+        if self._start is None:
+            self._start = ts
+            self._min = flow
+            self._max = flow
+        elif flow < self._min:
+            self._min = flow
+        elif flow > self._max:
+            self._max = flow
+        self._last = ts
+        self._count += 1
+        self._sum += flow
+        self._volume += volume
+
+    def reset(self) -> None:
+        """End the run."""
+        self._start = None
+        self._last = 0.0
+        self._count = 0
+        self._sum = 0.0
+        self._min = 0.0
+        self._max = 0.0
+        self._volume = 0.0
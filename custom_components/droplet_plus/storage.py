@@ -0,0 +1,83 @@
+"""Persistent storage format for Droplet."""
+
+from __future__ import annotations
+
+from array import array
+import base64
+from collections.abc import Iterable, Sequence
+import sys
+from typing import Any
+
+from homeassistant.helpers.storage import Store
+
+# Buffers stored as packed float64 columns, with their column count
+BUFFER_COLUMNS: dict[str, int] = {
+    "flow_samples": 2,  # ts, L/min
+    "hourly_consumption": 2,  # ts, L
+    "daily_consumption": 2,  # ts, L
+    "hourly_flow_stats": 3,  # ts, max L/min, min L/min
+    "flow_minutes": 5,  # start, count, total, min L/min, max L/min
+    "flow_quarters": 5,  # start, count, total, min L/min, max L/min
+    "usage_events": 4,  # start, end, L, peak L/min
+}
+
+
+def pack_columns(columns: Sequence[array]) -> dict[str, Any]:
+    """Pack equally long float64 columns into a JSON-safe header and payload.
+
+    Columns are written one after another as little-endian float64 and
+    base64-encoded, so the Store file stays a single atomically written
+    JSON document.
+    """
+    count = len(columns[0]) if columns else 0
+    packed = array("d")
+    for column in columns:
+        packed.extend(column)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return {
+        "columns": len(columns),
+        "count": count,
+        "data": base64.b64encode(packed.tobytes()).decode("ascii"),
+    }
+
+
+def unpack_columns(header: dict[str, Any]) -> list[array]:
+    """Unpack columns written by pack_columns."""
+    width, count = header["columns"], header["count"]
+    packed = array("d")
+    packed.frombytes(base64.b64decode(header["data"]))
+    if sys.byteorder == "big":
+        packed.byteswap()
+    if len(packed) != width * count:
+        raise ValueError(f"Expected {width * count} values, got {len(packed)}")
+    return [packed[i * count : (i + 1) * count] for i in range(width)]
+
+
+def rows_to_columns(rows: Iterable[Sequence[float]], width: int) -> list[array]:
+    """Transpose (ts, value, ...) rows into float64 columns."""
+    columns = [array("d") for _ in range(width)]
+    for row in rows:
+        for column, value in zip(columns, row, strict=True):
+            column.append(value)
+    return columns
+
+
+class DropletStore(Store[dict[str, Any]]):
+    """Store with migrations for the Droplet data format."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Migrate stored data to the current version."""
+        if old_major_version == 1:
+            # Version 1 stored every buffer entry as a JSON [ts, v, ...] list
+            buffers = {
+                key: pack_columns(rows_to_columns(old_data.pop(key, []), width))
+                for key, width in BUFFER_COLUMNS.items()
+            }
+            old_data = {**old_data, "buffers": buffers}
+        return old_data
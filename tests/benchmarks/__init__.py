@@ -0,0 +1 @@
+"""Hot path benchmarks for Droplet."""
@@ -0,0 +1,65 @@
+"""Fixtures for the Droplet hot path benchmarks.
+
+The benchmarks are skipped unless pytest runs with --droplet-benchmark.
+With --droplet-benchmark-update the measured figures replace the stored
+baselines instead of being checked against them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import json
+from pathlib import Path
+
+import pytest
+
+from .replay import BASELINES_PATH, load_baselines
+
+RESULTS_KEY = pytest.StashKey[dict[str, dict[str, float]]]()
+
+
+def benchmarks_enabled(config: pytest.Config) -> bool:
+    """Return True if the benchmarks were requested."""
+    return bool(
+        config.getoption("--droplet-benchmark") or config.getoption("--droplet-benchmark-update")
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip the benchmarks unless they were requested."""
+    if benchmarks_enabled(config):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run with --droplet-benchmark")
+    here = Path(__file__).parent
+    for item in items:
+        if here in item.path.parents:
+            item.add_marker(skip)
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
+    """Print the measured figures next to their baselines."""
+    results = terminalreporter.config.stash.get(RESULTS_KEY, None)
+    if not results:
+        return
+    baselines = load_baselines()
+    terminalreporter.section("droplet_plus benchmarks")
+    for scenario, metrics in sorted(results.items()):
+        baseline = baselines.get(scenario, {})
+        terminalreporter.write_line(scenario)
+        for metric, value in metrics.items():
+            terminalreporter.write_line(
+                f"  {metric:<28}{value:>12}  (baseline {baseline.get(metric, '-')})"
+            )
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request: pytest.FixtureRequest) -> Iterator[dict[str, dict[str, float]]]:
+    """Collect results per scenario; store them as baselines when updating."""
+    results: dict[str, dict[str, float]] = {}
+    request.config.stash[RESULTS_KEY] = results
+    yield results
+    if results and request.config.getoption("--droplet-benchmark-update"):
+        baselines = {**load_baselines(), **results}
+        BASELINES_PATH.write_text(
+            json.dumps(baselines, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
@@ -0,0 +1,332 @@
+"""Synthetic WebSocket replay for the coordinator hot path."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+import contextlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, tzinfo
+import gc
+import inspect
+import json
+from pathlib import Path
+import statistics
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.droplet_plus.const import JOURNAL_INTERVAL
+from custom_components.droplet_plus.coordinator import DropletCoordinator
+from custom_components.droplet_plus.helpers import next_hour
+from custom_components.droplet_plus.scheduler import DropletScheduler, JobAction
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import Entity
+from homeassistant.util import dt as dt_util
+from tests.fake_droplet import FlowProfile, household_profile
+
+BASELINES_PATH = Path(__file__).parent / "baselines.json"
+
+# Frames replayed under tracemalloc after the timed run
+ALLOCATION_SAMPLE = 1000
+
+# Seconds between the flow profiles of successive entries in a multi-entry replay
+ENTRY_PHASE = 97
+
+
+def load_baselines() -> dict[str, dict[str, float]]:
+    """Return the stored baselines, keyed by scenario."""
+    if not BASELINES_PATH.exists():
+        return {}
+    return json.loads(BASELINES_PATH.read_text(encoding="utf-8"))
+
+
+class FakeDroplet:
+    """Lightweight stand-in for pydroplet.Droplet.
+
+    MagicMock records every call, which would dominate both the latency and
+    the allocation figures over hundreds of thousands of frames.
+    """
+
+    def __init__(self) -> None:
+        self._flow_rate = 0.0
+        self._volume_delta = 0.0
+        self._volumes: dict[str, float] = {}
+
+    def feed(self, flow_rate: float, volume_ml: float) -> None:
+        """Apply one device frame, as the pydroplet message parser would."""
+        self._flow_rate = flow_rate
+        self._volume_delta += volume_ml
+        for name in self._volumes:
+            self._volumes[name] += volume_ml
+
+    def get_flow_rate(self) -> float:
+        return self._flow_rate
+
+    def get_volume_delta(self) -> float:
+        delta, self._volume_delta = self._volume_delta, 0.0
+        return delta
+
+    def get_availability(self) -> bool:
+        return True
+
+    def get_server_status(self) -> str:
+        return "connected"
+
+    def get_signal_quality(self) -> str:
+        return "strong_signal"
+
+    def version_info_available(self) -> bool:
+        return True
+
+    def get_model(self) -> str:
+        return "Droplet"
+
+    def get_manufacturer(self) -> str:
+        return "Hydrific"
+
+    def get_fw_version(self) -> str:
+        return "1.2.3"
+
+    def get_sn(self) -> str:
+        return "SN123456"
+
+    def add_accumulator(self, name: str, _reset_time: datetime) -> None:
+        self._volumes[name] = 0.0
+
+    def reset_accumulator(self, name: str, _reset_time: datetime) -> None:
+        self._volumes[name] = 0.0
+
+    def remove_accumulator(self, name: str) -> None:
+        self._volumes.pop(name, None)
+
+    def get_accumulated_volume(self, name: str) -> float:
+        return self._volumes.get(name, 0.0)
+
+    async def listen_forever(self, _delay: int, _callback: Callable[..., None]) -> None:
+        """Return at once; the replay invokes the update callback itself."""
+
+    async def stop_listening(self) -> None:
+        """Nothing to stop."""
+
+    async def disconnect(self) -> None:
+        """Nothing to disconnect."""
+
+
+class SimulatedClock:
+    """Replacement for dt_util.now that only moves when the replay advances it."""
+
+    def __init__(self, start: datetime) -> None:
+        self.current = start
+
+    def now(self, time_zone: tzinfo | None = None) -> datetime:
+        if time_zone is None:
+            return self.current
+        return self.current.astimezone(time_zone)
+
+
+@dataclass(slots=True)
+class ReplayResult:
+    """Measurements of one replay run."""
+
+    updates: int
+    latencies_ns: list[int]
+    entity_writes: int
+    retained_bytes: int
+    peak_bytes: int
+    allocation_updates: int
+
+    def metrics(self) -> dict[str, float]:
+        """Return the figures compared against the stored baselines."""
+        cuts = statistics.quantiles(self.latencies_ns, n=100)
+        return {
+            "p50_us": round(cuts[49] / 1000, 2),
+            "p95_us": round(cuts[94] / 1000, 2),
+            "p99_us": round(cuts[98] / 1000, 2),
+            "writes_per_update": round(self.entity_writes / self.updates, 3),
+            "retained_bytes_per_update": round(self.retained_bytes / self.allocation_updates, 1),
+            "peak_bytes_per_update": round(self.peak_bytes, 1),
+        }
+
+
+@dataclass(slots=True)
+class LoadResult:
+    """Event loop load of one multi-entry run, per simulated second."""
+
+    entries: int
+    loads_ns: list[int]
+    timer_jobs: list[int]
+
+    def metrics(self) -> dict[str, float]:
+        """Return the figures compared against the stored baselines."""
+        cuts = statistics.quantiles(self.loads_ns, n=100)
+        return {
+            "loop_p50_us": round(cuts[49] / 1000, 2),
+            "loop_p99_us": round(cuts[98] / 1000, 2),
+            "loop_us_per_entry": round(statistics.fmean(self.loads_ns) / self.entries / 1000, 2),
+            "timer_jobs_max": max(self.timer_jobs),
+        }
+
+
+@contextlib.contextmanager
+def count_entity_writes() -> Iterator[list[int]]:
+    """Count Entity.async_write_ha_state calls made inside the block."""
+    counter = [0]
+    original = Entity.async_write_ha_state
+
+    def counting_write(entity: Entity) -> None:
+        counter[0] += 1
+        original(entity)
+
+    with patch.object(Entity, "async_write_ha_state", counting_write):
+        yield counter
+
+
+@contextlib.contextmanager
+def count_timer_jobs() -> Iterator[list[int]]:
+    """Count the runs of jobs scheduled on the shared scheduler inside the block."""
+    counter = [0]
+    original = DropletScheduler.async_schedule
+
+    def counting_schedule(
+        scheduler: DropletScheduler, name: str, interval: float, action: JobAction
+    ) -> Callable[[], None]:
+        if inspect.iscoroutinefunction(action):
+
+            async def run(now: datetime) -> None:
+                counter[0] += 1
+                await action(now)
+
+        else:
+
+            @callback
+            def run(now: datetime) -> None:
+                counter[0] += 1
+                action(now)
+
+        return original(scheduler, name, interval, run)
+
+    with patch.object(DropletScheduler, "async_schedule", counting_schedule):
+        yield counter
+
+
+async def async_replay(
+    hass: HomeAssistant,
+    coordinator: DropletCoordinator,
+    droplet: FakeDroplet,
+    *,
+    rate_hz: float,
+    duration_s: float,
+    profile: FlowProfile = household_profile,
+) -> ReplayResult:
+    """Drive _on_update at rate_hz for duration_s of simulated time.
+
+    Only the _on_update call is timed. Period rollovers, slow channel
+    refreshes and journal flushes run between frames on the simulated
+    clock, as their timers would, and their entity writes are counted.
+    """
+    interval = 1 / rate_hz
+    frames = int(duration_s * rate_hz)
+    start = dt_util.now()
+    clock = SimulatedClock(start)
+    slow_interval = coordinator.statistics_interval
+    next_rollover = next_hour(coordinator.hourly_reset)
+    next_slow = next_journal = 0.0
+    latencies: list[int] = []
+    entity_writes = baseline = peak_bytes = 0
+    perf_counter_ns = time.perf_counter_ns
+    on_update = coordinator._on_update
+
+    def feed(elapsed: float) -> None:
+        flow = profile(elapsed)
+        droplet.feed(flow, flow / 60 * interval * 1000)
+
+    with patch.object(dt_util, "now", clock.now), count_entity_writes() as writes:
+        gc.collect()
+        for frame in range(frames + ALLOCATION_SAMPLE):
+            elapsed = frame * interval
+            clock.current = start + timedelta(seconds=elapsed)
+            if clock.current >= next_rollover:
+                coordinator._handle_period_rollover(dt_util.as_utc(next_rollover))
+                next_rollover = next_hour(coordinator.hourly_reset)
+            if elapsed >= next_slow:
+                coordinator._handle_slow_refresh(clock.current)
+                next_slow += slow_interval
+            if elapsed >= next_journal:
+                # The journal is flushed off the hot path; drop its buffer like a flush would
+                coordinator._journal._pending.clear()
+                await hass.async_block_till_done()
+                next_journal += JOURNAL_INTERVAL
+            feed(elapsed)
+
+            if frame < frames:
+                began = perf_counter_ns()
+                on_update(None)
+                latencies.append(perf_counter_ns() - began)
+                continue
+
+            # Allocation sample: retained growth and per-frame transient peak
+            if frame == frames:
+                entity_writes = writes[0]
+                tracemalloc.start()
+                baseline, _ = tracemalloc.get_traced_memory()
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            on_update(None)
+            _, peak = tracemalloc.get_traced_memory()
+            peak_bytes = max(peak_bytes, peak - before)
+
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return ReplayResult(
+        updates=frames,
+        latencies_ns=latencies,
+        entity_writes=entity_writes,
+        retained_bytes=max(retained - baseline, 0),
+        peak_bytes=peak_bytes,
+        allocation_updates=ALLOCATION_SAMPLE,
+    )
+
+
+async def async_replay_entries(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    coordinators: list[DropletCoordinator],
+    timer_jobs: list[int],
+    *,
+    duration_s: int,
+    profile: FlowProfile = household_profile,
+) -> LoadResult:
+    """Run every entry at 1 Hz for duration_s simulated seconds on the frozen clock.
+
+    Each simulated second feeds one frame to every coordinator, then fires
+    the timers that came due, and takes the main thread CPU time of both.
+    timer_jobs is the counter from count_timer_jobs, active during setup.
+    """
+    # Seconds start 10 ms past the wall clock second so that no job due on
+    # a whole second straddles two simulated seconds
+    start = dt_util.utcnow().replace(microsecond=10000) + timedelta(seconds=1)
+    loads: list[int] = []
+    jobs: list[int] = []
+    thread_time_ns = time.thread_time_ns
+
+    gc.collect()
+    for second in range(duration_s + 1):
+        freezer.move_to(start + timedelta(seconds=second))
+        jobs_before = timer_jobs[0]
+        began = thread_time_ns()
+        for index, coordinator in enumerate(coordinators):
+            flow = profile(second + index * ENTRY_PHASE)
+            coordinator._droplet.feed(flow, flow / 60 * 1000)
+            coordinator._on_update(None)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        # Second 0 only drains the timers that came due during setup
+        if second:
+            loads.append(thread_time_ns() - began)
+            jobs.append(timer_jobs[0] - jobs_before)
+
+    return LoadResult(entries=len(coordinators), loads_ns=loads, timer_jobs=jobs)
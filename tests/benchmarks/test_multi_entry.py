@@ -0,0 +1,101 @@
+"""Event loop load benchmarks for many Droplet config entries on one instance."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.droplet_plus.const import CONF_DEVICE_ID, DOMAIN
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_TOKEN
+from homeassistant.core import HomeAssistant
+
+from .replay import FakeDroplet, async_replay_entries, count_timer_jobs, load_baselines
+
+# Ten minutes covers two saves and ten statistics refreshes per entry
+DURATION_S = 600
+
+# Allowed ratio to the baseline before a metric counts as a regression.
+# CPU time varies between machines and runs; timer job counts are deterministic.
+TOLERANCES = {
+    "loop_p50_us": 2.0,
+    "loop_p99_us": 2.5,
+    "loop_us_per_entry": 2.0,
+    "timer_jobs_max": 1.0,
+}
+
+
+def _config_entry(index: int) -> MockConfigEntry:
+    """Return the config entry of a virtual device."""
+    device_id = f"droplet-fake-{index:03d}"
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title=f"Droplet ({device_id})",
+        data={
+            CONF_HOST: "127.0.0.1",
+            CONF_PORT: 443,
+            CONF_TOKEN: f"FAKE{index:04d}",
+            CONF_DEVICE_ID: device_id,
+        },
+        unique_id=device_id,
+        version=1,
+    )
+
+
+@pytest.mark.timeout(1800)
+@pytest.mark.parametrize(
+    "entries",
+    [
+        pytest.param(1, id="multi_1"),
+        pytest.param(10, id="multi_10"),
+        pytest.param(30, id="multi_30"),
+    ],
+)
+async def test_multi_entry(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    request: pytest.FixtureRequest,
+    benchmark_results: dict[str, dict[str, float]],
+    entries: int,
+) -> None:
+    """Run many entries at 1 Hz and compare the event loop load against its baseline."""
+    config_entries = [_config_entry(index) for index in range(entries)]
+    with (
+        patch(
+            "custom_components.droplet_plus.coordinator.Droplet",
+            side_effect=[FakeDroplet() for _ in range(entries)],
+        ),
+        count_timer_jobs() as timer_jobs,
+    ):
+        for config_entry in config_entries:
+            config_entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(config_entries[0].entry_id)
+        await hass.async_block_till_done()
+
+        result = await async_replay_entries(
+            hass,
+            freezer,
+            [config_entry.runtime_data for config_entry in config_entries],
+            timer_jobs,
+            duration_s=DURATION_S,
+        )
+
+    scenario = request.node.callspec.id
+    metrics = result.metrics()
+    benchmark_results[scenario] = metrics
+    if request.config.getoption("--droplet-benchmark-update"):
+        return
+
+    baseline = load_baselines().get(scenario)
+    if baseline is None:
+        pytest.skip(f"No baseline for {scenario}, run with --droplet-benchmark-update")
+    regressions = {
+        metric: (value, baseline[metric])
+        for metric, value in metrics.items()
+        if metric in TOLERANCES
+        and metric in baseline
+        and value > baseline[metric] * TOLERANCES[metric]
+    }
+    assert not regressions, f"{scenario} regressed (measured, baseline): {regressions}"
@@ -0,0 +1,91 @@
+"""Replay benchmarks for DropletCoordinator._on_update."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .replay import FakeDroplet, async_replay, load_baselines
+
+HOUR = 3600
+DAY = 86400
+
+# Allowed ratio to the baseline before a metric counts as a regression.
+# Latency varies between machines and runs; write counts are deterministic.
+TOLERANCES = {
+    "p50_us": 2.0,
+    "p95_us": 2.0,
+    "p99_us": 2.5,
+    "writes_per_update": 1.05,
+    "retained_bytes_per_update": 1.5,
+    "peak_bytes_per_update": 1.5,
+}
+
+
+@pytest.mark.timeout(1800)
+@pytest.mark.parametrize(
+    ("rate_hz", "duration_s"),
+    [
+        pytest.param(1, DAY, id="1hz_1d"),
+        pytest.param(10, 6 * HOUR, id="10hz_6h"),
+        pytest.param(100, HOUR, id="100hz_1h"),
+    ],
+)
+async def test_on_update(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    request: pytest.FixtureRequest,
+    benchmark_results: dict[str, dict[str, float]],
+    rate_hz: int,
+    duration_s: int,
+) -> None:
+    """Replay a household flow profile and compare the hot path against its baseline."""
+    droplet = FakeDroplet()
+    with patch("custom_components.droplet_plus.coordinator.Droplet", return_value=droplet):
+        mock_config_entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    # Write counts scale with the enabled entities, so a baseline is only
+    # comparable when it was recorded with the same entity set
+    entities = sum(
+        not entry.disabled
+        for entry in er.async_entries_for_config_entry(
+            er.async_get(hass), mock_config_entry.entry_id
+        )
+    )
+
+    result = await async_replay(
+        hass,
+        mock_config_entry.runtime_data,
+        droplet,
+        rate_hz=rate_hz,
+        duration_s=duration_s,
+    )
+
+    scenario = request.node.callspec.id
+    metrics = {**result.metrics(), "entities": entities}
+    benchmark_results[scenario] = metrics
+    if request.config.getoption("--droplet-benchmark-update"):
+        return
+
+    baseline = load_baselines().get(scenario)
+    if baseline is None:
+        pytest.skip(f"No baseline for {scenario}, run with --droplet-benchmark-update")
+    assert baseline.get("entities") == entities, (
+        f"{scenario} baseline was recorded with {baseline.get('entities')} enabled entities, "
+        f"now {entities}: re-record it with --droplet-benchmark-update"
+    )
+    regressions = {
+        metric: (value, baseline[metric])
+        for metric, value in metrics.items()
+        if metric in TOLERANCES
+        and metric in baseline
+        and value > baseline[metric] * TOLERANCES[metric]
+    }
+    assert not regressions, f"{scenario} regressed (measured, baseline): {regressions}"
@@ -28,6 +28,23 @@ TEST_FW_VERSION = "1.2.3"
 TEST_SERIAL = "SN123456"
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the opt-in benchmark options (see tests/benchmarks)."""
+    group = parser.getgroup("droplet_plus")
+    group.addoption(
+        "--droplet-benchmark",
+        action="store_true",
+        default=False,
+        help="Run the coordinator hot path benchmarks",
+    )
+    group.addoption(
+        "--droplet-benchmark-update",
+        action="store_true",
+        default=False,
+        help="Run the benchmarks and store their results as the new baselines",
+    )
+
+
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(
     enable_custom_integrations: None,
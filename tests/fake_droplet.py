@@ -0,0 +1,285 @@
+"""Local stand-in for Droplet devices, for load and soak testing.
+
+Virtual devices speak the protocol that pydroplet.Droplet consumes: a TLS
+WebSocket at /ws, authorized by the pairing code in the Authorization
+header, sending one JSON info message (device metadata) followed by state
+messages with the flow rate (L/min) and the volume (mL) since the previous
+message. All devices share one port and are told apart by pairing code.
+
+Run standalone to soak-test config entries against a Home Assistant
+instance on the same machine:
+
+    python -m tests.fake_droplet --devices 30 --rate 10 --profile household
+
+Manual setup connects to port 443, which usually needs root. Add each
+logged device in Home Assistant with host 127.0.0.1 and its pairing code.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+import contextlib
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+import logging
+from pathlib import Path
+import ssl
+import tempfile
+
+from aiohttp import WSCloseCode, web
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+_LOGGER = logging.getLogger(__name__)
+
+FlowProfile = Callable[[float], float]
+
+
+def idle_profile(_elapsed: float) -> float:
+    """Return no flow."""
+    return 0.0
+
+
+def shower_profile(elapsed: float) -> float:
+    """Return an 8-minute shower at 9 L/min every 30 minutes."""
+    return 9.0 if elapsed % 1800 < 480 else 0.0
+
+
+def irrigation_profile(elapsed: float) -> float:
+    """Return a 20-minute irrigation run at 15 L/min every 2 hours."""
+    return 15.0 if elapsed % 7200 < 1200 else 0.0
+
+
+def leak_profile(_elapsed: float) -> float:
+    """Return a constant 0.2 L/min leak."""
+    return 0.2
+
+
+def household_profile(elapsed: float) -> float:
+    """Return the flow rate (L/min) at elapsed seconds into a simulated household.
+
+    Every hour starts with an 8-minute shower with a little jitter,
+    followed by a tap run at minute 20 and idle time otherwise.
+    """
+    minute = elapsed % 3600 / 60
+    if minute < 8:
+        return 9.0 + int(elapsed) % 7 * 0.05
+    if 20 <= minute < 21:
+        return 4.5
+    return 0.0
+
+
+PROFILES: dict[str, FlowProfile] = {
+    "idle": idle_profile,
+    "shower": shower_profile,
+    "irrigation": irrigation_profile,
+    "leak": leak_profile,
+    "household": household_profile,
+}
+
+
+@dataclass(kw_only=True)
+class VirtualDroplet:
+    """Configuration and state of one virtual device."""
+
+    device_id: str
+    token: str
+    profile: FlowProfile = household_profile
+    rate_hz: float = 1.0
+    speed: float = 1.0  # Profile seconds per wall-clock second
+    disconnect_after: float | None = None  # Close each connection after this many seconds
+    phase: float = 0.0  # Profile offset in seconds, so devices do not all peak together
+    model: str = "Droplet"
+    manufacturer: str = "Hydrific"
+    firmware: str = "1.0.0"
+    serial: str = ""
+    connections: int = field(default=0, init=False)
+    messages: int = field(default=0, init=False)
+
+    def info_message(self) -> dict[str, str]:
+        """Return the device metadata message."""
+        return {
+            "ids": self.device_id,
+            "mdl": self.model,
+            "mf": self.manufacturer,
+            "sw": self.firmware,
+            "sn": self.serial or self.device_id.upper(),
+        }
+
+
+class FakeDropletServer:
+    """Serve any number of virtual Droplet devices on one local port."""
+
+    def __init__(
+        self, devices: list[VirtualDroplet], host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        """Initialize the server; port 0 picks a free port on start."""
+        self.devices = devices
+        self.host = host
+        self.port = port
+        self._by_token = {device.token: device for device in devices}
+        self._runner: web.AppRunner | None = None
+        self._started = datetime.now(UTC)
+
+    async def async_start(self) -> None:
+        """Start the TLS WebSocket endpoint."""
+        app = web.Application()
+        app.router.add_get("/ws", self._handle)
+        self._runner = web.AppRunner(app, handle_signals=False)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port, ssl_context=_self_signed_context())
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        self._started = datetime.now(UTC)
+
+    async def async_stop(self) -> None:
+        """Stop the endpoint and close all connections."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        """Stream the device matching the pairing code."""
+        device = self._by_token.get(request.headers.get("Authorization", ""))
+        if device is None:
+            raise web.HTTPUnauthorized
+        ws = web.WebSocketResponse(heartbeat=10)
+        await ws.prepare(request)
+        device.connections += 1
+        sender = asyncio.create_task(self._stream(device, ws))
+        # Reading is what notices the client closing the connection
+        async for _message in ws:
+            pass
+        sender.cancel()
+        with contextlib.suppress(asyncio.CancelledError, ConnectionResetError):
+            await sender
+        return ws
+
+    async def _stream(self, device: VirtualDroplet, ws: web.WebSocketResponse) -> None:
+        """Send metadata, then state messages at the device rate until closed."""
+        loop = asyncio.get_running_loop()
+        connected = loop.time()
+        interval = 1 / device.rate_hz
+        await ws.send_json(device.info_message())
+        await ws.send_json({"server": "Connected", "signal": "Strong Signal"})
+        tick = connected
+        while not ws.closed:
+            tick += interval
+            await asyncio.sleep(max(tick - loop.time(), 0))
+            if device.disconnect_after is not None and loop.time() - connected >= (
+                device.disconnect_after
+            ):
+                await ws.close(code=WSCloseCode.GOING_AWAY)
+                return
+            # Profiles run on a shared clock, so reconnects continue where they left off
+            elapsed = (datetime.now(UTC) - self._started).total_seconds() * device.speed
+            elapsed += device.phase
+            flow = device.profile(elapsed)
+            volume = flow / 60 * interval * device.speed * 1000
+            await ws.send_json({"flow": round(flow, 3), "volume": round(volume, 3)})
+            device.messages += 1
+
+
+def make_devices(
+    count: int,
+    *,
+    profile: FlowProfile = household_profile,
+    rate_hz: float = 1.0,
+    speed: float = 1.0,
+    disconnect_after: float | None = None,
+) -> list[VirtualDroplet]:
+    """Create count virtual devices with distinct IDs and pairing codes."""
+    return [
+        VirtualDroplet(
+            device_id=f"droplet-fake-{index:03d}",
+            token=f"FAKE{index:04d}",
+            profile=profile,
+            rate_hz=rate_hz,
+            speed=speed,
+            disconnect_after=disconnect_after,
+            phase=index * 97.0,
+        )
+        for index in range(count)
+    ]
+
+
+def _self_signed_context() -> ssl.SSLContext:
+    """Return a server TLS context with a throwaway self-signed certificate.
+
+    pydroplet always connects over TLS and does not verify the certificate.
+    """
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "droplet.local")])
+    now = datetime.now(UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=365))
+        .sign(key, hashes.SHA256())
+    )
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    with tempfile.TemporaryDirectory() as directory:
+        cert_path = Path(directory, "cert.pem")
+        key_path = Path(directory, "key.pem")
+        cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+        key_path.write_bytes(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+        context.load_cert_chain(cert_path, key_path)
+    return context
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Serve devices until cancelled."""
+    server = FakeDropletServer(
+        make_devices(
+            args.devices,
+            profile=PROFILES[args.profile],
+            rate_hz=args.rate,
+            speed=args.speed,
+            disconnect_after=args.disconnect_after,
+        ),
+        host=args.host,
+        port=args.port,
+    )
+    await server.async_start()
+    _LOGGER.info("Serving %d devices on %s:%d", len(server.devices), server.host, server.port)
+    for device in server.devices:
+        _LOGGER.info("%s: pairing code %s", device.device_id, device.token)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.async_stop()
+
+
+def main() -> None:
+    """Run the fake server from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=1, help="number of virtual devices")
+    parser.add_argument("--rate", type=float, default=1.0, help="messages per second per device")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="household")
+    parser.add_argument("--speed", type=float, default=1.0, help="profile time acceleration")
+    parser.add_argument(
+        "--disconnect-after", type=float, default=None, help="close connections after N seconds"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=443)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -50,9 +50,10 @@ async def test_binary_sensor_on_when_leak(
 
     # Simulate leak detection
     now_ts = dt_util.now().timestamp()
-    coordinator._hourly_flow_stats = [(now_ts - 3600 * i, 2.0, 0.5) for i in range(24)]
-    coordinator._evaluate_leak()
-    coordinator.async_set_updated_data(None)
+    coordinator._flow_rate = 0.5
+    coordinator._evaluate_leak(now_ts - coordinator.water_leak_duration)
+    coordinator._evaluate_leak(now_ts)
+    coordinator.async_publish_snapshot()
     await hass.async_block_till_done()
 
     ent_reg = er.async_get(hass)
@@ -6,9 +6,20 @@ from unittest.mock import AsyncMock, MagicMock
 
 from custom_components.droplet_plus.const import (
     CONF_DEVICE_ID,
+    CONF_GAP_FILL,
+    CONF_HIGH_FLOW_DURATION,
+    CONF_HIGH_FLOW_THRESHOLD,
+    CONF_STATISTICS_INTERVAL,
+    CONF_WATER_LEAK_DURATION,
     CONF_WATER_LEAK_THRESHOLD,
     CONF_WATER_TARIFF,
+    DEFAULT_GAP_FILL,
+    DEFAULT_HIGH_FLOW_DURATION,
+    DEFAULT_HIGH_FLOW_THRESHOLD,
+    DEFAULT_STATISTICS_INTERVAL,
+    DEFAULT_WATER_LEAK_DURATION,
     DOMAIN,
+    GAP_FILL_GAPS,
 )
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_TOKEN
@@ -49,6 +60,11 @@ async def test_user_flow_success(
     assert result["data"][CONF_DEVICE_ID] == TEST_DEVICE_ID
     assert result["options"][CONF_WATER_TARIFF] == 3.50
     assert result["options"][CONF_WATER_LEAK_THRESHOLD] == 0.05
+    assert result["options"][CONF_WATER_LEAK_DURATION] == DEFAULT_WATER_LEAK_DURATION
+    assert result["options"][CONF_HIGH_FLOW_THRESHOLD] == DEFAULT_HIGH_FLOW_THRESHOLD
+    assert result["options"][CONF_HIGH_FLOW_DURATION] == DEFAULT_HIGH_FLOW_DURATION
+    assert result["options"][CONF_STATISTICS_INTERVAL] == DEFAULT_STATISTICS_INTERVAL
+    assert result["options"][CONF_GAP_FILL] == DEFAULT_GAP_FILL
 
 
 async def test_user_flow_cannot_connect(
@@ -145,6 +161,11 @@ async def test_zeroconf_flow(
     assert result["data"][CONF_DEVICE_ID] == TEST_DEVICE_ID
     assert result["options"][CONF_WATER_TARIFF] == 3.50
     assert result["options"][CONF_WATER_LEAK_THRESHOLD] == 0.05
+    assert result["options"][CONF_WATER_LEAK_DURATION] == DEFAULT_WATER_LEAK_DURATION
+    assert result["options"][CONF_HIGH_FLOW_THRESHOLD] == DEFAULT_HIGH_FLOW_THRESHOLD
+    assert result["options"][CONF_HIGH_FLOW_DURATION] == DEFAULT_HIGH_FLOW_DURATION
+    assert result["options"][CONF_STATISTICS_INTERVAL] == DEFAULT_STATISTICS_INTERVAL
+    assert result["options"][CONF_GAP_FILL] == DEFAULT_GAP_FILL
 
 
 async def test_options_flow(
@@ -158,11 +179,24 @@ async def test_options_flow(
 
     result = await hass.config_entries.options.async_configure(
         result["flow_id"],
-        {CONF_WATER_TARIFF: 5.50, CONF_WATER_LEAK_THRESHOLD: 0.1},
+        {
+            CONF_WATER_TARIFF: 5.50,
+            CONF_WATER_LEAK_THRESHOLD: 0.1,
+            CONF_WATER_LEAK_DURATION: 30,
+            CONF_HIGH_FLOW_THRESHOLD: 40.0,
+            CONF_HIGH_FLOW_DURATION: 5,
+            CONF_STATISTICS_INTERVAL: 300,
+            CONF_GAP_FILL: GAP_FILL_GAPS,
+        },
     )
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["data"][CONF_WATER_TARIFF] == 5.50
     assert result["data"][CONF_WATER_LEAK_THRESHOLD] == 0.1
+    assert result["data"][CONF_WATER_LEAK_DURATION] == 30
+    assert result["data"][CONF_HIGH_FLOW_THRESHOLD] == 40.0
+    assert result["data"][CONF_HIGH_FLOW_DURATION] == 5
+    assert result["data"][CONF_STATISTICS_INTERVAL] == 300
+    assert result["data"][CONF_GAP_FILL] == GAP_FILL_GAPS
 
 
 async def test_reconfigure_flow(
@@ -2,13 +2,39 @@
 
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
 from datetime import timedelta
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
-
-from custom_components.droplet_plus.const import EVENT_WATER_LEAK_CLEARED, EVENT_WATER_LEAK_DETECTED
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+    async_fire_time_changed,
+)
+
+from custom_components.droplet_plus.const import (
+    CONF_GAP_FILL,
+    CONF_HIGH_FLOW_DURATION,
+    CONF_HIGH_FLOW_THRESHOLD,
+    CONF_WATER_LEAK_DURATION,
+    DEFAULT_WATER_LEAK_DURATION,
+    EVENT_DEVICE_TRIGGER,
+    EVENT_HIGH_FLOW_CLEARED,
+    EVENT_HIGH_FLOW_DETECTED,
+    EVENT_WATER_LEAK_CLEARED,
+    EVENT_WATER_LEAK_DETECTED,
+    EVENT_WATER_USAGE,
+    GAP_FILL_GAPS,
+    JOURNAL_MAX_DELAY,
+    TRIGGER_DEVICE_OFFLINE,
+    TRIGGER_DEVICE_ONLINE,
+    USAGE_EVENTS_MAX,
+    USAGE_IDLE_GAP,
+)
+from custom_components.droplet_plus.coordinator import DropletCoordinator
+from custom_components.droplet_plus.helpers import is_new_hour, next_hour
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
@@ -33,6 +59,54 @@ async def test_on_update_captures_delta(
     assert coordinator.lifetime_volume == pytest.approx(0.1)  # 100 mL = 0.1 L
 
 
+async def test_on_update_records_stage_timings(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test every _on_update stage and the inter-arrival time are timed."""
+    coordinator = mock_setup_entry.runtime_data
+
+    coordinator._on_update(None)
+    coordinator._on_update(None)
+
+    profiler = coordinator.profiler
+    assert profiler.frame_count == 2
+    for stage in ("read", "record", "trim", "flow_analysis", "snapshot", "fanout", "total"):
+        assert len(profiler.stage_durations(stage)) == 2
+    assert profiler.rollover.total_count == 0
+    assert profiler.inter_arrival.total_count == 1
+
+
+async def test_health_refreshed_on_slow_channel(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test health counters are summarized on the slow refresh, including reconnects."""
+    coordinator = mock_setup_entry.runtime_data
+    assert coordinator.data.health.reconnect_count == 0
+
+    coordinator._on_update(None)
+    mock_droplet.get_availability.return_value = False
+    coordinator._on_update(None)
+    mock_droplet.get_availability.return_value = True
+    coordinator._on_update(None)
+    coordinator._on_update(None)
+    # Health is only recomputed on the slow channel
+    assert coordinator.data.health.reconnect_count == 0
+
+    coordinator._handle_slow_refresh(dt_util.now())
+
+    health = coordinator.data.health
+    assert health is coordinator.health
+    assert health.reconnect_count == 1
+    assert health.message_rate is not None
+    assert health.message_rate > 0
+    assert health.processing_time_p95 is not None
+    assert health.last_message_age is not None
+    assert health.last_message_age >= 0
+
+
 async def test_volume_properties_combine_baseline_and_accumulator(
     hass: HomeAssistant,
     mock_setup_entry: MockConfigEntry,
@@ -85,8 +159,7 @@ async def test_hourly_boundary_crossing(
 
     # Force hour boundary crossing
     coordinator._hourly_reset = dt_util.now() - timedelta(hours=2)
-    mock_droplet.get_volume_delta.return_value = 10.0
-    coordinator._on_update(None)
+    coordinator._handle_period_rollover(dt_util.utcnow())
 
     # Hourly baseline should be reset (accumulator was reset by mock side_effect)
     assert coordinator._baseline_hourly == 0.0
@@ -95,7 +168,33 @@ async def test_hourly_boundary_crossing(
     )
     # Hourly consumption buffer should have the finalized hour
     assert len(coordinator._hourly_consumption) == 1
-    assert coordinator._hourly_consumption[0][1] == pytest.approx(1.0)
+    assert list(coordinator._hourly_consumption)[0][1] == pytest.approx(1.0)
+
+
+async def test_rollover_fires_without_frames(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test the rollover timer finalizes the hour even when no frame arrives."""
+    coordinator = mock_setup_entry.runtime_data
+    coordinator._baseline_hourly = 2.0
+    boundary = next_hour(coordinator.hourly_reset)
+
+    with patch(
+        "custom_components.droplet_plus.coordinator.is_new_hour", wraps=is_new_hour
+    ) as mock_is_new_hour:
+        coordinator._on_update(None)
+        mock_is_new_hour.assert_not_called()
+
+        async_fire_time_changed(hass, boundary + timedelta(seconds=1))
+        await hass.async_block_till_done()
+        mock_is_new_hour.assert_called()
+
+    assert coordinator._baseline_hourly == 0.0
+    assert list(coordinator._hourly_consumption)[-1][1] == pytest.approx(2.0)
+    assert coordinator.hourly_reset >= boundary
+    assert coordinator._rollover_unsub is not None
 
 
 async def test_daily_boundary_crossing(
@@ -112,12 +211,52 @@ async def test_daily_boundary_crossing(
     # Force day boundary
     coordinator._daily_reset = dt_util.now() - timedelta(days=2)
     coordinator._hourly_reset = dt_util.now() - timedelta(hours=2)
-    mock_droplet.get_volume_delta.return_value = 100.0
-    coordinator._on_update(None)
+    coordinator._handle_period_rollover(dt_util.utcnow())
 
     assert coordinator._baseline_daily == 0.0
     assert len(coordinator._daily_consumption) == 1
-    assert coordinator._daily_consumption[0][1] == pytest.approx(5.0)
+    assert list(coordinator._daily_consumption)[0][1] == pytest.approx(5.0)
+
+
+async def test_stale_boundaries_backfill_zeros(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test hours missed during downtime are filled with zero consumption."""
+    coordinator = mock_setup_entry.runtime_data
+    coordinator._clear_period_statistics()
+
+    coordinator._baseline_hourly = 10.0
+    coordinator._hourly_reset = dt_util.now() - timedelta(hours=5)
+    coordinator._handle_stale_boundaries()
+
+    # The stale hour plus the four whole hours missed after it
+    volumes = [volume for _, volume in coordinator._hourly_consumption]
+    assert volumes == [10.0, 0.0, 0.0, 0.0, 0.0]
+    coordinator.async_publish_snapshot()
+    assert coordinator.data.avg_hourly_24h == pytest.approx(2.0)
+
+
+async def test_stale_boundaries_backfill_gaps(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test missed hours are left out of averages in gaps mode."""
+    coordinator = mock_setup_entry.runtime_data
+    hass.config_entries.async_update_entry(
+        mock_setup_entry,
+        options={**mock_setup_entry.options, CONF_GAP_FILL: GAP_FILL_GAPS},
+    )
+    await hass.async_block_till_done()
+    coordinator._clear_period_statistics()
+
+    coordinator._baseline_hourly = 10.0
+    coordinator._hourly_reset = dt_util.now() - timedelta(hours=5)
+    coordinator._handle_stale_boundaries()
+
+    assert len(coordinator._hourly_consumption) == 1
+    coordinator.async_publish_snapshot()
+    assert coordinator.data.avg_hourly_24h == pytest.approx(10.0)
 
 
 async def test_flow_samples_recorded(
@@ -135,9 +274,10 @@ async def test_flow_samples_recorded(
     mock_droplet.get_flow_rate.return_value = 2.5
     coordinator._on_update(None)
 
-    assert len(coordinator._flow_samples) == 2
-    assert coordinator._flow_samples[0][1] == 1.5
-    assert coordinator._flow_samples[1][1] == 2.5
+    samples = list(coordinator._flow_samples)
+    assert len(samples) == 2
+    assert samples[0][1] == 1.5
+    assert samples[1][1] == 2.5
 
 
 async def test_hourly_flow_stats_tracking(
@@ -179,7 +319,8 @@ async def test_cost_calculation_metric(
 
     # Simulate 1000L = 1m³ via baseline
     coordinator._baseline_daily = 1000.0
-    assert coordinator.daily_cost == pytest.approx(5.0)
+    coordinator.async_publish_snapshot()
+    assert coordinator.data.daily_cost == pytest.approx(5.0)
 
 
 async def test_cost_calculation_zero_tariff(
@@ -189,7 +330,54 @@ async def test_cost_calculation_zero_tariff(
     """Test cost is zero when tariff is zero."""
     coordinator = mock_setup_entry.runtime_data
     coordinator._baseline_daily = 1000.0
-    assert coordinator.daily_cost == 0.0
+    coordinator.async_publish_snapshot()
+    assert coordinator.data.daily_cost == 0.0
+
+
+async def test_snapshot_built_on_update(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test each update publishes an immutable snapshot of derived values."""
+    coordinator = mock_setup_entry.runtime_data
+    hass.config_entries.async_update_entry(
+        mock_setup_entry,
+        options={**mock_setup_entry.options, "water_tariff": 5.0},
+    )
+    coordinator._baseline_daily = 1000.0
+    mock_droplet.get_flow_rate.return_value = 3.0
+
+    coordinator._on_update(None)
+    snapshot = coordinator.data
+
+    assert snapshot.available is True
+    assert snapshot.flow_rate == 3.0
+    assert snapshot.daily_volume == pytest.approx(coordinator.daily_volume)
+    assert snapshot.daily_cost == pytest.approx(5.0)
+    assert snapshot.avg_flow_1h == pytest.approx(3.0)
+    with pytest.raises(FrozenInstanceError):
+        snapshot.flow_rate = 0.0  # type: ignore[misc]
+
+    coordinator._on_update(None)
+    assert coordinator.data is not snapshot
+
+
+async def test_snapshot_refreshed_on_options_update(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test a tariff change is reflected without waiting for a frame."""
+    coordinator = mock_setup_entry.runtime_data
+    coordinator._baseline_daily = 1000.0
+
+    hass.config_entries.async_update_entry(
+        mock_setup_entry,
+        options={**mock_setup_entry.options, "water_tariff": 2.0},
+    )
+    await hass.async_block_till_done()
+
+    assert coordinator.data.daily_cost == pytest.approx(2.0)
 
 
 async def test_statistics_avg_flow_1h(
@@ -201,7 +389,7 @@ async def test_statistics_avg_flow_1h(
     coordinator = mock_setup_entry.runtime_data
 
     # No samples yet
-    assert coordinator.avg_flow_1h is None
+    assert coordinator.data.avg_flow_1h is None
 
     # Add samples
     mock_droplet.get_volume_delta.return_value = 10.0
@@ -211,45 +399,113 @@ async def test_statistics_avg_flow_1h(
     mock_droplet.get_flow_rate.return_value = 4.0
     coordinator._on_update(None)
 
-    assert coordinator.avg_flow_1h == pytest.approx(3.0)
+    assert coordinator.data.avg_flow_1h == pytest.approx(3.0)
 
 
-async def test_leak_detection_triggered(
+async def test_flow_samples_roll_up_into_tiers(
     hass: HomeAssistant,
     mock_setup_entry: MockConfigEntry,
 ) -> None:
-    """Test leak detection triggers when min_flow > threshold."""
+    """Test samples aging out of the raw buffer feed the downsampled tiers."""
     coordinator = mock_setup_entry.runtime_data
+    now_ts = dt_util.now().timestamp()
+    coordinator._flow_samples.clear()
+    coordinator._flow_samples.append(now_ts - 2 * 86400, 9.0)  # beyond the minute tier
+    coordinator._flow_samples.append(now_ts - 7200, 4.0)
+    coordinator._flow_samples.append(now_ts - 60, 2.0)
+
+    coordinator._trim_buffers(now_ts)
 
-    # Set threshold to 0 (default)
-    # Set hourly flow stats with min > 0
+    assert len(coordinator._flow_samples) == 1
+    assert coordinator.flow_minutes_count == 1
+    assert coordinator.flow_quarters_count == 1
+    coordinator.async_publish_snapshot()
+    assert coordinator.data.avg_flow_1h == pytest.approx(2.0)
+    assert coordinator.data.avg_flow_24h == pytest.approx(3.0)
+    assert coordinator.data.avg_flow_30d == pytest.approx(5.0)
+
+
+async def test_leak_detection_triggered(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test a leak is raised once flow runs without a break for the leak duration."""
+    coordinator = mock_setup_entry.runtime_data
+    duration = coordinator.water_leak_duration
     now_ts = dt_util.now().timestamp()
-    coordinator._hourly_flow_stats = [(now_ts - 3600 * i, 2.0, 0.5) for i in range(24)]
 
-    # Evaluate leak
-    coordinator._evaluate_leak()
+    coordinator._flow_rate = 0.5
+    coordinator._volume_delta = 10.0
+    coordinator._evaluate_leak(now_ts - duration)
+    coordinator._evaluate_leak(now_ts - 1)
+    assert coordinator.water_leak_detected is False
+    assert coordinator.pending_leak_event is None
+
+    coordinator._flow_rate = 0.2
+    coordinator._evaluate_leak(now_ts)
 
     assert coordinator.water_leak_detected is True
     assert coordinator.pending_leak_event is not None
-    assert coordinator.pending_leak_event[0] == EVENT_WATER_LEAK_DETECTED
+    event_type, event_data = coordinator.pending_leak_event
+    assert event_type == EVENT_WATER_LEAK_DETECTED
+    assert event_data["duration"] == pytest.approx(duration)
+    assert event_data["volume"] == pytest.approx(0.03)
+    assert event_data["min_flow"] == pytest.approx(0.2)
+    assert event_data["mean_flow"] == pytest.approx(0.4)
+    assert event_data["threshold"] == 0.0
 
 
-async def test_leak_detection_cleared(
+async def test_leak_duration_option(
     hass: HomeAssistant,
     mock_setup_entry: MockConfigEntry,
 ) -> None:
-    """Test leak detection clears when min_flow <= threshold."""
+    """Test the leak duration option is read in minutes."""
     coordinator = mock_setup_entry.runtime_data
-    coordinator._water_leak_detected = True
+    assert coordinator.water_leak_duration == DEFAULT_WATER_LEAK_DURATION * 60
+
+    hass.config_entries.async_update_entry(
+        mock_setup_entry,
+        options={**mock_setup_entry.options, CONF_WATER_LEAK_DURATION: 5},
+    )
+    await hass.async_block_till_done()
+    assert coordinator.water_leak_duration == 300
+
 
+async def test_leak_run_broken_by_low_flow(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test a sample at or below the threshold starts the run over."""
+    coordinator = mock_setup_entry.runtime_data
+    duration = coordinator.water_leak_duration
     now_ts = dt_util.now().timestamp()
-    coordinator._hourly_flow_stats = [(now_ts - 3600 * i, 2.0, 0.0) for i in range(24)]
 
-    coordinator._evaluate_leak()
+    coordinator._flow_rate = 0.5
+    coordinator._evaluate_leak(now_ts - duration)
+    coordinator._flow_rate = 0.0
+    coordinator._evaluate_leak(now_ts - duration / 2)
+    coordinator._flow_rate = 0.5
+    coordinator._evaluate_leak(now_ts)
+
+    assert coordinator.water_leak_detected is False
+    assert coordinator.flow_run.start == now_ts
+
+
+async def test_leak_detection_cleared(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test a detected leak clears on the first sample at or below the threshold."""
+    coordinator = mock_setup_entry.runtime_data
+    coordinator._water_leak_detected = True
+
+    coordinator._flow_rate = 0.0
+    coordinator._evaluate_leak(dt_util.now().timestamp())
 
     assert coordinator.water_leak_detected is False
     assert coordinator.pending_leak_event is not None
     assert coordinator.pending_leak_event[0] == EVENT_WATER_LEAK_CLEARED
+    assert not coordinator.flow_run.active
 
 
 async def test_leak_no_change(
@@ -259,12 +515,263 @@ async def test_leak_no_change(
     """Test leak detection does nothing when state unchanged."""
     coordinator = mock_setup_entry.runtime_data
 
-    # No flow stats → min_flow is None → no change
-    coordinator._evaluate_leak()
+    # No flow → no run → no change
+    coordinator._evaluate_leak(dt_util.now().timestamp())
     assert coordinator.water_leak_detected is False
     assert coordinator.pending_leak_event is None
 
 
+async def test_leak_detected_on_slow_refresh(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test a run reaching the leak duration between frames is detected by the slow channel."""
+    coordinator = mock_setup_entry.runtime_data
+    now = dt_util.now()
+
+    coordinator._flow_rate = 0.5
+    coordinator._evaluate_leak(now.timestamp() - coordinator.water_leak_duration)
+    assert coordinator.water_leak_detected is False
+
+    coordinator._handle_slow_refresh(now)
+
+    assert coordinator.water_leak_detected is True
+    assert coordinator.data.water_leak_detected is True
+
+
+async def test_flow_run_from_frames(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test WebSocket frames extend the flow run and a disconnect ends it."""
+    coordinator = mock_setup_entry.runtime_data
+    mock_droplet.get_volume_delta.return_value = 250.0  # mL
+
+    for flow in (1.0, 3.0):
+        mock_droplet.get_flow_rate.return_value = flow
+        coordinator._on_update(None)
+
+    run = coordinator.flow_run
+    assert run.active
+    assert run.volume == pytest.approx(0.5)
+    assert run.min_flow == 1.0
+    assert run.mean_flow == pytest.approx(2.0)
+
+    mock_droplet.get_availability.return_value = False
+    coordinator._on_update(None)
+    assert not run.active
+
+
+async def test_high_flow_disabled_by_default(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test no high flow is raised while the threshold is 0."""
+    coordinator = mock_setup_entry.runtime_data
+    mock_droplet.get_flow_rate.return_value = 80.0
+    coordinator._on_update(None)
+
+    assert coordinator.high_flow_detected is False
+    assert coordinator.pending_high_flow_event is None
+
+
+async def test_high_flow_detected_after_duration(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test high flow fires on the frame that reaches the duration, and clears on low flow."""
+    coordinator = mock_setup_entry.runtime_data
+    hass.config_entries.async_update_entry(
+        mock_setup_entry,
+        options={
+            **mock_setup_entry.options,
+            CONF_HIGH_FLOW_THRESHOLD: 30.0,
+            CONF_HIGH_FLOW_DURATION: 5,
+        },
+    )
+    await hass.async_block_till_done()
+    triggers = async_capture_events(hass, EVENT_DEVICE_TRIGGER)
+
+    mock_droplet.get_flow_rate.return_value = 45.0
+    for _ in range(5):
+        coordinator._on_update(None)
+        freezer.tick(timedelta(seconds=1))
+    assert coordinator.high_flow_detected is False
+
+    coordinator._on_update(None)
+    assert coordinator.high_flow_detected is True
+    # The bus event is fired synchronously inside the callback
+    assert [event.data["type"] for event in triggers] == [EVENT_HIGH_FLOW_DETECTED]
+    assert triggers[0].data["flow"] == 45.0
+    assert triggers[0].data["duration"] == pytest.approx(5.0)
+
+    mock_droplet.get_flow_rate.return_value = 2.0
+    coordinator._on_update(None)
+    assert coordinator.high_flow_detected is False
+    assert triggers[-1].data["type"] == EVENT_HIGH_FLOW_CLEARED
+
+
+async def test_connection_triggers_skip_setup(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test the first connection after setup fires no trigger; later changes do."""
+    coordinator = mock_setup_entry.runtime_data
+    triggers = async_capture_events(hass, EVENT_DEVICE_TRIGGER)
+    mock_droplet.get_flow_rate.return_value = 0.0
+
+    coordinator._on_update(None)
+    assert triggers == []
+
+    mock_droplet.get_availability.return_value = False
+    coordinator._on_update(None)
+    mock_droplet.get_availability.return_value = True
+    coordinator._on_update(None)
+    assert [e.data["type"] for e in triggers] == [TRIGGER_DEVICE_OFFLINE, TRIGGER_DEVICE_ONLINE]
+
+
+async def test_usage_event_segmented(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test flow frames form one usage event that completes after the idle gap."""
+    coordinator = mock_setup_entry.runtime_data
+    triggers = async_capture_events(hass, EVENT_DEVICE_TRIGGER)
+    mock_droplet.get_volume_delta.return_value = 100.0  # mL
+    start = dt_util.now()
+
+    for flow in (6.0, 9.0, 6.0):
+        mock_droplet.get_flow_rate.return_value = flow
+        coordinator._on_update(None)
+        freezer.tick(timedelta(seconds=1))
+
+    # The first frame without flow ends the event but does not complete it yet
+    mock_droplet.get_flow_rate.return_value = 0.0
+    coordinator._on_update(None)
+    freezer.tick(timedelta(seconds=USAGE_IDLE_GAP - 1))
+    coordinator._on_update(None)
+    assert coordinator.usage_run.active
+    assert coordinator.data.last_usage is None
+
+    freezer.tick(timedelta(seconds=1))
+    coordinator._on_update(None)
+
+    assert not coordinator.usage_run.active
+    event = coordinator.data.last_usage
+    assert event is not None
+    assert event.start == start
+    assert event.duration == pytest.approx(3.0)
+    assert event.volume == pytest.approx(0.4)
+    assert event.peak_flow == 9.0
+    assert [e.data["type"] for e in triggers] == [EVENT_WATER_USAGE]
+    assert triggers[0].data["volume"] == pytest.approx(0.4)
+    assert triggers[0].data["peak_flow"] == 9.0
+    assert triggers[0].data["end"] == event.end.isoformat()
+
+
+async def test_usage_event_continues_within_idle_gap(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test flow resuming before the idle gap passes extends the same event."""
+    coordinator = mock_setup_entry.runtime_data
+
+    for flow in (4.0, 0.0, 4.0, 0.0):
+        mock_droplet.get_flow_rate.return_value = flow
+        coordinator._on_update(None)
+        freezer.tick(timedelta(seconds=USAGE_IDLE_GAP - 5))
+    freezer.tick(timedelta(seconds=5))
+    coordinator._on_update(None)
+
+    assert len(coordinator.usage_events) == 1
+    assert coordinator.usage_events[0].duration == pytest.approx(3 * (USAGE_IDLE_GAP - 5))
+
+
+async def test_usage_event_completed_on_slow_refresh(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test an event completes on the slow channel when no frames follow the flow stop."""
+    coordinator = mock_setup_entry.runtime_data
+    coordinator._on_update(None)
+    mock_droplet.get_flow_rate.return_value = 0.0
+    coordinator._on_update(None)
+
+    freezer.tick(timedelta(seconds=USAGE_IDLE_GAP))
+    coordinator._handle_slow_refresh(dt_util.now())
+
+    assert coordinator.data.last_usage is not None
+    assert not coordinator.usage_run.active
+
+
+async def test_usage_event_completed_on_disconnect(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test a disconnect completes the event in progress."""
+    coordinator = mock_setup_entry.runtime_data
+    coordinator._on_update(None)
+
+    mock_droplet.get_availability.return_value = False
+    coordinator._on_update(None)
+
+    assert coordinator.data.last_usage is not None
+    assert coordinator.data.last_usage.peak_flow == 2.5
+
+
+async def test_usage_events_bounded(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test only the most recent usage events are kept."""
+    coordinator = mock_setup_entry.runtime_data
+    for i in range(USAGE_EVENTS_MAX + 5):
+        coordinator._record_usage_event(1000.0 * i, 1000.0 * i + 10, float(i), 5.0)
+
+    events = coordinator.usage_events
+    assert len(events) == USAGE_EVENTS_MAX
+    assert events[0].volume == 5.0
+
+
+async def test_usage_events_persisted(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test usage events survive a restart from the snapshot and from the journal."""
+    coordinator = mock_setup_entry.runtime_data
+    now_ts = dt_util.now().timestamp()
+    coordinator._usage_run.add(now_ts - 60, 8.0, 2.0)
+    coordinator._usage_run.add(now_ts - 40, 0.0, 1.0)
+    coordinator._end_usage()
+    await coordinator._async_save_data()
+
+    coordinator._usage_run.add(now_ts - 20, 3.0, 0.5)
+    coordinator._end_usage()
+    await coordinator._async_flush_journal(dt_util.now())
+
+    coordinator._usage_events.clear()
+    coordinator._last_usage = None
+    await coordinator._async_load_data()
+
+    events = coordinator.usage_events
+    assert [event.volume for event in events] == [3.0, 0.5]
+    assert events[0].peak_flow == 8.0
+    assert events[0].duration == pytest.approx(20.0)
+    assert coordinator._last_usage == events[-1]
+
+
 async def test_consume_leak_event(
     hass: HomeAssistant,
     mock_setup_entry: MockConfigEntry,
@@ -308,6 +815,164 @@ async def test_persistence_save_load(
     assert coordinator._water_leak_detected is True
 
 
+async def test_journal_replayed_after_crash(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test changes flushed to the journal survive a restart without compaction."""
+    coordinator = mock_setup_entry.runtime_data
+    await coordinator._async_save_data()
+
+    mock_droplet.get_flow_rate.return_value = 2.5
+    coordinator._on_update(None)
+    coordinator._baseline_lifetime = 42.0
+    await coordinator._async_flush_journal(dt_util.now())
+    assert coordinator._journal.pending_count == 0
+
+    # Simulate a crash: the in-memory state is lost, only disk survives
+    coordinator._baseline_lifetime = 0.0
+    coordinator._flow_samples.clear()
+    await coordinator._async_load_data()
+
+    assert coordinator._baseline_lifetime == pytest.approx(42.0)
+    assert [v for _ts, v in coordinator._flow_samples][-1] == 2.5
+
+
+async def test_journal_flush_coalesces_flow_samples(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test volume changes and finalized periods flush on the next tick; flow samples wait."""
+    coordinator = mock_setup_entry.runtime_data
+    journal = coordinator._journal
+    now = dt_util.now()
+    coordinator._on_update(None)
+    await coordinator._async_flush_journal(now)
+    assert journal.pending_count == 0
+
+    # Flow samples without a volume change: held back until the max delay
+    coordinator._on_update(None)
+    await coordinator._async_flush_journal(now + timedelta(seconds=5))
+    assert journal.pending_count > 0
+    await coordinator._async_flush_journal(now + timedelta(seconds=JOURNAL_MAX_DELAY))
+    assert journal.pending_count == 0
+
+    # Water flowing: every tick checkpoints the new lifetime volume
+    for tick in (1, 2):
+        mock_droplet._accumulated_volumes["lifetime"] += 100.0  # mL
+        coordinator._on_update(None)
+        await coordinator._async_flush_journal(
+            now + timedelta(seconds=JOURNAL_MAX_DELAY + 5 * tick)
+        )
+        assert journal.pending_count == 0
+    checkpoint = (await journal.async_read())[-1]
+    assert checkpoint[0] == "c"
+    assert checkpoint[1]["lifetime_volume"] == pytest.approx(0.2)
+
+    # A finalized day is flushed on the next tick
+    coordinator._on_update(None)
+    coordinator._finalize_day(now.timestamp(), 12.0)
+    await coordinator._async_flush_journal(now + timedelta(seconds=JOURNAL_MAX_DELAY + 15))
+    assert journal.pending_count == 0
+
+
+async def test_journal_truncated_on_compaction(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test compaction folds the journal into the snapshot."""
+    coordinator = mock_setup_entry.runtime_data
+    coordinator._on_update(None)
+    await coordinator._async_flush_journal(dt_util.now())
+    epoch = coordinator._journal.epoch
+
+    await coordinator._async_save_data()
+
+    assert coordinator._journal.epoch == epoch + 1
+    assert await coordinator._journal.async_read() == []
+
+
+async def test_journal_from_previous_epoch_ignored(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test records already folded into the snapshot are not replayed twice."""
+    coordinator = mock_setup_entry.runtime_data
+    coordinator._on_update(None)
+    await coordinator._async_flush_journal(dt_util.now())
+
+    # Crash between writing the snapshot and truncating the journal
+    with patch("custom_components.droplet_plus.journal._truncate"):
+        await coordinator._async_save_data()
+    samples = len(coordinator._flow_samples)
+
+    await coordinator._async_load_data()
+
+    assert len(coordinator._flow_samples) == samples
+
+
+async def test_periodic_save_skipped_when_clean(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test the periodic save only writes after something changed."""
+    coordinator = mock_setup_entry.runtime_data
+    await coordinator._async_save_data()
+    assert coordinator.has_unsaved_changes is False
+
+    with patch.object(coordinator._store, "async_save") as mock_save:
+        await coordinator._async_save_periodic(dt_util.now())
+        mock_save.assert_not_called()
+
+        coordinator._on_update(None)
+        assert coordinator.has_unsaved_changes is True
+        await coordinator._async_save_periodic(dt_util.now())
+        mock_save.assert_called_once()
+
+    assert coordinator.has_unsaved_changes is False
+
+
+async def test_unchanged_sections_not_repacked(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test buffers untouched since the last save reuse their packed form."""
+    coordinator = mock_setup_entry.runtime_data
+    coordinator._on_update(None)
+    await coordinator._async_save_data()
+    hourly = coordinator._packed_sections["hourly_consumption"][1]
+    flow = coordinator._packed_sections["flow_samples"][1]
+
+    coordinator._on_update(None)
+    await coordinator._async_save_data()
+
+    assert coordinator._packed_sections["hourly_consumption"][1] is hourly
+    assert coordinator._packed_sections["flow_samples"][1] is not flow
+
+
+async def test_flow_minutes_dirty_only_on_rollup(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the minute tier only changes generation when samples roll into it."""
+    coordinator = mock_setup_entry.runtime_data
+    coordinator._on_update(None)
+    generation = coordinator._section_generation["flow_minutes"]
+
+    freezer.tick(timedelta(seconds=1))
+    coordinator._on_update(None)
+    assert coordinator._section_generation["flow_minutes"] == generation
+
+    # The first sample ages out of the raw hour into the minute tier
+    freezer.tick(timedelta(hours=1))
+    coordinator._on_update(None)
+    assert coordinator._section_generation["flow_minutes"] > generation
+    assert coordinator.flow_minutes_count == 1
+
+
 async def test_buffer_trimming(
     hass: HomeAssistant,
     mock_setup_entry: MockConfigEntry,
@@ -317,15 +982,43 @@ async def test_buffer_trimming(
     now_ts = dt_util.now().timestamp()
 
     # Add old and new flow samples
-    coordinator._flow_samples = [
-        (now_ts - 7200, 1.0),  # 2h old (should be trimmed)
-        (now_ts - 1800, 2.0),  # 30min old (should remain)
-    ]
+    coordinator._flow_samples.clear()
+    coordinator._flow_samples.append(now_ts - 7200, 1.0)  # 2h old (should be trimmed)
+    coordinator._flow_samples.append(now_ts - 1800, 2.0)  # 30min old (should remain)
 
     coordinator._trim_buffers(now_ts)
 
     assert len(coordinator._flow_samples) == 1
-    assert coordinator._flow_samples[0][1] == 2.0
+    assert list(coordinator._flow_samples)[0][1] == 2.0
+    coordinator.async_publish_snapshot()
+    assert coordinator.data.avg_flow_1h == pytest.approx(2.0)
+
+
+async def test_period_buffers_trimmed_at_boundaries(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test hourly/daily buffers are only trimmed when a period boundary fires."""
+    coordinator = mock_setup_entry.runtime_data
+    now_ts = dt_util.now().timestamp()
+
+    coordinator._record_hourly_consumption(now_ts - 8 * 86400, 5.0)  # older than 7d
+    coordinator._record_hourly_flow_stats(now_ts - 8 * 86400, 3.0, 1.0)
+
+    # A regular message leaves the hourly buffers alone
+    coordinator._on_update(None)
+    assert len(coordinator._hourly_consumption) == 1
+    assert len(coordinator._hourly_flow_stats) == 1
+
+    # Crossing the hour boundary expires the stale entries
+    coordinator._hourly_reset = dt_util.now() - timedelta(hours=2)
+    coordinator._handle_period_rollover(dt_util.utcnow())
+
+    assert [v for _ts, v in coordinator._hourly_consumption] != [5.0]
+    assert len(coordinator._hourly_consumption) == 1
+    assert all(ts >= now_ts - 7 * 86400 for ts, _mx, _mn in coordinator._hourly_flow_stats)
+    coordinator.async_publish_snapshot()
+    assert coordinator.data.peak_flow_7d != 3.0
 
 
 async def test_accumulators_registered_on_setup(
@@ -341,3 +1034,58 @@ async def test_accumulators_registered_on_setup(
     assert "monthly" in registered_names
     assert "yearly" in registered_names
     assert "lifetime" in registered_names
+
+
+async def test_accumulators_not_shared_between_droplets(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test each coordinator's pydroplet client keeps its own accumulators."""
+    mock_config_entry.add_to_hass(hass)
+    first = DropletCoordinator(hass, mock_config_entry)
+    second = DropletCoordinator(hass, mock_config_entry)
+
+    first._register_accumulators()
+    second._register_accumulators()
+    assert first._droplet._accumulators is not second._droplet._accumulators
+    assert len(second._droplet._accumulators) == 6
+
+    # Volume reported by one device stays out of the other's periods
+    first._droplet._update_accumulators(250.0)
+    assert first._droplet.get_accumulated_volume("hourly") == 250.0
+    assert second._droplet.get_accumulated_volume("hourly") == 0.0
+
+
+async def test_slow_listeners_on_interval(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test slow listeners are called on the slow refresh timer."""
+    coordinator = mock_setup_entry.runtime_data
+    slow_callback = MagicMock()
+    remove = coordinator.async_add_slow_listener(slow_callback)
+
+    coordinator._on_update(None)
+    slow_callback.assert_not_called()
+
+    coordinator._handle_slow_refresh(dt_util.now())
+    assert slow_callback.call_count == 1
+
+    remove()
+    coordinator._handle_slow_refresh(dt_util.now())
+    assert slow_callback.call_count == 1
+
+
+async def test_slow_listeners_on_period_boundary(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test slow listeners are called right after a period rollover."""
+    coordinator = mock_setup_entry.runtime_data
+    slow_callback = MagicMock()
+    coordinator.async_add_slow_listener(slow_callback)
+
+    coordinator._hourly_reset = dt_util.now() - timedelta(hours=2)
+    coordinator._handle_period_rollover(dt_util.utcnow())
+
+    assert slow_callback.call_count == 1
@@ -0,0 +1,87 @@
+"""Tests for Droplet device triggers."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_get_device_automations,
+    async_mock_service,
+)
+
+from custom_components.droplet_plus.const import (
+    CONF_HIGH_FLOW_DURATION,
+    CONF_HIGH_FLOW_THRESHOLD,
+    DOMAIN,
+    EVENT_HIGH_FLOW_DETECTED,
+)
+from custom_components.droplet_plus.device_trigger import TRIGGER_TYPES
+from homeassistant.components import automation
+from homeassistant.components.device_automation import DeviceAutomationType
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.setup import async_setup_component
+
+from .conftest import TEST_DEVICE_ID
+
+
+async def test_get_triggers(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test every trigger type is offered for the device."""
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, TEST_DEVICE_ID)})
+    assert device is not None
+
+    triggers = await async_get_device_automations(hass, DeviceAutomationType.TRIGGER, device.id)
+    assert {trigger["type"] for trigger in triggers if trigger["domain"] == DOMAIN} == (
+        TRIGGER_TYPES
+    )
+
+
+async def test_high_flow_trigger_fires(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test an automation on the high flow trigger runs with the event data."""
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, TEST_DEVICE_ID)})
+    assert device is not None
+    calls = async_mock_service(hass, "test", "automation")
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "device",
+                        "domain": DOMAIN,
+                        "device_id": device.id,
+                        "type": EVENT_HIGH_FLOW_DETECTED,
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data_template": {"flow": "{{ trigger.event.data.flow }}"},
+                    },
+                }
+            ]
+        },
+    )
+    hass.config_entries.async_update_entry(
+        mock_setup_entry,
+        options={
+            **mock_setup_entry.options,
+            CONF_HIGH_FLOW_THRESHOLD: 30.0,
+            CONF_HIGH_FLOW_DURATION: 0,
+        },
+    )
+    await hass.async_block_till_done()
+
+    mock_droplet.get_flow_rate.return_value = 45.0
+    mock_setup_entry.runtime_data._on_update(None)
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data["flow"] == 45.0
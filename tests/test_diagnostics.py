@@ -89,6 +89,53 @@ async def test_diagnostics_buffers(
     buffers = result["buffers"]
 
     assert "flow_samples_count" in buffers
+    assert buffers["flow_samples_bytes"] > 0
+    assert "unsaved_changes" in buffers
+    assert "flow_minutes_count" in buffers
+    assert "flow_quarters_count" in buffers
     assert "hourly_consumption_count" in buffers
     assert "daily_consumption_count" in buffers
     assert "hourly_flow_stats_count" in buffers
+
+
+async def test_diagnostics_usage_events(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test diagnostics usage events section."""
+    coordinator = mock_setup_entry.runtime_data
+    coordinator._record_usage_event(1000.0, 1045.0, 6.5, 9.0)
+    result = await async_get_config_entry_diagnostics(hass, mock_setup_entry)
+    usage = result["usage_events"]
+
+    assert usage["in_progress"] is False
+    assert usage["recent"][-1]["volume"] == 6.5
+    assert usage["recent"][-1]["duration"] == 45.0
+
+
+async def test_diagnostics_long_term_statistics(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test diagnostics long-term statistics section."""
+    result = await async_get_config_entry_diagnostics(hass, mock_setup_entry)
+    long_term = result["long_term_statistics"]
+
+    assert long_term["statistic_id"].startswith("droplet_plus:")
+    assert long_term["enabled"] is False
+    assert long_term["pending_count"] == 0
+
+
+async def test_diagnostics_hot_path(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test diagnostics hot path timing section."""
+    mock_setup_entry.runtime_data._on_update(None)
+    result = await async_get_config_entry_diagnostics(hass, mock_setup_entry)
+    hot_path = result["hot_path"]
+
+    assert hot_path["stages"]["total"]["count"] >= 1
+    assert "p95_us" in hot_path["stages"]["total"]
+    assert "inter_arrival" in hot_path
+    assert result["health"]["reconnect_count"] == 0
@@ -6,7 +6,12 @@ from unittest.mock import MagicMock
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.droplet_plus.const import DOMAIN
+from custom_components.droplet_plus.const import (
+    CONF_HIGH_FLOW_DURATION,
+    CONF_HIGH_FLOW_THRESHOLD,
+    DOMAIN,
+    EVENT_HIGH_FLOW_DETECTED,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 from homeassistant.util import dt as dt_util
@@ -16,11 +21,15 @@ async def test_event_entity_exists(
     hass: HomeAssistant,
     mock_setup_entry: MockConfigEntry,
 ) -> None:
-    """Test leak event entity is created."""
+    """Test the leak and high flow event entities are created."""
     ent_reg = er.async_get(hass)
     events = [e for e in ent_reg.entities.values() if e.platform == DOMAIN and e.domain == "event"]
-    assert len(events) == 1
-    assert "water_leak" in events[0].entity_id
+    assert len(events) == 2
+    unique_id = mock_setup_entry.unique_id
+    assert {e.unique_id for e in events} == {
+        f"{unique_id}_water_leak_event",
+        f"{unique_id}_high_flow_event",
+    }
 
 
 async def test_event_types(
@@ -44,9 +53,10 @@ async def test_event_fires_on_leak_detected(
 
     # Simulate leak detection
     now_ts = dt_util.now().timestamp()
-    coordinator._hourly_flow_stats = [(now_ts - 3600 * i, 2.0, 0.5) for i in range(24)]
-    coordinator._evaluate_leak()
-    coordinator.async_set_updated_data(None)
+    coordinator._flow_rate = 0.5
+    coordinator._evaluate_leak(now_ts - coordinator.water_leak_duration)
+    coordinator._evaluate_leak(now_ts)
+    coordinator.async_publish_snapshot()
     await hass.async_block_till_done()
 
     # Verify event was consumed
@@ -63,11 +73,40 @@ async def test_event_fires_on_leak_cleared(
     coordinator = mock_setup_entry.runtime_data
     coordinator._water_leak_detected = True
 
-    now_ts = dt_util.now().timestamp()
-    coordinator._hourly_flow_stats = [(now_ts - 3600 * i, 2.0, 0.0) for i in range(24)]
-    coordinator._evaluate_leak()
-    coordinator.async_set_updated_data(None)
+    coordinator._flow_rate = 0.0
+    coordinator._evaluate_leak(dt_util.now().timestamp())
+    coordinator.async_publish_snapshot()
     await hass.async_block_till_done()
 
     assert coordinator.pending_leak_event is None
     assert coordinator.water_leak_detected is False
+
+
+async def test_event_fires_on_high_flow(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test the high flow event fires within the WebSocket update that detects it."""
+    coordinator = mock_setup_entry.runtime_data
+    hass.config_entries.async_update_entry(
+        mock_setup_entry,
+        options={
+            **mock_setup_entry.options,
+            CONF_HIGH_FLOW_THRESHOLD: 30.0,
+            CONF_HIGH_FLOW_DURATION: 0,
+        },
+    )
+    await hass.async_block_till_done()
+
+    mock_droplet.get_flow_rate.return_value = 45.0
+    coordinator._on_update(None)
+
+    assert coordinator.pending_high_flow_event is None
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "event", DOMAIN, f"{mock_setup_entry.unique_id}_high_flow_event"
+    )
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.attributes["event_type"] == EVENT_HIGH_FLOW_DETECTED
+    assert state.attributes["flow"] == 45.0
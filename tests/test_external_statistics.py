@@ -0,0 +1,139 @@
+"""Tests for Droplet long-term statistics import."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.droplet_plus.external_statistics import DropletStatisticsImporter
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+STATISTIC_ID = "droplet_plus:test_water_consumption"
+HOUR = dt_util.utc_from_timestamp(1_772_355_600.0)  # Top of an hour in UTC
+
+
+@pytest.fixture
+def mock_recorder(hass: HomeAssistant):
+    """Pretend the recorder is loaded, with no statistics imported yet."""
+    hass.config.components.add("recorder")
+    instance = MagicMock()
+
+    async def _run(func, *args):
+        return func(*args)
+
+    instance.async_add_executor_job = _run
+    with (
+        patch(
+            "custom_components.droplet_plus.external_statistics.get_instance",
+            return_value=instance,
+        ),
+        patch(
+            "custom_components.droplet_plus.external_statistics.get_last_statistics",
+            return_value={},
+        ) as get_last,
+        patch(
+            "custom_components.droplet_plus.external_statistics.async_add_external_statistics"
+        ) as add_statistics,
+    ):
+        yield get_last, add_statistics
+
+
+async def test_disabled_without_recorder(hass: HomeAssistant) -> None:
+    """Test nothing is queued when the recorder is not loaded."""
+    importer = DropletStatisticsImporter(hass, STATISTIC_ID, "Test")
+    await importer.async_setup()
+
+    importer.add_hour(HOUR, 5.0)
+
+    assert importer.enabled is False
+    assert importer.pending_count == 0
+    assert importer.async_flush() == 0
+
+
+async def test_hours_imported_in_one_batch(hass: HomeAssistant, mock_recorder) -> None:
+    """Test queued hours are imported with a running sum in a single call."""
+    _, add_statistics = mock_recorder
+    importer = DropletStatisticsImporter(hass, STATISTIC_ID, "Test")
+    await importer.async_setup()
+
+    importer.add_hour(HOUR, 2.0)
+    importer.add_hour(HOUR + timedelta(hours=1), 3.0)
+    assert importer.pending_count == 2
+
+    assert importer.async_flush() == 2
+    add_statistics.assert_called_once()
+    metadata, statistics = add_statistics.call_args[0][1:]
+    assert metadata["statistic_id"] == STATISTIC_ID
+    assert metadata["has_sum"] is True
+    assert [row["start"] for row in statistics] == [HOUR, HOUR + timedelta(hours=1)]
+    assert [row["state"] for row in statistics] == [2.0, 3.0]
+    assert [row["sum"] for row in statistics] == [2.0, 5.0]
+    assert importer.async_flush() == 0
+
+
+async def test_sum_continues_from_last_import(hass: HomeAssistant, mock_recorder) -> None:
+    """Test the running sum continues and already imported hours are skipped."""
+    get_last, add_statistics = mock_recorder
+    get_last.return_value = {STATISTIC_ID: [{"start": HOUR.timestamp(), "sum": 100.0}]}
+    importer = DropletStatisticsImporter(hass, STATISTIC_ID, "Test")
+    await importer.async_setup()
+
+    importer.add_hour(HOUR, 7.0)  # Already imported before the restart
+    importer.add_hour(HOUR + timedelta(hours=1), 4.0)
+    importer.async_flush()
+
+    statistics = add_statistics.call_args[0][2]
+    assert len(statistics) == 1
+    assert statistics[0]["sum"] == 104.0
+
+
+async def test_rollover_imports_finalized_hour(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+    mock_recorder,
+) -> None:
+    """Test a period rollover imports the finalized hour."""
+    _, add_statistics = mock_recorder
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = mock_config_entry.runtime_data
+    add_statistics.reset_mock()
+
+    coordinator._baseline_hourly = 1.5
+    coordinator._hourly_reset = dt_util.now() - timedelta(hours=2)
+    coordinator._handle_period_rollover(dt_util.utcnow())
+
+    add_statistics.assert_called_once()
+    statistics = add_statistics.call_args[0][2]
+    assert statistics[0]["state"] == pytest.approx(1.5)
+
+
+async def test_hour_aligned_to_local_time(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+    mock_recorder,
+) -> None:
+    """Test hours are imported from their local start in a half-hour offset time zone."""
+    _, add_statistics = mock_recorder
+    await hass.config.async_set_time_zone("Asia/Kolkata")
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = mock_config_entry.runtime_data
+    add_statistics.reset_mock()
+
+    # 10:20 local is 04:50 UTC; flooring in UTC would give 04:00 (09:30 local)
+    reset = dt_util.as_local(HOUR).replace(hour=10, minute=20)
+    coordinator._finalize_hour(reset.timestamp(), 2.0, None, None)
+    coordinator.statistics_importer.async_flush()
+
+    statistics = add_statistics.call_args[0][2]
+    assert statistics[0]["start"] == reset.replace(minute=0)
+    assert dt_util.as_utc(statistics[0]["start"]).minute == 30
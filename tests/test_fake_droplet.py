@@ -0,0 +1,101 @@
+"""Tests for the fake Droplet server against the real pydroplet client."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+
+import aiohttp
+from pydroplet.droplet import Droplet
+import pytest
+
+from .conftest import TEST_TOKEN
+from .fake_droplet import FakeDropletServer, VirtualDroplet, leak_profile, make_devices
+
+# The fake server and pydroplet talk over real localhost sockets, which the
+# Home Assistant test plugin blocks by default
+pytestmark = [pytest.mark.usefixtures("socket_enabled"), pytest.mark.allow_hosts(["127.0.0.1"])]
+
+
+@pytest.fixture
+async def session() -> AsyncIterator[aiohttp.ClientSession]:
+    """Return a client session for pydroplet."""
+    async with aiohttp.ClientSession() as client_session:
+        yield client_session
+
+
+async def _listen_until(droplet: Droplet, condition: Callable[[], bool]) -> None:
+    """Run listen_forever until condition() holds after a pydroplet update."""
+    done = asyncio.Event()
+
+    def on_update(_: object) -> None:
+        if condition():
+            done.set()
+
+    task = asyncio.create_task(droplet.listen_forever(0, on_update))
+    try:
+        async with asyncio.timeout(5):
+            await done.wait()
+    finally:
+        await droplet.stop_listening()
+        await droplet.disconnect()
+        await task
+
+
+async def test_streams_metadata_and_state(session: aiohttp.ClientSession) -> None:
+    """Test pydroplet reads metadata, flow and volume from a virtual device."""
+    device = VirtualDroplet(
+        device_id="droplet-test", token=TEST_TOKEN, profile=leak_profile, rate_hz=50
+    )
+    server = FakeDropletServer([device])
+    await server.async_start()
+    try:
+        droplet = Droplet("127.0.0.1", session, TEST_TOKEN, server.port)
+        await _listen_until(droplet, lambda: device.messages >= 5)
+    finally:
+        await server.async_stop()
+
+    assert droplet.get_device_id() == "droplet-test"
+    assert droplet.get_model() == "Droplet"
+    assert droplet.get_fw_version() == "1.0.0"
+    assert droplet.get_server_status() == "connected"
+    assert droplet.get_flow_rate() == pytest.approx(0.2)
+    # 0.2 L/min at 50 Hz is 4/60 mL per message, sent rounded to 0.067 mL
+    messages = droplet.get_volume_delta() / 0.067
+    assert messages >= 5
+    assert messages == pytest.approx(round(messages))
+
+
+async def test_rejects_wrong_pairing_code(session: aiohttp.ClientSession) -> None:
+    """Test the handshake fails with the wrong pairing code."""
+    server = FakeDropletServer(make_devices(1))
+    await server.async_start()
+    try:
+        droplet = Droplet("127.0.0.1", session, "WRONG", server.port)
+        assert await droplet.connect() is False
+    finally:
+        await server.async_stop()
+
+
+async def test_disconnects_and_reconnects(session: aiohttp.ClientSession) -> None:
+    """Test devices drop connections periodically and pydroplet reconnects."""
+    server = FakeDropletServer(make_devices(3, rate_hz=50, disconnect_after=0.1))
+    await server.async_start()
+    try:
+        droplets = [
+            Droplet("127.0.0.1", session, device.token, server.port) for device in server.devices
+        ]
+        await asyncio.gather(
+            *(
+                _listen_until(droplet, lambda device=device: device.connections >= 2)
+                for droplet, device in zip(droplets, server.devices, strict=True)
+            )
+        )
+    finally:
+        await server.async_stop()
+
+    assert [droplet.get_device_id() for droplet in droplets] == [
+        "droplet-fake-000",
+        "droplet-fake-001",
+        "droplet-fake-002",
+    ]
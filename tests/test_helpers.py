@@ -4,17 +4,13 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
-import pytest
-
 from custom_components.droplet_plus.helpers import (
-    compute_average,
-    compute_max,
-    compute_min,
     is_new_day,
     is_new_hour,
     is_new_month,
     is_new_week,
     is_new_year,
+    missed_period_starts,
     next_day,
     next_hour,
     next_month,
@@ -114,61 +110,6 @@ class TestPeriodBoundaries:
         assert is_new_hour(last, now) is True
 
 
-class TestStatisticsComputation:
-    """Tests for statistics computation functions."""
-
-    def test_compute_average_basic(self) -> None:
-        """Test basic average computation."""
-        samples = [(100.0, 1.0), (200.0, 3.0), (300.0, 5.0)]
-        result = compute_average(samples, 500, 400.0)
-        assert result == pytest.approx(3.0)
-
-    def test_compute_average_with_expired(self) -> None:
-        """Test average ignores expired samples."""
-        samples = [(50.0, 10.0), (200.0, 2.0), (300.0, 4.0)]
-        result = compute_average(samples, 200, 350.0)
-        assert result == pytest.approx(3.0)
-
-    def test_compute_average_empty(self) -> None:
-        """Test average returns None for no valid samples."""
-        samples = [(100.0, 5.0)]
-        result = compute_average(samples, 10, 200.0)
-        assert result is None
-
-    def test_compute_average_all_expired(self) -> None:
-        """Test average returns None when all samples expired."""
-        result = compute_average([], 100, 200.0)
-        assert result is None
-
-    def test_compute_max_basic(self) -> None:
-        """Test basic max computation."""
-        samples = [(100.0, 1.0), (200.0, 5.0), (300.0, 3.0)]
-        result = compute_max(samples, 500, 400.0)
-        assert result == pytest.approx(5.0)
-
-    def test_compute_max_empty(self) -> None:
-        """Test max returns None for no valid samples."""
-        result = compute_max([], 100, 200.0)
-        assert result is None
-
-    def test_compute_min_basic(self) -> None:
-        """Test basic min computation."""
-        samples = [(100.0, 3.0), (200.0, 1.0), (300.0, 5.0)]
-        result = compute_min(samples, 500, 400.0)
-        assert result == pytest.approx(1.0)
-
-    def test_compute_min_empty(self) -> None:
-        """Test min returns None for no valid samples."""
-        result = compute_min([], 100, 200.0)
-        assert result is None
-
-    def test_compute_min_with_expired(self) -> None:
-        """Test min ignores expired samples."""
-        samples = [(50.0, 0.1), (200.0, 2.0), (300.0, 3.0)]
-        result = compute_min(samples, 200, 350.0)
-        assert result == pytest.approx(2.0)
-
-
 class TestNextBoundary:
     """Tests for next period boundary functions."""
 
@@ -227,3 +168,33 @@ class TestNextBoundary:
         now = datetime(2024, 6, 15, tzinfo=UTC)
         result = next_year(now)
         assert result == datetime(2025, 1, 1, 0, 0, 0, tzinfo=UTC)
+
+
+class TestMissedPeriodStarts:
+    """Tests for missed period enumeration."""
+
+    def test_no_missed_hours(self) -> None:
+        """Test consecutive hours have no missed period between them."""
+        last = datetime(2024, 1, 15, 10, 30, tzinfo=UTC)
+        now = datetime(2024, 1, 15, 11, 5, tzinfo=UTC)
+        assert missed_period_starts(last, now, next_hour, 86400) == []
+
+    def test_missed_hours(self) -> None:
+        """Test whole hours between the last reset and now are returned."""
+        last = datetime(2024, 1, 15, 10, 30, tzinfo=UTC)
+        now = datetime(2024, 1, 15, 13, 5, tzinfo=UTC)
+        assert missed_period_starts(last, now, next_hour, 86400) == [
+            datetime(2024, 1, 15, 11, 0, tzinfo=UTC),
+            datetime(2024, 1, 15, 12, 0, tzinfo=UTC),
+        ]
+
+    def test_missed_days_limited_to_max_age(self) -> None:
+        """Test periods older than max_age are not returned."""
+        last = datetime(2024, 1, 1, 8, 0, tzinfo=UTC)
+        now = datetime(2024, 1, 15, 0, 0, tzinfo=UTC)
+        result = missed_period_starts(last, now, next_day, 3 * 86400)
+        assert result == [
+            datetime(2024, 1, 12, 0, 0, tzinfo=UTC),
+            datetime(2024, 1, 13, 0, 0, tzinfo=UTC),
+            datetime(2024, 1, 14, 0, 0, tzinfo=UTC),
+        ]
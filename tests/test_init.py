@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from datetime import timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
 
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
 
-from custom_components.droplet_plus.const import DOMAIN
+from custom_components.droplet_plus.const import (
+    ATTR_STALE,
+    DOMAIN,
+    STALE_TIMEOUT,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
 from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.util import dt as dt_util
 
 
 async def test_setup_entry(
@@ -33,6 +44,209 @@ async def test_setup_entry_registers_device(
     assert device.model == "Droplet"
 
 
+async def test_all_platforms_share_device(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test every platform attaches its entities to the same device."""
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, mock_setup_entry.unique_id)})
+    assert device is not None
+
+    entities = er.async_entries_for_config_entry(er.async_get(hass), mock_setup_entry.entry_id)
+    assert {entity.domain for entity in entities} >= {"binary_sensor", "event", "number", "sensor"}
+    assert {entity.device_id for entity in entities} == {device.id}
+
+
+async def test_setup_does_not_wait_for_metadata(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test setup completes before the device sends its metadata."""
+    mock_droplet.version_info_available.return_value = False
+    mock_droplet.get_model.return_value = ""
+    mock_droplet.get_fw_version.return_value = ""
+
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    device_registry = dr.async_get(hass)
+    device = device_registry.async_get_device(identifiers={(DOMAIN, mock_config_entry.unique_id)})
+    assert device is not None
+    assert device.model is None
+    assert device.sw_version is None
+
+    # The metadata arrives with the first messages and updates the device
+    mock_droplet.version_info_available.return_value = True
+    mock_droplet.get_model.return_value = "Droplet"
+    mock_droplet.get_fw_version.return_value = "1.2.3"
+    mock_config_entry.runtime_data._on_update(None)
+
+    device = device_registry.async_get_device(identifiers={(DOMAIN, mock_config_entry.unique_id)})
+    assert device.model == "Droplet"
+    assert device.sw_version == "1.2.3"
+    assert device.serial_number == "SN123456"
+
+
+async def test_metadata_retried_when_device_not_registered(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test metadata is written on a later frame if the device lookup missed."""
+    mock_droplet.version_info_available.return_value = False
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = mock_config_entry.runtime_data
+    device_registry = dr.async_get(hass)
+
+    mock_droplet.version_info_available.return_value = True
+    with patch.object(device_registry, "async_get_device", return_value=None):
+        coordinator._on_update(None)
+
+    coordinator._on_update(None)
+    device = device_registry.async_get_device(identifiers={(DOMAIN, mock_config_entry.unique_id)})
+    assert device.model == "Droplet"
+    assert device.sw_version == "1.2.3"
+
+
+async def test_firmware_update_reaches_device_registry(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test a new firmware version is written to the device on the slow refresh."""
+    coordinator = mock_setup_entry.runtime_data
+    coordinator._on_update(None)
+    mock_droplet.get_fw_version.return_value = "1.3.0"
+
+    coordinator._handle_slow_refresh(dt_util.now())
+
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, mock_setup_entry.unique_id)})
+    assert device.sw_version == "1.3.0"
+
+
+def _stored_snapshot(hass_storage: dict[str, Any], config_entry: MockConfigEntry) -> None:
+    """Store the snapshot of a previous run for config_entry."""
+    key = f"{STORAGE_KEY}_{config_entry.entry_id}"
+    hass_storage[key] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": key,
+        "data": {
+            "lifetime_volume": 1000.0,
+            "device": {
+                "manufacturer": "Hydrific",
+                "model": "Droplet",
+                "firmware": "1.2.0",
+                "serial": "SN123456",
+            },
+        },
+    }
+
+
+async def test_restores_cumulative_values_as_stale(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test restored cumulative values are flagged stale until the first device frame."""
+    _stored_snapshot(hass_storage, mock_config_entry)
+    mock_droplet.get_availability.return_value = False
+    mock_droplet.version_info_available.return_value = False
+    mock_droplet.get_model.return_value = ""
+    mock_droplet.get_fw_version.return_value = ""
+
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    ent_reg = er.async_get(hass)
+    unique_id = mock_config_entry.unique_id
+    flow_id = ent_reg.async_get_entity_id("sensor", DOMAIN, f"{unique_id}_water_flow_rate")
+    lifetime_id = ent_reg.async_get_entity_id(
+        "sensor", DOMAIN, f"{unique_id}_water_consumption_lifetime"
+    )
+    # Instantaneous readings are not restored
+    assert hass.states.get(flow_id).state == STATE_UNAVAILABLE
+    state = hass.states.get(lifetime_id)
+    assert state.state == "1000.0"
+    assert state.attributes[ATTR_STALE] is True
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, unique_id)})
+    assert device.model == "Droplet"
+    assert device.sw_version == "1.2.0"
+
+    # The first live frame drops the stale flag everywhere
+    mock_droplet.get_availability.return_value = True
+    mock_config_entry.runtime_data._on_update(None)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(flow_id).state == "2.5"
+    assert ATTR_STALE not in hass.states.get(lifetime_id).attributes
+
+
+async def test_stale_ends_on_unavailable_frame(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test a failed connection attempt ends the stale state instead of keeping it forever."""
+    _stored_snapshot(hass_storage, mock_config_entry)
+    mock_droplet.get_availability.return_value = False
+
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = mock_config_entry.runtime_data
+    assert coordinator.stale
+
+    coordinator._on_update(None)
+    await hass.async_block_till_done()
+
+    assert not coordinator.stale
+    lifetime_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{mock_config_entry.unique_id}_water_consumption_lifetime"
+    )
+    assert hass.states.get(lifetime_id).state == STATE_UNAVAILABLE
+
+
+async def test_stale_ends_after_timeout(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the stale state ends when no frame arrives within the startup timeout."""
+    _stored_snapshot(hass_storage, mock_config_entry)
+    mock_droplet.get_availability.return_value = False
+
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = mock_config_entry.runtime_data
+
+    freezer.tick(timedelta(seconds=STALE_TIMEOUT - 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert coordinator.stale
+
+    freezer.tick(timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert not coordinator.stale
+    lifetime_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{mock_config_entry.unique_id}_water_consumption_lifetime"
+    )
+    assert hass.states.get(lifetime_id).state == STATE_UNAVAILABLE
+
+
 async def test_unload_entry(
     hass: HomeAssistant,
     mock_setup_entry: MockConfigEntry,
@@ -5,6 +5,7 @@ from __future__ import annotations
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.droplet_plus.const import (
+    CONF_WATER_LEAK_DURATION,
     CONF_WATER_LEAK_THRESHOLD,
     CONF_WATER_TARIFF,
     DOMAIN,
@@ -19,16 +20,19 @@ async def test_number_entities_exist(
     hass: HomeAssistant,
     mock_setup_entry: MockConfigEntry,
 ) -> None:
-    """Test both number entities are created."""
+    """Test all number entities are created."""
     ent_reg = er.async_get(hass)
     numbers = [
         e for e in ent_reg.entities.values() if e.platform == DOMAIN and e.domain == "number"
     ]
-    assert len(numbers) == 2
+    assert len(numbers) == 5
 
     keys = {e.translation_key for e in numbers}
     assert "water_tariff" in keys
     assert "water_leak_threshold" in keys
+    assert "water_leak_duration" in keys
+    assert "high_flow_threshold" in keys
+    assert "high_flow_duration" in keys
 
 
 async def test_number_entity_category(
@@ -88,7 +92,9 @@ async def test_set_leak_threshold_value(
     """Test setting leak threshold value updates options."""
     ent_reg = er.async_get(hass)
     threshold_entries = [
-        e for e in ent_reg.entities.values() if e.platform == DOMAIN and "threshold" in e.entity_id
+        e
+        for e in ent_reg.entities.values()
+        if e.platform == DOMAIN and "leak_threshold" in e.entity_id
     ]
     entity_id = threshold_entries[0].entity_id
 
@@ -101,3 +107,31 @@ async def test_set_leak_threshold_value(
     await hass.async_block_till_done()
 
     assert mock_setup_entry.options[CONF_WATER_LEAK_THRESHOLD] == 0.05
+
+
+async def test_set_leak_duration_value(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test setting leak duration value updates options and the coordinator."""
+    ent_reg = er.async_get(hass)
+    duration_entries = [
+        e
+        for e in ent_reg.entities.values()
+        if e.platform == DOMAIN and "leak_duration" in e.entity_id
+    ]
+    entity_id = duration_entries[0].entity_id
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert float(state.state) == 60
+
+    await hass.services.async_call(
+        "number",
+        SERVICE_SET_VALUE,
+        {ATTR_ENTITY_ID: entity_id, ATTR_VALUE: 15},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    assert mock_setup_entry.options[CONF_WATER_LEAK_DURATION] == 15
+    assert mock_setup_entry.runtime_data.water_leak_duration == 900
@@ -0,0 +1,110 @@
+"""Tests for Droplet hot path timing."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.droplet_plus.profiling import FRAME_STAGES, HotPathProfiler, TimingWindow
+
+
+class TestTimingWindow:
+    """Tests for TimingWindow."""
+
+    def test_empty(self) -> None:
+        """Test an empty window only reports its count."""
+        window = TimingWindow(4)
+        assert len(window) == 0
+        assert window.percentile(0.5) is None
+        assert window.summary() == {"count": 0}
+
+    def test_summary(self) -> None:
+        """Test percentiles, mean and maximum are reported in microseconds."""
+        window = TimingWindow(128)
+        for duration_us in range(1, 101):
+            window.add(duration_us * 1000)
+
+        summary = window.summary()
+        assert summary["count"] == 100
+        assert summary["mean_us"] == pytest.approx(50.5)
+        assert summary["p50_us"] == 51.0
+        assert summary["p95_us"] == 96.0
+        assert summary["p99_us"] == 100.0
+        assert summary["max_us"] == 100.0
+
+    def test_histogram(self) -> None:
+        """Test durations land in the first bucket whose bound they do not exceed."""
+        window = TimingWindow(8)
+        for duration_us in (5, 10, 11, 30, 20000):
+            window.add(duration_us * 1000)
+
+        histogram = window.summary()["histogram_us"]
+        assert histogram["10"] == 2
+        assert histogram["25"] == 1
+        assert histogram["50"] == 1
+        assert histogram["inf"] == 1
+        assert sum(histogram.values()) == 5
+
+    def test_overwrites_oldest(self) -> None:
+        """Test a full window keeps only the most recent durations."""
+        window = TimingWindow(4)
+        for duration_us in (1000, 1000, 1, 2, 3, 4):
+            window.add(duration_us * 1000)
+
+        assert len(window) == 4
+        assert window.total_count == 6
+        summary = window.summary()
+        assert summary["max_us"] == 4.0
+        assert summary["mean_us"] == pytest.approx(2.5)
+
+
+class TestHotPathProfiler:
+    """Tests for HotPathProfiler."""
+
+    def test_inter_arrival(self) -> None:
+        """Test the first frame only sets the reference for inter-arrival times."""
+        profiler = HotPathProfiler()
+        profiler.frame(1_000_000)
+        profiler.frame(101_000_000)
+        profiler.frame(201_000_000)
+
+        assert profiler.last_frame_ns == 201_000_000
+        assert profiler.inter_arrival.summary()["p50_us"] == 100_000.0
+
+    def test_record_stages(self) -> None:
+        """Test one record call stores every stage of a frame."""
+        profiler = HotPathProfiler(4)
+        for offset in range(6):
+            base = offset * 1_000_000
+            profiler.record(
+                base,
+                base + 1000,
+                base + 3000,
+                base + 6000,
+                base + 10000,
+                base + 15000,
+                base + 21000,
+            )
+
+        assert profiler.frame_count == 6
+        assert list(profiler.stage_durations("read")) == [1000] * 4
+        assert list(profiler.stage_durations("fanout")) == [6000] * 4
+        assert profiler.percentile("total", 0.95) == 21.0
+
+    def test_as_dict(self) -> None:
+        """Test every stage is reported, including stages that never ran."""
+        profiler = HotPathProfiler()
+        profiler.record(0, 2000, 2000, 2000, 2000, 2000, 2000)
+
+        result = profiler.as_dict()
+        assert set(result["stages"]) == {*FRAME_STAGES, "rollover"}
+        assert result["stages"]["read"]["p50_us"] == 2.0
+        assert result["stages"]["total"]["count"] == 1
+        assert result["stages"]["rollover"] == {"count": 0}
+        assert result["inter_arrival"] == {"count": 0}
+
+    def test_log_line(self) -> None:
+        """Test the log line lists only stages that ran."""
+        profiler = HotPathProfiler()
+        assert profiler.log_line() == ""
+        profiler.rollover.add(5000)
+        assert profiler.log_line() == "rollover 5.0/5.0"
@@ -21,8 +21,9 @@ async def test_repair_created_on_leak(
     coordinator = mock_setup_entry.runtime_data
 
     now_ts = dt_util.now().timestamp()
-    coordinator._hourly_flow_stats = [(now_ts - 3600 * i, 2.0, 0.5) for i in range(24)]
-    coordinator._evaluate_leak()
+    coordinator._flow_rate = 0.5
+    coordinator._evaluate_leak(now_ts - coordinator.water_leak_duration)
+    coordinator._evaluate_leak(now_ts)
 
     issue_registry = async_get_issue_registry(hass)
     issue = issue_registry.async_get_issue(DOMAIN, EVENT_WATER_LEAK_DETECTED)
@@ -39,16 +40,17 @@ async def test_repair_resolved_on_clear(
 
     # First, trigger a leak
     now_ts = dt_util.now().timestamp()
-    coordinator._hourly_flow_stats = [(now_ts - 3600 * i, 2.0, 0.5) for i in range(24)]
-    coordinator._evaluate_leak()
+    coordinator._flow_rate = 0.5
+    coordinator._evaluate_leak(now_ts - coordinator.water_leak_duration)
+    coordinator._evaluate_leak(now_ts)
 
     issue_registry = async_get_issue_registry(hass)
     issue = issue_registry.async_get_issue(DOMAIN, EVENT_WATER_LEAK_DETECTED)
     assert issue is not None
 
     # Now clear the leak
-    coordinator._hourly_flow_stats = [(now_ts - 3600 * i, 2.0, 0.0) for i in range(24)]
-    coordinator._evaluate_leak()
+    coordinator._flow_rate = 0.0
+    coordinator._evaluate_leak(now_ts + 1)
 
     issue = issue_registry.async_get_issue(DOMAIN, EVENT_WATER_LEAK_DETECTED)
     assert issue is None
@@ -60,7 +62,8 @@ async def test_no_repair_when_no_leak(
 ) -> None:
     """Test no repair issue when no leak."""
     coordinator = mock_setup_entry.runtime_data
-    coordinator._evaluate_leak()
+    coordinator._flow_rate = 0.5
+    coordinator._evaluate_leak(dt_util.now().timestamp())
 
     issue_registry = async_get_issue_registry(hass)
     issue = issue_registry.async_get_issue(DOMAIN, EVENT_WATER_LEAK_DETECTED)
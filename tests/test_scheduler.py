@@ -0,0 +1,106 @@
+"""Tests for the shared Droplet scheduler."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from custom_components.droplet_plus.const import (
+    CONF_DEVICE_ID,
+    DOMAIN,
+    JOURNAL_INTERVAL,
+    SAVE_INTERVAL,
+)
+from custom_components.droplet_plus.scheduler import async_get_scheduler
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+
+async def test_staggers_jobs_with_the_same_interval(hass: HomeAssistant) -> None:
+    """Test each new job takes the middle of the largest free gap."""
+    scheduler = async_get_scheduler(hass)
+    unsubs = [scheduler.async_schedule("job", 60, MagicMock()) for _ in range(4)]
+    unsubs.append(scheduler.async_schedule("other", 300, MagicMock()))
+
+    assert scheduler.phases(60) == [0.0, 15.0, 30.0, 45.0]
+    assert scheduler.phases(300) == [0.0]
+
+    unsubs[1]()
+    unsubs.append(scheduler.async_schedule("job", 60, MagicMock()))
+    assert scheduler.phases(60) == [0.0, 15.0, 30.0, 45.0]
+
+    for unsub in unsubs:
+        unsub()
+    assert scheduler.job_count == 0
+
+
+async def test_runs_jobs_until_cancelled(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a job runs once per interval, skips missed runs and stops when cancelled."""
+    runs: list[datetime] = []
+
+    @callback
+    def job(now: datetime) -> None:
+        runs.append(now)
+
+    unsub = async_get_scheduler(hass).async_schedule("job", 10, job)
+    start = dt_util.utcnow()
+    for step in range(1, 4):
+        freezer.move_to(start + timedelta(seconds=10 * step))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+    assert len(runs) == 3
+
+    # A stalled loop gets one run, not a backlog of the missed ones
+    freezer.move_to(start + timedelta(seconds=100))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(runs) == 4
+    freezer.tick(timedelta(seconds=10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(runs) == 5
+
+    unsub()
+    freezer.tick(timedelta(seconds=10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(runs) == 5
+
+
+async def test_entries_share_the_scheduler(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test every entry schedules its timers on the scheduler in hass.data."""
+    second_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Droplet (second)",
+        data={**mock_config_entry.data, CONF_DEVICE_ID: "droplet-test-456"},
+        options=mock_config_entry.options,
+        unique_id="droplet-test-456",
+        version=1,
+    )
+    mock_config_entry.add_to_hass(hass)
+    second_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert second_entry.state is ConfigEntryState.LOADED
+
+    scheduler = hass.data[DOMAIN]
+    assert scheduler is async_get_scheduler(hass)
+    # Journal flush, save and statistics refresh for each entry
+    assert scheduler.job_count == 6
+    assert scheduler.phases(JOURNAL_INTERVAL) == [0.0, JOURNAL_INTERVAL / 2]
+    assert scheduler.phases(SAVE_INTERVAL) == [0.0, SAVE_INTERVAL / 2]
+
+    await hass.config_entries.async_unload(second_entry.entry_id)
+    await hass.async_block_till_done()
+    assert scheduler.job_count == 3
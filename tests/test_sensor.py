@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.droplet_plus.const import DOMAIN
+from custom_components.droplet_plus.sensor import SENSOR_DESCRIPTIONS, DropletSensor
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.util import dt as dt_util
 
 
 async def test_flow_rate_sensor(
@@ -127,6 +130,8 @@ async def test_statistics_sensors_exist(
 
     stat_keys = [
         "avg_flow_1h",
+        "avg_flow_24h",
+        "avg_flow_30d",
         "peak_flow_24h",
         "peak_flow_7d",
         "min_flow_24h",
@@ -142,16 +147,97 @@ async def test_statistics_sensors_exist(
         assert len(matches) == 1, f"Missing statistics sensor {key}"
 
 
+async def test_health_sensors_disabled_by_default(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test health sensors are diagnostic and disabled by default."""
+    ent_reg = er.async_get(hass)
+    for key in ("message_rate", "processing_time_p95", "last_message_age", "reconnect_count"):
+        entry = next(
+            e
+            for e in ent_reg.entities.values()
+            if e.platform == DOMAIN and e.unique_id.endswith(f"_{key}")
+        )
+        assert entry.entity_category == EntityCategory.DIAGNOSTIC
+        assert entry.disabled_by is not None
+
+
+async def test_health_sensor_available_while_offline(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test health sensors stay available when the device goes offline."""
+    coordinator = mock_setup_entry.runtime_data
+    descriptions = {d.key: d for d in SENSOR_DESCRIPTIONS}
+    health = DropletSensor(coordinator, descriptions["last_message_age"])
+    flow = DropletSensor(coordinator, descriptions["water_flow_rate"])
+
+    coordinator._on_update(None)
+    mock_droplet.get_availability.return_value = False
+    coordinator._on_update(None)
+    coordinator._handle_slow_refresh(dt_util.now())
+
+    assert flow.available is False
+    assert health.available is True
+    assert health.native_value is not None
+
+
+async def test_last_usage_sensors(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test the last usage sensors are unknown until an event completes, then show it."""
+    coordinator = mock_setup_entry.runtime_data
+    ent_reg = er.async_get(hass)
+    entity_ids = {
+        key: next(
+            e.entity_id
+            for e in ent_reg.entities.values()
+            if e.platform == DOMAIN and e.unique_id.endswith(f"_{key}")
+        )
+        for key in (
+            "water_last_usage_volume",
+            "water_last_usage_duration",
+            "water_last_usage_peak_flow",
+            "water_last_usage_end",
+        )
+    }
+    assert hass.states.get(entity_ids["water_last_usage_volume"]).state == "unknown"
+
+    now_ts = dt_util.now().timestamp()
+    coordinator._usage_run.add(now_ts - 90, 12.0, 15.0)
+    coordinator._usage_run.add(now_ts - 30, 0.0, 3.0)
+    coordinator._end_usage()
+    coordinator.async_publish_snapshot()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity_ids["water_last_usage_volume"]).state == "18.0"
+    assert hass.states.get(entity_ids["water_last_usage_duration"]).state == "60.0"
+    assert hass.states.get(entity_ids["water_last_usage_peak_flow"]).state == "12.0"
+    end = dt_util.parse_datetime(hass.states.get(entity_ids["water_last_usage_end"]).state)
+    assert end is not None
+    assert end.timestamp() == pytest.approx(now_ts - 30, abs=1)
+
+    # The last event stays visible while the device is offline
+    mock_droplet.get_availability.return_value = False
+    coordinator._on_update(None)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_ids["water_last_usage_volume"]).state == "18.0"
+
+
 async def test_total_sensor_count(
     hass: HomeAssistant,
     mock_setup_entry: MockConfigEntry,
 ) -> None:
-    """Test total number of sensor entities is 25."""
+    """Test total number of sensor entities is 35."""
     ent_reg = er.async_get(hass)
     sensors = [
         e for e in ent_reg.entities.values() if e.platform == DOMAIN and e.domain == "sensor"
     ]
-    assert len(sensors) == 25
+    assert len(sensors) == 35
 
 
 async def test_sensor_has_entity_name(
@@ -177,7 +263,7 @@ async def test_sensor_unique_ids(
         e for e in ent_reg.entities.values() if e.platform == DOMAIN and e.domain == "sensor"
     ]
     unique_ids = {s.unique_id for s in sensors}
-    assert len(unique_ids) == 25  # All unique
+    assert len(unique_ids) == len(sensors)  # All unique
 
 
 async def test_sensor_device_association(
@@ -196,3 +282,50 @@ async def test_sensor_device_association(
     ]
     for sensor in sensors:
         assert sensor.device_id == device.id
+
+
+async def test_unchanged_sensors_not_rewritten(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test sensors skip state writes when their visible value is unchanged."""
+    coordinator = mock_setup_entry.runtime_data
+    coordinator._on_update(None)
+    await hass.async_block_till_done()
+
+    with patch.object(DropletSensor, "async_write_ha_state") as mock_write:
+        # Identical frame: nothing visible changed
+        coordinator._on_update(None)
+        assert mock_write.call_count == 0
+
+        # Flow rate changes: only the affected sensors are written
+        mock_droplet.get_flow_rate.return_value = 4.0
+        coordinator._on_update(None)
+        assert 0 < mock_write.call_count < 25
+
+
+async def test_statistics_sensor_follows_slow_channel(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test statistics sensors only refresh on the slow update channel."""
+    coordinator = mock_setup_entry.runtime_data
+    ent_reg = er.async_get(hass)
+    entity_id = next(
+        e.entity_id
+        for e in ent_reg.entities.values()
+        if e.platform == DOMAIN and "avg_flow_1h" in e.entity_id
+    )
+
+    before = hass.states.get(entity_id).state
+
+    mock_droplet.get_flow_rate.return_value = 4.0
+    coordinator._on_update(None)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == before
+
+    coordinator.async_update_slow_listeners()
+    await hass.async_block_till_done()
+    assert float(hass.states.get(entity_id).state) > 0
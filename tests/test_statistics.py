@@ -0,0 +1,354 @@
+"""Tests for Droplet rolling-window statistics."""
+
+from __future__ import annotations
+
+from array import array
+import sys
+
+import pytest
+
+from custom_components.droplet_plus.statistics import (
+    AggregateTier,
+    FlowRun,
+    RollingWindow,
+    SampleBuffer,
+    SlidingExtremum,
+)
+
+
+class TestRollingWindow:
+    """Tests for RollingWindow."""
+
+    def test_empty(self) -> None:
+        """Test an empty window has no average."""
+        window = RollingWindow(3600)
+        assert len(window) == 0
+        assert window.average is None
+        assert window.total == 0.0
+
+    def test_average(self) -> None:
+        """Test running average of appended samples."""
+        window = RollingWindow(3600)
+        window.append(1000.0, 2.0)
+        window.append(1001.0, 4.0)
+        assert window.average == pytest.approx(3.0)
+        assert window.total == pytest.approx(6.0)
+
+    def test_expire_drops_old_samples(self) -> None:
+        """Test expiry removes samples older than max_age."""
+        window = RollingWindow(3600)
+        window.append(1000.0, 10.0)
+        window.append(4000.0, 2.0)
+        window.append(4500.0, 4.0)
+
+        window.expire(5000.0)  # cutoff 1400
+
+        assert len(window) == 2
+        assert window.average == pytest.approx(3.0)
+        assert list(window) == [(4000.0, 2.0), (4500.0, 4.0)]
+
+    def test_expire_keeps_sample_at_cutoff(self) -> None:
+        """Test a sample exactly at the cutoff is kept."""
+        window = RollingWindow(100)
+        window.append(900.0, 1.0)
+        window.expire(1000.0)
+        assert len(window) == 1
+
+    def test_expire_all_resets_sum(self) -> None:
+        """Test expiring every sample resets the running sum."""
+        window = RollingWindow(10)
+        window.append(0.0, 0.1)
+        window.append(1.0, 0.2)
+        window.expire(100.0)
+        assert len(window) == 0
+        assert window.total == 0.0
+        assert window.average is None
+
+    def test_clear(self) -> None:
+        """Test clearing the window."""
+        window = RollingWindow(10)
+        window.append(0.0, 5.0)
+        window.clear()
+        assert len(window) == 0
+        assert window.average is None
+
+
+class TestSampleBuffer:
+    """Tests for SampleBuffer."""
+
+    def test_empty(self) -> None:
+        """Test an empty buffer has no average."""
+        buffer = SampleBuffer(3600)
+        assert len(buffer) == 0
+        assert buffer.average is None
+        assert list(buffer) == []
+
+    def test_append_and_expire(self) -> None:
+        """Test samples are kept in order and expired from the front."""
+        buffer = SampleBuffer(100, capacity=4)
+        buffer.append(0.0, 1.0)
+        buffer.append(50.0, 2.0)
+        buffer.append(120.0, 3.0)
+
+        assert buffer.expire(130.0) == 1  # cutoff 30
+
+        assert list(buffer) == [(50.0, 2.0), (120.0, 3.0)]
+        assert buffer.average == pytest.approx(2.5)
+
+    def test_wraparound(self) -> None:
+        """Test the ring wraps without growing when slots are freed."""
+        buffer = SampleBuffer(2, capacity=4)
+        for ts in range(10):
+            buffer.append(float(ts), float(ts))
+            buffer.expire(float(ts))
+        assert buffer.capacity == 4
+        assert list(buffer) == [(7.0, 7.0), (8.0, 8.0), (9.0, 9.0)]
+        assert buffer.total == pytest.approx(24.0)
+
+    def test_grow_preserves_order(self) -> None:
+        """Test growing a wrapped ring keeps samples oldest-first."""
+        buffer = SampleBuffer(1000, capacity=4)
+        for ts in range(3):
+            buffer.append(float(ts), 1.0)
+        buffer.expire(1002.0)  # drop ts 0 and 1, head moves forward
+        for ts in range(3, 9):
+            buffer.append(float(ts), 1.0)
+
+        assert buffer.capacity == 8
+        assert [ts for ts, _v in buffer] == [2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+        assert buffer.average == pytest.approx(1.0)
+
+    def test_nbytes_smaller_than_tuples(self) -> None:
+        """Test the columnar layout is far smaller than a list of tuples."""
+        buffer = SampleBuffer(3600)
+        samples = [(float(ts), ts / 10) for ts in range(3600)]
+        for ts, value in samples:
+            buffer.append(ts, value)
+
+        tuple_bytes = sum(
+            sys.getsizeof(sample) + sys.getsizeof(sample[0]) + sys.getsizeof(sample[1])
+            for sample in samples
+        )
+        assert buffer.nbytes * 3 < tuple_bytes
+
+    def test_columns_unroll_ring(self) -> None:
+        """Test columns are returned oldest first across the wrap point."""
+        buffer = SampleBuffer(2, capacity=4)
+        for ts in range(6):
+            buffer.append(float(ts), float(ts) * 10)
+            buffer.expire(float(ts))
+        ts_column, value_column = buffer.columns()
+        assert list(ts_column) == [3.0, 4.0, 5.0]
+        assert list(value_column) == [30.0, 40.0, 50.0]
+
+    def test_load_columns(self) -> None:
+        """Test bulk loading replaces the contents and running sum."""
+        buffer = SampleBuffer(3600, capacity=2)
+        buffer.append(0.0, 99.0)
+        buffer.load_columns(array("d", [1.0, 2.0, 3.0]), array("d", [1.0, 2.0, 6.0]))
+        assert list(buffer) == [(1.0, 1.0), (2.0, 2.0), (3.0, 6.0)]
+        assert buffer.average == pytest.approx(3.0)
+        assert buffer.capacity == 4
+        buffer.append(4.0, 1.0)
+        buffer.append(5.0, 1.0)
+        assert len(buffer) == 5
+
+    def test_clear(self) -> None:
+        """Test clearing releases grown capacity."""
+        buffer = SampleBuffer(3600, capacity=2)
+        for ts in range(10):
+            buffer.append(float(ts), 1.0)
+        buffer.clear()
+        assert len(buffer) == 0
+        assert buffer.average is None
+        assert buffer.capacity < 10
+
+
+class TestSlidingExtremum:
+    """Tests for SlidingExtremum."""
+
+    def test_empty(self) -> None:
+        """Test an empty window has no value."""
+        assert SlidingExtremum(3600).value is None
+
+    def test_maximum(self) -> None:
+        """Test sliding maximum tracks the largest sample."""
+        window = SlidingExtremum(3600)
+        window.append(0.0, 2.0)
+        window.append(1.0, 5.0)
+        window.append(2.0, 3.0)
+        assert window.value == 5.0
+        # Dominated samples are discarded on append
+        assert len(window) == 2
+
+    def test_minimum(self) -> None:
+        """Test sliding minimum tracks the smallest sample."""
+        window = SlidingExtremum(3600, maximum=False)
+        window.append(0.0, 2.0)
+        window.append(1.0, 0.5)
+        window.append(2.0, 1.0)
+        assert window.value == 0.5
+
+    def test_expire_promotes_next_extremum(self) -> None:
+        """Test expiring the current extremum exposes the next one."""
+        window = SlidingExtremum(100)
+        window.append(0.0, 9.0)
+        window.append(50.0, 4.0)
+        window.append(90.0, 6.0)
+
+        window.expire(120.0)  # cutoff 20 drops the 9.0 sample
+
+        assert window.value == 6.0
+
+        window.expire(500.0)
+        assert window.value is None
+
+    def test_matches_brute_force(self) -> None:
+        """Test the sliding extremum agrees with a full rescan."""
+        values = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0, 5.0, 3.0, 5.0]
+        max_window = SlidingExtremum(3)
+        min_window = SlidingExtremum(3, maximum=False)
+        for ts, value in enumerate(values):
+            max_window.append(float(ts), value)
+            min_window.append(float(ts), value)
+            max_window.expire(float(ts))
+            min_window.expire(float(ts))
+            recent = values[max(0, ts - 3) : ts + 1]
+            assert max_window.value == max(recent)
+            assert min_window.value == min(recent)
+
+    def test_clear(self) -> None:
+        """Test clearing the window."""
+        window = SlidingExtremum(10)
+        window.append(0.0, 1.0)
+        window.clear()
+        assert window.value is None
+
+
+class TestAggregateTier:
+    """Tests for AggregateTier."""
+
+    def test_empty(self) -> None:
+        """Test an empty tier has no statistics."""
+        tier = AggregateTier(60, 3600)
+        assert len(tier) == 0
+        assert tier.average is None
+        assert tier.maximum is None
+        assert tier.minimum is None
+
+    def test_samples_merge_into_buckets(self) -> None:
+        """Test samples in the same bucket are merged."""
+        tier = AggregateTier(60, 3600)
+        tier.add_sample(120.0, 1.0)
+        tier.add_sample(150.0, 3.0)
+        tier.add_sample(180.0, 8.0)
+
+        assert list(tier) == [(120.0, 2, 4.0, 1.0, 3.0), (180.0, 1, 8.0, 8.0, 8.0)]
+        assert tier.count == 3
+        assert tier.average == pytest.approx(4.0)
+        assert tier.maximum == 8.0
+        assert tier.minimum == 1.0
+
+    def test_expire_rolls_into_coarser_tier(self) -> None:
+        """Test expired buckets are merged into the next tier."""
+        minutes = AggregateTier(60, 600)
+        quarters = AggregateTier(900, 86400)
+        for ts in range(0, 1200, 10):
+            minutes.add_sample(float(ts), ts / 100)
+
+        expired = minutes.expire(1200.0, quarters)  # cutoff 600
+
+        assert expired == 10
+        assert [start for start, *_ in minutes][0] == 600.0
+        assert list(quarters) == [(0.0, 60, pytest.approx(177.0), 0.0, 5.9)]
+        assert minutes.count + quarters.count == 120
+        assert minutes.total + quarters.total == pytest.approx(
+            sum(t / 100 for t in range(0, 1200, 10))
+        )
+
+    def test_wraparound_and_grow(self) -> None:
+        """Test the bucket ring wraps and grows without losing order."""
+        tier = AggregateTier(1, 5, capacity=4)
+        for ts in range(20):
+            tier.add_sample(float(ts), 1.0)
+            tier.expire(float(ts))
+        assert [start for start, *_ in tier] == [14.0, 15.0, 16.0, 17.0, 18.0, 19.0]
+        assert tier.count == 6
+
+    def test_load_columns(self) -> None:
+        """Test bulk loading restores buckets and running totals."""
+        tier = AggregateTier(60, 3600)
+        tier.load_columns(
+            [
+                array("d", [0.0, 60.0]),
+                array("d", [2.0, 1.0]),
+                array("d", [4.0, 5.0]),
+                array("d", [1.0, 5.0]),
+                array("d", [3.0, 5.0]),
+            ]
+        )
+        assert tier.count == 3
+        assert tier.average == pytest.approx(3.0)
+        assert tier.maximum == 5.0
+
+    def test_memory_bounded(self) -> None:
+        """Test a day of 1 Hz samples stays within the minute bucket count."""
+        tier = AggregateTier(60, 86400)
+        for ts in range(0, 2 * 86400, 1):
+            tier.add_sample(float(ts), 1.0)
+            if ts % 60 == 0:
+                tier.expire(float(ts))
+        assert len(tier) <= 1441
+
+
+class TestFlowRun:
+    """Tests for FlowRun."""
+
+    def test_empty(self) -> None:
+        """Test a run with no samples is inactive."""
+        run = FlowRun()
+        assert not run.active
+        assert run.start is None
+        assert run.duration(1000.0) == 0.0
+        assert run.end is None
+        assert run.min_flow is None
+        assert run.mean_flow is None
+        assert run.max_flow is None
+
+    def test_aggregates(self) -> None:
+        """Test start, end, volume and min/mean/max flow of a run."""
+        run = FlowRun()
+        run.add(1000.0, 2.0, 0.03)
+        run.add(1001.0, 0.5, 0.01)
+        run.add(1002.0, 1.5, 0.02)
+
+        assert run.active
+        assert run.start == 1000.0
+        assert run.end == 1002.0
+        assert run.volume == pytest.approx(0.06)
+        assert run.min_flow == 0.5
+        assert run.mean_flow == pytest.approx(4.0 / 3)
+        assert run.max_flow == 2.0
+        assert run.duration() == 2.0
+
+    def test_duration_up_to_now(self) -> None:
+        """Test the duration extends to now between samples, never before the last one."""
+        run = FlowRun()
+        run.add(1000.0, 1.0, 0.0)
+        run.add(1010.0, 1.0, 0.0)
+        assert run.duration(1600.0) == 600.0
+        assert run.duration(1005.0) == 10.0
+
+    def test_reset(self) -> None:
+        """Test a reset run starts over with the next sample."""
+        run = FlowRun()
+        run.add(1000.0, 0.2, 1.0)
+        run.reset()
+        assert not run.active
+        assert run.volume == 0.0
+
+        run.add(2000.0, 3.0, 0.5)
+        assert run.start == 2000.0
+        assert run.min_flow == 3.0
+        assert run.max_flow == 3.0
+        assert run.volume == 0.5
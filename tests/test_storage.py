@@ -0,0 +1,98 @@
+"""Tests for Droplet storage format."""
+
+from __future__ import annotations
+
+from array import array
+import json
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.droplet_plus.const import STORAGE_KEY
+from custom_components.droplet_plus.storage import (
+    DropletStore,
+    pack_columns,
+    rows_to_columns,
+    unpack_columns,
+)
+from homeassistant.core import HomeAssistant
+
+
+def test_pack_roundtrip() -> None:
+    """Test packed columns unpack to the same values."""
+    ts = array("d", [1000.0, 1001.5, 1003.25])
+    values = array("d", [0.0, 2.5, -1.0])
+
+    header = pack_columns([ts, values])
+
+    assert header["columns"] == 2
+    assert header["count"] == 3
+    assert unpack_columns(header) == [ts, values]
+
+
+def test_pack_empty() -> None:
+    """Test empty buffers round-trip."""
+    header = pack_columns(rows_to_columns([], 3))
+    assert header["count"] == 0
+    assert unpack_columns(header) == [array("d")] * 3
+
+
+def test_unpack_rejects_truncated_payload() -> None:
+    """Test a payload with the wrong length is rejected."""
+    header = pack_columns([array("d", [1.0, 2.0]), array("d", [3.0, 4.0])])
+    header["count"] = 3
+    with pytest.raises(ValueError):
+        unpack_columns(header)
+
+
+def test_rows_to_columns() -> None:
+    """Test rows are transposed into columns."""
+    columns = rows_to_columns([(1.0, 2.0, 3.0), (4.0, 5.0, 6.0)], 3)
+    assert columns == [array("d", [1.0, 4.0]), array("d", [2.0, 5.0]), array("d", [3.0, 6.0])]
+
+
+def test_packed_smaller_than_json_lists() -> None:
+    """Test the packed encoding is smaller than JSON [ts, v] lists."""
+    rows = [(1_772_357_400.123456 + i, i / 7) for i in range(3600)]
+    packed = json.dumps(pack_columns(rows_to_columns(rows, 2)))
+    listed = json.dumps([list(row) for row in rows])
+    assert len(packed) < len(listed)
+
+
+async def test_migrate_from_version_1(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test version 1 list buffers are migrated to packed columns."""
+    key = f"{STORAGE_KEY}_{mock_config_entry.entry_id}"
+    hass_storage[key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": key,
+        "data": {
+            "lifetime_volume": 12.5,
+            "flow_samples": [[1000.0, 1.5], [1001.0, 2.5]],
+            "hourly_consumption": [[0.0, 3.0]],
+            "daily_consumption": [],
+            "hourly_flow_stats": [[0.0, 4.0, 0.5]],
+        },
+    }
+
+    data = await DropletStore(hass, 2, key).async_load()
+
+    assert data is not None
+    assert data["lifetime_volume"] == 12.5
+    assert "flow_samples" not in data
+    buffers = data["buffers"]
+    assert unpack_columns(buffers["flow_samples"]) == [
+        array("d", [1000.0, 1001.0]),
+        array("d", [1.5, 2.5]),
+    ]
+    assert unpack_columns(buffers["hourly_flow_stats"]) == [
+        array("d", [0.0]),
+        array("d", [4.0]),
+        array("d", [0.5]),
+    ]
+    assert buffers["daily_consumption"]["count"] == 0